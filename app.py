@@ -6,7 +6,6 @@ Main application entry point with route definitions.
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
 from datetime import datetime
 import os
-import asyncio
 
 # Import our models and services
 from models import Word, VocabularyData
@@ -716,26 +715,28 @@ def register_routes(app):
                 timeout = int(request.form.get('timeout', 30))
                 max_retries = int(request.form.get('max_retries', 3))
 
-                # Update OpenAI settings
-                if openai_key:
-                    api_config.set_openai_api_key(openai_key)
-                    flash('OpenAI API Key 已更新', 'success')
+                # Save all settings with one config file write
+                with api_config.batch():
+                    # Update OpenAI settings
+                    if openai_key:
+                        api_config.set_openai_api_key(openai_key)
+                        flash('OpenAI API Key 已更新', 'success')
 
-                if openai_model:
-                    api_config.set_openai_model(openai_model)
+                    if openai_model:
+                        api_config.set_openai_model(openai_model)
 
-                # Update Gemini settings
-                if gemini_key:
-                    api_config.set_gemini_api_key(gemini_key)
-                    flash('Gemini API Key 已更新', 'success')
+                    # Update Gemini settings
+                    if gemini_key:
+                        api_config.set_gemini_api_key(gemini_key)
+                        flash('Gemini API Key 已更新', 'success')
 
-                if gemini_model:
-                    api_config.set_gemini_model(gemini_model)
+                    if gemini_model:
+                        api_config.set_gemini_model(gemini_model)
 
-                # Update general settings
-                api_config.set_default_provider(default_provider)
-                api_config.set_timeout(timeout)
-                api_config.set_max_retries(max_retries)
+                    # Update general settings
+                    api_config.set_default_provider(default_provider)
+                    api_config.set_timeout(timeout)
+                    api_config.set_max_retries(max_retries)
 
                 flash('設定已儲存', 'success')
 
@@ -775,6 +776,7 @@ def register_routes(app):
         Test API connection for specified provider.
         """
         from services.ai_service_tester import AIServiceTester
+        from services.loop_thread import run_coro_sync
 
         provider = request.form.get('provider')
         temp_api_key = request.form.get('api_key')  # 支援臨時 API key
@@ -795,9 +797,9 @@ def register_routes(app):
 
                 # Test connection with temp key
                 if provider == "openai":
-                    success, message = asyncio.run(AIServiceTester.test_openai_connection(temp_api_key))
+                    success, message = run_coro_sync(AIServiceTester.test_openai_connection(temp_api_key))
                 else:  # gemini
-                    success, message = asyncio.run(AIServiceTester.test_gemini_connection(temp_api_key))
+                    success, message = run_coro_sync(AIServiceTester.test_gemini_connection(temp_api_key))
             else:
                 # Use saved API key
                 success, message = AIServiceTester.test_connection_sync(provider)
@@ -1131,13 +1133,14 @@ def register_routes(app):
                     flash('目前通行碼錯誤', 'error')
                     return redirect(url_for('settings'))
 
-            # Update passcode
-            api_config.set_passcode(new_passcode)
+            with api_config.batch():
+                # Update passcode
+                api_config.set_passcode(new_passcode)
 
-            # Update other settings
-            api_config.set_auto_logout_enabled(auto_logout_enabled)
-            api_config.set_auto_logout_hours(auto_logout_hours)
-            api_config.set_max_failed_attempts(max_failed_attempts)
+                # Update other settings
+                api_config.set_auto_logout_enabled(auto_logout_enabled)
+                api_config.set_auto_logout_hours(auto_logout_hours)
+                api_config.set_max_failed_attempts(max_failed_attempts)
 
             flash('通行碼設定已更新', 'success')
 
@@ -1209,12 +1212,13 @@ def register_routes(app):
                     return redirect(url_for('server_settings'))
 
                 # Update server settings
-                api_config.set_https_enabled(https_enabled)
-                api_config.set_server_host(host)
-                api_config.set_server_port(port)
-                api_config.set_cert_file(cert_file)
-                api_config.set_key_file(key_file)
-                api_config.set_force_https(force_https)
+                with api_config.batch():
+                    api_config.set_https_enabled(https_enabled)
+                    api_config.set_server_host(host)
+                    api_config.set_server_port(port)
+                    api_config.set_cert_file(cert_file)
+                    api_config.set_key_file(key_file)
+                    api_config.set_force_https(force_https)
 
                 flash('伺服器設定已儲存', 'success')
 
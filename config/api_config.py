@@ -3,11 +3,71 @@ API configuration management for AI services.
 """
 
 import os
-import json
-from typing import Dict, Optional, Tuple
+import copy
+import orjson
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
 from pathlib import Path
-from cryptography.fernet import Fernet
 import base64
+import string
+
+# Project root used to resolve relative certificate paths
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+
+# How long a cached "both certificate files exist" result stays valid (seconds)
+_SSL_EXISTS_TTL = 5.0
+
+# Win32 attribute used to hide the encryption key file
+_FILE_ATTRIBUTE_HIDDEN = 0x2
+
+# AES-GCM nonce size in bytes
+_NONCE_SIZE = 12
+
+# Shortest possible stored value: base64 of nonce + 16-byte GCM tag + 1 byte
+_MIN_ENCRYPTED_LENGTH = 40
+
+# Deletes every character allowed in an API key, so a key body made only
+# of allowed characters translates to an empty string
+_STRIP_KEY_CHARS = str.maketrans('', '', string.ascii_letters + string.digits + '_-')
+
+# Default configuration; loaded files are normalized against this schema
+_DEFAULT_CONFIG = {
+    "openai": {
+        "api_key": "",
+        "model": "gpt-5-nano",
+        "enabled": False
+    },
+    "gemini": {
+        "api_key": "",
+        "model": "gemini-2.5-flash-pro",
+        "enabled": False
+    },
+    "settings": {
+        "default_provider": "openai",
+        "timeout": 30,
+        "max_retries": 3,
+        "max_concurrency": 3
+    },
+    "auth": {
+        "passcode": "",
+        "enabled": False,
+        "auto_logout_enabled": True,
+        "auto_logout_hours": 24,
+        "max_failed_attempts": 5
+    },
+    "server": {
+        "https_enabled": True,
+        "host": "0.0.0.0",
+        "port": 8080,
+        "cert_file": "certs/cert.pem",
+        "key_file": "certs/key.pem",
+        "force_https": False
+    }
+}
+
+# HKDF context used to derive the AES-GCM key from the stored Fernet key
+_AEAD_KEY_INFO = b"ai-vocabulary-review api-config aes-gcm"
 
 
 class APIConfigManager:
@@ -27,106 +87,221 @@ class APIConfigManager:
         # Create encryption key file if it doesn't exist
         self.key_file = self.config_dir / ".encryption_key"
         self._ensure_encryption_key()
+        self._aead = None
+        self._legacy_fernet = None
+        # (section, field) -> (ciphertext, plaintext) of each secret last
+        # read or written, so unchanged secrets skip AES-GCM
+        self._secret_cache: Dict[Tuple[str, str], Tuple[str, str]] = {}
 
         # Load existing configuration
         self.config = self._load_config()
 
+        # Resolved (cert_file, key_file) paths and cached existence checks
+        self._ssl_paths_cache = None
+        self._ssl_exists_cache = None
+        self._ssl_exists_checked_at = 0.0
+
+        # Memoized get_status_summary result, cleared on every save
+        self._status_cache = None
+
+        # Memoized validate_api_keys and get_available_providers results,
+        # cleared on every save
+        self._validation_cache: Optional[Dict[str, bool]] = None
+        self._providers_cache: Optional[Tuple[str, ...]] = None
+
+        # Nesting depth of batch() blocks; saves are deferred while it is
+        # non-zero and written once by flush()
+        self._batch_depth = 0
+        self._dirty = False
+
     def _ensure_encryption_key(self) -> None:
         """Ensure encryption key exists."""
         if not self.key_file.exists():
-            key = Fernet.generate_key()
+            # Same format as Fernet.generate_key(), without importing cryptography
+            key = base64.urlsafe_b64encode(os.urandom(32))
             with open(self.key_file, 'wb') as f:
                 f.write(key)
             # Hide the key file on Windows
             if os.name == 'nt':
-                os.system(f'attrib +h "{self.key_file}"')
+                import ctypes
+                ctypes.windll.kernel32.SetFileAttributesW(str(self.key_file), _FILE_ATTRIBUTE_HIDDEN)
 
     def _get_encryption_key(self) -> bytes:
         """Get the encryption key."""
         with open(self.key_file, 'rb') as f:
             return f.read()
 
+    def _get_cipher(self):
+        """
+        Get the AES-GCM cipher, deriving it from the stored key on first use.
+
+        cryptography is imported here rather than at module level so code
+        that never touches secrets does not pay its import cost.
+        """
+        if self._aead is None:
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+            from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+            hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=_AEAD_KEY_INFO)
+            self._aead = AESGCM(hkdf.derive(self._get_encryption_key()))
+        return self._aead
+
     def _encrypt_value(self, value: str) -> str:
         """Encrypt a value."""
         if not value:
             return ""
 
-        key = self._get_encryption_key()
-        fernet = Fernet(key)
-        encrypted = fernet.encrypt(value.encode())
-        return base64.b64encode(encrypted).decode()
+        nonce = os.urandom(_NONCE_SIZE)
+        encrypted = self._get_cipher().encrypt(nonce, value.encode(), None)
+        return base64.b64encode(nonce + encrypted).decode()
 
     def _decrypt_value(self, encrypted_value: str) -> str:
         """Decrypt a value."""
-        if not encrypted_value:
+        # Anything shorter than base64(nonce + tag + 1 byte) or non-ASCII
+        # cannot be a valid token, so skip the crypto work entirely
+        if (not encrypted_value or len(encrypted_value) < _MIN_ENCRYPTED_LENGTH
+                or not encrypted_value.isascii()):
             return ""
 
         try:
-            key = self._get_encryption_key()
-            fernet = Fernet(key)
             encrypted_bytes = base64.b64decode(encrypted_value.encode())
-            decrypted = fernet.decrypt(encrypted_bytes)
-            return decrypted.decode()
         except Exception:
             return ""
 
+        try:
+            nonce, ciphertext = encrypted_bytes[:_NONCE_SIZE], encrypted_bytes[_NONCE_SIZE:]
+            return self._get_cipher().decrypt(nonce, ciphertext, None).decode()
+        except Exception:
+            return self._decrypt_legacy_value(encrypted_bytes)
+
+    def _decrypt_legacy_value(self, encrypted_bytes: bytes) -> str:
+        """Decrypt a value stored by older versions as a Fernet token."""
+        try:
+            if self._legacy_fernet is None:
+                from cryptography.fernet import Fernet
+                self._legacy_fernet = Fernet(self._get_encryption_key())
+            return self._legacy_fernet.decrypt(encrypted_bytes).decode()
+        except Exception:
+            return ""
+
+    def _get_secret(self, section: str, field: str) -> str:
+        """
+        Get a decrypted secret from the config.
+
+        Args:
+            section: Config section name
+            field: Field holding the encrypted value
+
+        Returns:
+            Decrypted value, or "" if it cannot be decrypted
+        """
+        encrypted_value = self.config[section][field]
+        cached = self._secret_cache.get((section, field))
+        if cached is not None and cached[0] == encrypted_value:
+            return cached[1]
+
+        value = self._decrypt_value(encrypted_value)
+        self._secret_cache[(section, field)] = (encrypted_value, value)
+        return value
+
+    def _set_secret(self, section: str, field: str, value: str) -> None:
+        """
+        Encrypt a secret into the config, keeping the stored value if unchanged.
+
+        Args:
+            section: Config section name
+            field: Field to hold the encrypted value
+            value: Plaintext value
+        """
+        encrypted_value = self.config[section][field]
+        if value and self._secret_cache.get((section, field)) == (encrypted_value, value):
+            return
+
+        encrypted_value = self._encrypt_value(value)
+        self.config[section][field] = encrypted_value
+        self._secret_cache[(section, field)] = (encrypted_value, value)
+
+    @staticmethod
+    def _default_config() -> Dict:
+        """Build a fresh copy of the default configuration."""
+        return copy.deepcopy(_DEFAULT_CONFIG)
+
+    def _normalize_schema(self, config: Dict) -> Dict:
+        """
+        Ensure every expected section and key exists.
+
+        Missing entries are filled from the defaults so getters can index
+        sections directly.
+
+        Args:
+            config: Loaded configuration dictionary
+
+        Returns:
+            The normalized configuration dictionary
+        """
+        for section_name, defaults in self._default_config().items():
+            section = config.get(section_name)
+            if not isinstance(section, dict):
+                config[section_name] = defaults
+                continue
+            for key, value in defaults.items():
+                section.setdefault(key, value)
+        return config
+
     def _load_config(self) -> Dict:
         """Load configuration from file."""
         if not self.config_file.exists():
-            return {
-                "openai": {
-                    "api_key": "",
-                    "model": "gpt-5-nano",
-                    "enabled": False
-                },
-                "gemini": {
-                    "api_key": "",
-                    "model": "gemini-2.5-flash-pro",
-                    "enabled": False
-                },
-                "settings": {
-                    "default_provider": "openai",
-                    "timeout": 30,
-                    "max_retries": 3
-                },
-                "auth": {
-                    "passcode": "",
-                    "enabled": False,
-                    "auto_logout_enabled": True,
-                    "auto_logout_hours": 24,
-                    "max_failed_attempts": 5
-                },
-                "server": {
-                    "https_enabled": True,
-                    "host": "0.0.0.0",
-                    "port": 8080,
-                    "cert_file": "certs/cert.pem",
-                    "key_file": "certs/key.pem",
-                    "force_https": False
-                }
-            }
+            return self._default_config()
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                # Add server config if it doesn't exist (for backwards compatibility)
-                if "server" not in config:
-                    config["server"] = {
-                        "https_enabled": True,
-                        "host": "0.0.0.0",
-                        "port": 8080,
-                        "cert_file": "certs/cert.pem",
-                        "key_file": "certs/key.pem",
-                        "force_https": False
-                    }
-                return config
-        except (json.JSONDecodeError, FileNotFoundError):
-            return self._load_config()  # Return default config
+            with open(self.config_file, 'rb') as f:
+                config = orjson.loads(f.read())
+            # Fill missing sections (e.g. "server" in older files) from defaults
+            return self._normalize_schema(config)
+        except (orjson.JSONDecodeError, FileNotFoundError):
+            return self._default_config()  # Return default config
 
     def _save_config(self) -> None:
-        """Save configuration to file."""
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        """Save configuration to file, deferring the write inside batch()."""
+        self._status_cache = None
+        self._validation_cache = None
+        self._providers_cache = None
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending configuration changes to file."""
+        if not self._dirty:
+            return
+
+        # Write to a sibling temp file and swap it in so a crash never
+        # leaves a truncated config behind
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, self.config_file)
+        self._dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator["APIConfigManager"]:
+        """
+        Group several setters into a single config file write.
+
+        Setters inside the block update the in-memory config as usual; the
+        file is written once when the outermost block exits.
+
+        Yields:
+            This manager
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
 
     def set_openai_api_key(self, api_key: str) -> None:
         """
@@ -135,8 +310,7 @@ class APIConfigManager:
         Args:
             api_key: OpenAI API key
         """
-        encrypted_key = self._encrypt_value(api_key)
-        self.config["openai"]["api_key"] = encrypted_key
+        self._set_secret("openai", "api_key", api_key)
         self.config["openai"]["enabled"] = bool(api_key.strip())
         self._save_config()
 
@@ -147,8 +321,11 @@ class APIConfigManager:
         Returns:
             Decrypted OpenAI API key
         """
-        encrypted_key = self.config.get("openai", {}).get("api_key", "")
-        return self._decrypt_value(encrypted_key)
+        return self._get_secret("openai", "api_key")
+
+    def has_openai_key(self) -> bool:
+        """Check if an OpenAI API key is stored (no decrypt)."""
+        return bool(self.config["openai"]["api_key"])
 
     def set_gemini_api_key(self, api_key: str) -> None:
         """
@@ -157,8 +334,7 @@ class APIConfigManager:
         Args:
             api_key: Gemini API key
         """
-        encrypted_key = self._encrypt_value(api_key)
-        self.config["gemini"]["api_key"] = encrypted_key
+        self._set_secret("gemini", "api_key", api_key)
         self.config["gemini"]["enabled"] = bool(api_key.strip())
         self._save_config()
 
@@ -169,20 +345,23 @@ class APIConfigManager:
         Returns:
             Decrypted Gemini API key
         """
-        encrypted_key = self.config.get("gemini", {}).get("api_key", "")
-        return self._decrypt_value(encrypted_key)
+        return self._get_secret("gemini", "api_key")
+
+    def has_gemini_key(self) -> bool:
+        """Check if a Gemini API key is stored (no decrypt)."""
+        return bool(self.config["gemini"]["api_key"])
 
     def is_openai_enabled(self) -> bool:
         """Check if OpenAI is enabled."""
-        return self.config.get("openai", {}).get("enabled", False)
+        return self.config["openai"]["enabled"]
 
     def is_gemini_enabled(self) -> bool:
         """Check if Gemini is enabled."""
-        return self.config.get("gemini", {}).get("enabled", False)
+        return self.config["gemini"]["enabled"]
 
     def get_default_provider(self) -> str:
         """Get default AI provider."""
-        return self.config.get("settings", {}).get("default_provider", "openai")
+        return self.config["settings"]["default_provider"]
 
     def set_default_provider(self, provider: str) -> None:
         """
@@ -197,7 +376,7 @@ class APIConfigManager:
 
     def get_openai_model(self) -> str:
         """Get OpenAI model name."""
-        return self.config.get("openai", {}).get("model", "gpt-5-nano")
+        return self.config["openai"]["model"]
 
     def set_openai_model(self, model: str) -> None:
         """
@@ -211,7 +390,7 @@ class APIConfigManager:
 
     def get_gemini_model(self) -> str:
         """Get Gemini model name."""
-        return self.config.get("gemini", {}).get("model", "gemini-2.5-flash-pro")
+        return self.config["gemini"]["model"]
 
     def set_gemini_model(self, model: str) -> None:
         """
@@ -225,7 +404,7 @@ class APIConfigManager:
 
     def get_timeout(self) -> int:
         """Get API timeout in seconds."""
-        return self.config.get("settings", {}).get("timeout", 30)
+        return self.config["settings"]["timeout"]
 
     def set_timeout(self, timeout: int) -> None:
         """
@@ -239,7 +418,7 @@ class APIConfigManager:
 
     def get_max_retries(self) -> int:
         """Get maximum number of retries."""
-        return self.config.get("settings", {}).get("max_retries", 3)
+        return self.config["settings"]["max_retries"]
 
     def set_max_retries(self, retries: int) -> None:
         """
@@ -251,48 +430,68 @@ class APIConfigManager:
         self.config["settings"]["max_retries"] = max(0, min(10, retries))
         self._save_config()
 
+    def get_max_concurrency(self) -> int:
+        """Get maximum number of concurrent AI requests."""
+        return self.config["settings"]["max_concurrency"]
+
+    def set_max_concurrency(self, concurrency: int) -> None:
+        """
+        Set maximum number of concurrent AI requests.
+
+        Args:
+            concurrency: Maximum concurrent requests
+        """
+        self.config["settings"]["max_concurrency"] = max(1, min(10, concurrency))
+        self._save_config()
+
     def validate_api_keys(self) -> Dict[str, bool]:
         """
         Validate API keys format.
 
+        The result is memoized until a setter saves the config.
+
         Returns:
             Dictionary with validation results
         """
-        results = {}
+        if self._validation_cache is None:
+            self._validation_cache = {
+                "openai": self._is_valid_openai_key(self.get_openai_api_key()),
+                "gemini": self._is_valid_gemini_key(self.get_gemini_api_key())
+            }
+        return dict(self._validation_cache)
 
-        # Validate OpenAI key
-        openai_key = self.get_openai_api_key()
-        results["openai"] = bool(openai_key and openai_key.startswith("sk-") and len(openai_key) > 20)
+    @staticmethod
+    def _is_valid_openai_key(api_key: str) -> bool:
+        """Check OpenAI API key format."""
+        return len(api_key) > 20 and api_key.startswith("sk-")
 
-        # Validate Gemini key
-        gemini_key = self.get_gemini_api_key()
+    @staticmethod
+    def _is_valid_gemini_key(api_key: str) -> bool:
+        """Check Gemini API key format."""
         # Gemini API keys typically start with "AIzaSy" and are 39 characters long
-        results["gemini"] = bool(
-            gemini_key and
-            gemini_key.startswith("AIzaSy") and
-            len(gemini_key) == 39 and
-            gemini_key.replace("AIzaSy", "").replace("-", "").replace("_", "").isalnum()
+        return bool(
+            len(api_key) == 39 and
+            api_key.startswith("AIzaSy") and
+            not api_key[6:].translate(_STRIP_KEY_CHARS)
         )
 
-        return results
-
     def get_available_providers(self) -> list:
         """
         Get list of available providers with valid API keys.
 
+        The keys are only decrypted and validated again after a setter
+        saves the config.
+
         Returns:
             List of available provider names
         """
-        available = []
-        validation = self.validate_api_keys()
-
-        if validation.get("openai", False):
-            available.append("openai")
+        if self._providers_cache is None:
+            validation = self.validate_api_keys()
+            self._providers_cache = tuple(
+                provider for provider in ("openai", "gemini") if validation[provider]
+            )
 
-        if validation.get("gemini", False):
-            available.append("gemini")
-
-        return available
+        return list(self._providers_cache)
 
     def clear_api_key(self, provider: str) -> None:
         """
@@ -313,8 +512,7 @@ class APIConfigManager:
         Args:
             passcode: Passcode for website access
         """
-        encrypted_passcode = self._encrypt_value(passcode)
-        self.config["auth"]["passcode"] = encrypted_passcode
+        self._set_secret("auth", "passcode", passcode)
         self.config["auth"]["enabled"] = bool(passcode.strip())
         self._save_config()
 
@@ -325,16 +523,20 @@ class APIConfigManager:
         Returns:
             Decrypted passcode
         """
-        encrypted_passcode = self.config.get("auth", {}).get("passcode", "")
-        return self._decrypt_value(encrypted_passcode)
+        return self._get_secret("auth", "passcode")
+
+    @property
+    def passcode_configured(self) -> bool:
+        """Whether a passcode is stored (checks the encrypted field, no decrypt)."""
+        return bool(self.config["auth"]["passcode"])
 
     def is_passcode_configured(self) -> bool:
         """Check if passcode is configured."""
-        return bool(self.get_passcode())
+        return self.passcode_configured
 
     def is_auth_enabled(self) -> bool:
         """Check if authentication is enabled."""
-        return self.config.get("auth", {}).get("enabled", False)
+        return self.config["auth"]["enabled"]
 
     def verify_passcode(self, input_passcode: str) -> bool:
         """
@@ -368,7 +570,7 @@ class APIConfigManager:
 
     def is_auto_logout_enabled(self) -> bool:
         """Check if auto logout is enabled."""
-        return self.config.get("auth", {}).get("auto_logout_enabled", True)
+        return self.config["auth"]["auto_logout_enabled"]
 
     def set_auto_logout_hours(self, hours: int) -> None:
         """
@@ -382,7 +584,7 @@ class APIConfigManager:
 
     def get_auto_logout_hours(self) -> int:
         """Get auto logout hours."""
-        return self.config.get("auth", {}).get("auto_logout_hours", 24)
+        return self.config["auth"]["auto_logout_hours"]
 
     def set_max_failed_attempts(self, attempts: int) -> None:
         """
@@ -396,7 +598,7 @@ class APIConfigManager:
 
     def get_max_failed_attempts(self) -> int:
         """Get maximum failed attempts."""
-        return self.config.get("auth", {}).get("max_failed_attempts", 5)
+        return self.config["auth"]["max_failed_attempts"]
 
     # SSL/HTTPS Configuration Methods
 
@@ -407,14 +609,12 @@ class APIConfigManager:
         Args:
             enabled: Whether HTTPS is enabled
         """
-        if "server" not in self.config:
-            self.config["server"] = {}
         self.config["server"]["https_enabled"] = enabled
         self._save_config()
 
     def is_https_enabled(self) -> bool:
         """Check if HTTPS is enabled."""
-        return self.config.get("server", {}).get("https_enabled", True)
+        return self.config["server"]["https_enabled"]
 
     def set_server_host(self, host: str) -> None:
         """
@@ -423,14 +623,12 @@ class APIConfigManager:
         Args:
             host: Server host (e.g., '0.0.0.0', '127.0.0.1')
         """
-        if "server" not in self.config:
-            self.config["server"] = {}
         self.config["server"]["host"] = host
         self._save_config()
 
     def get_server_host(self) -> str:
         """Get server host."""
-        return self.config.get("server", {}).get("host", "0.0.0.0")
+        return self.config["server"]["host"]
 
     def set_server_port(self, port: int) -> None:
         """
@@ -439,14 +637,12 @@ class APIConfigManager:
         Args:
             port: Server port number
         """
-        if "server" not in self.config:
-            self.config["server"] = {}
         self.config["server"]["port"] = max(1, min(65535, port))
         self._save_config()
 
     def get_server_port(self) -> int:
         """Get server port."""
-        return self.config.get("server", {}).get("port", 8080)
+        return self.config["server"]["port"]
 
     def set_cert_file(self, cert_file: str) -> None:
         """
@@ -455,14 +651,13 @@ class APIConfigManager:
         Args:
             cert_file: Path to SSL certificate file
         """
-        if "server" not in self.config:
-            self.config["server"] = {}
         self.config["server"]["cert_file"] = cert_file
+        self._invalidate_ssl_cache()
         self._save_config()
 
     def get_cert_file(self) -> str:
         """Get SSL certificate file path."""
-        return self.config.get("server", {}).get("cert_file", "certs/cert.pem")
+        return self.config["server"]["cert_file"]
 
     def set_key_file(self, key_file: str) -> None:
         """
@@ -471,14 +666,13 @@ class APIConfigManager:
         Args:
             key_file: Path to SSL private key file
         """
-        if "server" not in self.config:
-            self.config["server"] = {}
         self.config["server"]["key_file"] = key_file
+        self._invalidate_ssl_cache()
         self._save_config()
 
     def get_key_file(self) -> str:
         """Get SSL private key file path."""
-        return self.config.get("server", {}).get("key_file", "certs/key.pem")
+        return self.config["server"]["key_file"]
 
     def set_force_https(self, force: bool) -> None:
         """
@@ -487,14 +681,62 @@ class APIConfigManager:
         Args:
             force: Whether to force HTTPS redirect
         """
-        if "server" not in self.config:
-            self.config["server"] = {}
         self.config["server"]["force_https"] = force
         self._save_config()
 
     def is_force_https(self) -> bool:
         """Check if force HTTPS redirect is enabled."""
-        return self.config.get("server", {}).get("force_https", False)
+        return self.config["server"]["force_https"]
+
+    def _invalidate_ssl_cache(self) -> None:
+        """Drop cached certificate paths and existence checks."""
+        self._ssl_paths_cache = None
+        self._ssl_exists_cache = None
+
+    def _resolve_ssl_paths(self) -> Tuple[str, str]:
+        """
+        Resolve certificate and key paths to absolute paths.
+
+        Returns:
+            Tuple of (cert_file, key_file) absolute paths
+        """
+        if self._ssl_paths_cache is None:
+            cert_file = self.get_cert_file()
+            key_file = self.get_key_file()
+
+            # Convert relative paths to absolute paths
+            if not os.path.isabs(cert_file):
+                cert_file = os.path.join(_PROJECT_ROOT, cert_file)
+            if not os.path.isabs(key_file):
+                key_file = os.path.join(_PROJECT_ROOT, key_file)
+
+            self._ssl_paths_cache = (cert_file, key_file)
+
+        return self._ssl_paths_cache
+
+    def _ssl_files_exist(self) -> Tuple[bool, bool]:
+        """
+        Check whether the certificate and key files exist.
+
+        Only a positive result is cached, for a few seconds, so status
+        polling does not stat both files on every call while a certificate
+        that has just been generated is seen straight away.
+
+        Returns:
+            Tuple of (cert_exists, key_exists)
+        """
+        now = time.monotonic()
+        if self._ssl_exists_cache is not None and now - self._ssl_exists_checked_at <= _SSL_EXISTS_TTL:
+            return self._ssl_exists_cache
+
+        cert_file, key_file = self._resolve_ssl_paths()
+        result = (os.path.exists(cert_file), os.path.exists(key_file))
+        if all(result):
+            self._ssl_exists_cache = result
+            self._ssl_exists_checked_at = now
+        else:
+            self._ssl_exists_cache = None
+        return result
 
     def get_ssl_context(self) -> Optional[Tuple[str, str]]:
         """
@@ -506,17 +748,9 @@ class APIConfigManager:
         if not self.is_https_enabled():
             return None
 
-        cert_file = self.get_cert_file()
-        key_file = self.get_key_file()
-
-        # Convert relative paths to absolute paths
-        if not os.path.isabs(cert_file):
-            cert_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), cert_file)
-        if not os.path.isabs(key_file):
-            key_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), key_file)
-
-        if os.path.exists(cert_file) and os.path.exists(key_file):
-            return (cert_file, key_file)
+        cert_exists, key_exists = self._ssl_files_exist()
+        if cert_exists and key_exists:
+            return self._resolve_ssl_paths()
 
         return None
 
@@ -527,18 +761,12 @@ class APIConfigManager:
         Returns:
             Dictionary with validation results
         """
-        cert_file = self.get_cert_file()
-        key_file = self.get_key_file()
-
-        # Convert relative paths to absolute paths
-        if not os.path.isabs(cert_file):
-            cert_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), cert_file)
-        if not os.path.isabs(key_file):
-            key_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), key_file)
+        cert_file, key_file = self._resolve_ssl_paths()
+        cert_exists, key_exists = self._ssl_files_exist()
 
         return {
-            "cert_exists": os.path.exists(cert_file),
-            "key_exists": os.path.exists(key_file),
+            "cert_exists": cert_exists,
+            "key_exists": key_exists,
             "cert_file": cert_file,
             "key_file": key_file
         }
@@ -553,7 +781,6 @@ class APIConfigManager:
         Returns:
             Configuration dictionary
         """
-        import copy
         config_copy = copy.deepcopy(self.config)
 
         if include_keys:
@@ -563,61 +790,140 @@ class APIConfigManager:
             config_copy["auth"]["passcode"] = self.get_passcode()
         else:
             # Remove keys from export
-            config_copy["openai"]["api_key"] = "***" if self.get_openai_api_key() else ""
-            config_copy["gemini"]["api_key"] = "***" if self.get_gemini_api_key() else ""
-            config_copy["auth"]["passcode"] = "***" if self.get_passcode() else ""
+            config_copy["openai"]["api_key"] = "***" if self.has_openai_key() else ""
+            config_copy["gemini"]["api_key"] = "***" if self.has_gemini_key() else ""
+            config_copy["auth"]["passcode"] = "***" if self.passcode_configured else ""
 
         return config_copy
 
+    def snapshot(self) -> Dict:
+        """
+        Get the general settings in one flat dictionary.
+
+        Lets callers that show several settings read them together instead
+        of calling each getter (and validating the API keys) separately.
+
+        Returns:
+            Dictionary with models, provider and request settings
+        """
+        settings = self.config["settings"]
+        return {
+            "openai_model": self.config["openai"]["model"],
+            "gemini_model": self.config["gemini"]["model"],
+            "default_provider": settings["default_provider"],
+            "available_providers": self.get_available_providers(),
+            "timeout": settings["timeout"],
+            "max_retries": settings["max_retries"]
+        }
+
     def get_status_summary(self) -> Dict:
         """
         Get status summary of API configuration.
 
+        The summary is memoized until the next setter saves the config, so
+        the API keys are not decrypted and validated on every redraw. Only
+        the certificate file checks are refreshed per call. Each call gets
+        its own copy, so callers may modify it.
+
+        Returns:
+            Status summary dictionary
+        """
+        cached = self._status_cache
+        if cached is None:
+            cached = self._status_cache = self._build_status_summary()
+
+        summary = {section: dict(values) for section, values in cached.items()}
+        settings = summary["settings"]
+        settings["available_providers"] = list(settings["available_providers"])
+
+        ssl_validation = self.validate_ssl_certificates()
+        server = summary["server"]
+        server["ssl_configured"] = ssl_validation["cert_exists"] and ssl_validation["key_exists"]
+        server["cert_exists"] = ssl_validation["cert_exists"]
+        server["key_exists"] = ssl_validation["key_exists"]
+
+        return summary
+
+    def _build_status_summary(self) -> Dict:
+        """
+        Build the status summary, leaving the certificate checks unset.
+
         Returns:
             Status summary dictionary
         """
+        openai = self.config["openai"]
+        gemini = self.config["gemini"]
+        settings = self.config["settings"]
+        auth = self.config["auth"]
+        server = self.config["server"]
+
+        # Share the memoized key validation with get_available_providers
         validation = self.validate_api_keys()
+        openai_valid = validation["openai"]
+        gemini_valid = validation["gemini"]
         available_providers = self.get_available_providers()
-        ssl_validation = self.validate_ssl_certificates()
 
         return {
             "openai": {
-                "configured": bool(self.get_openai_api_key()),
-                "valid": validation.get("openai", False),
-                "enabled": self.is_openai_enabled(),
-                "model": self.get_openai_model()
+                "configured": self.has_openai_key(),
+                "valid": openai_valid,
+                "enabled": openai["enabled"],
+                "model": openai["model"]
             },
             "gemini": {
-                "configured": bool(self.get_gemini_api_key()),
-                "valid": validation.get("gemini", False),
-                "enabled": self.is_gemini_enabled(),
-                "model": self.get_gemini_model()
+                "configured": self.has_gemini_key(),
+                "valid": gemini_valid,
+                "enabled": gemini["enabled"],
+                "model": gemini["model"]
             },
             "settings": {
-                "default_provider": self.get_default_provider(),
+                "default_provider": settings["default_provider"],
                 "available_providers": available_providers,
-                "timeout": self.get_timeout(),
-                "max_retries": self.get_max_retries()
+                "timeout": settings["timeout"],
+                "max_retries": settings["max_retries"]
             },
             "auth": {
-                "passcode_configured": self.is_passcode_configured(),
-                "auto_logout_enabled": self.is_auto_logout_enabled(),
-                "auto_logout_hours": self.get_auto_logout_hours(),
-                "max_failed_attempts": self.get_max_failed_attempts()
+                "passcode_configured": self.passcode_configured,
+                "auto_logout_enabled": auth["auto_logout_enabled"],
+                "auto_logout_hours": auth["auto_logout_hours"],
+                "max_failed_attempts": auth["max_failed_attempts"]
             },
             "server": {
-                "https_enabled": self.is_https_enabled(),
-                "host": self.get_server_host(),
-                "port": self.get_server_port(),
-                "cert_file": self.get_cert_file(),
-                "key_file": self.get_key_file(),
-                "force_https": self.is_force_https(),
-                "ssl_configured": ssl_validation["cert_exists"] and ssl_validation["key_exists"],
-                "cert_exists": ssl_validation["cert_exists"],
-                "key_exists": ssl_validation["key_exists"]
+                "https_enabled": server["https_enabled"],
+                "host": server["host"],
+                "port": server["port"],
+                "cert_file": server["cert_file"],
+                "key_file": server["key_file"],
+                "force_https": server["force_https"],
+                "ssl_configured": False,
+                "cert_exists": False,
+                "key_exists": False
             }
         }
 
 
-# Global instance
-api_config = APIConfigManager()
\ No newline at end of file
+class _LazyAPIConfig:
+    """Proxy that creates the global APIConfigManager on first use."""
+
+    def __getattr__(self, name):
+        return getattr(get_api_config(), name)
+
+
+_instance: Optional[APIConfigManager] = None
+
+
+def get_api_config() -> APIConfigManager:
+    """
+    Get the global APIConfigManager, creating it on first call.
+
+    Returns:
+        Shared APIConfigManager instance
+    """
+    global _instance
+    if _instance is None:
+        _instance = APIConfigManager()
+    return _instance
+
+
+# Global instance (constructed lazily so importing this module stays cheap)
+api_config = _LazyAPIConfig()
\ No newline at end of file
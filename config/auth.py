@@ -4,7 +4,7 @@ Provides passcode-based authentication with session management.
 """
 
 from functools import wraps
-from flask import session, request, redirect, url_for, flash, jsonify
+from flask import session, request, redirect, url_for, flash, jsonify, g
 from datetime import datetime, timedelta
 import hashlib
 import time
@@ -22,14 +22,32 @@ class AuthManager:
     SESSION_LAST_ACTIVITY = 'last_activity'
     SESSION_BLOCKED_UNTIL = 'blocked_until'
 
+    # Per-request cache key on flask.g
+    G_AUTH_RESULT = 'auth_result'
+
     @staticmethod
     def is_passcode_required() -> bool:
         """Check if passcode authentication is required."""
-        return api_config.is_passcode_configured()
+        return api_config.passcode_configured
 
     @staticmethod
     def is_authenticated() -> bool:
-        """Check if user is currently authenticated."""
+        """
+        Check if user is currently authenticated.
+
+        The result is memoized on flask.g so every decorator and view in the
+        same request shares a single check.
+        """
+        if AuthManager.G_AUTH_RESULT in g:
+            return g.get(AuthManager.G_AUTH_RESULT)
+
+        result = AuthManager._check_authenticated()
+        setattr(g, AuthManager.G_AUTH_RESULT, result)
+        return result
+
+    @staticmethod
+    def _check_authenticated() -> bool:
+        """Check authentication state against the session."""
         if not AuthManager.is_passcode_required():
             return True  # No passcode configured, always authenticated
 
@@ -46,6 +64,11 @@ class AuthManager:
         session[AuthManager.SESSION_LAST_ACTIVITY] = datetime.now().isoformat()
         return True
 
+    @staticmethod
+    def _clear_cached_result():
+        """Forget the memoized authentication result for this request."""
+        g.pop(AuthManager.G_AUTH_RESULT, None)
+
     @staticmethod
     def _is_session_expired() -> bool:
         """Check if current session has expired."""
@@ -138,6 +161,7 @@ class AuthManager:
         # Clear failed attempts
         session.pop(AuthManager.SESSION_FAILED_ATTEMPTS, None)
         session.pop(AuthManager.SESSION_BLOCKED_UNTIL, None)
+        AuthManager._clear_cached_result()
 
     @staticmethod
     def _record_failed_attempt():
@@ -160,6 +184,7 @@ class AuthManager:
         session.pop(AuthManager.SESSION_LAST_ACTIVITY, None)
         session.pop(AuthManager.SESSION_FAILED_ATTEMPTS, None)
         session.pop(AuthManager.SESSION_BLOCKED_UNTIL, None)
+        AuthManager._clear_cached_result()
 
     @staticmethod
     def get_session_info() -> dict:
@@ -81,10 +81,12 @@ def setup_general_settings():
     """Setup general settings."""
     print("\n=== 一般設定 ===")
 
+    snap = api_config.snapshot()
+
     # Default provider
-    available_providers = api_config.get_available_providers()
+    available_providers = snap["available_providers"]
     if len(available_providers) > 1:
-        print(f"目前預設提供商: {api_config.get_default_provider()}")
+        print(f"目前預設提供商: {snap['default_provider']}")
         print(f"可用提供商: {', '.join(available_providers)}")
 
         provider = input("選擇預設提供商 (直接按 Enter 保持不變): ").strip().lower()
@@ -93,7 +95,7 @@ def setup_general_settings():
             print(f"✅ 預設提供商設定為: {provider}")
 
     # Timeout
-    print(f"\n目前 API 超時時間: {api_config.get_timeout()} 秒")
+    print(f"\n目前 API 超時時間: {snap['timeout']} 秒")
     timeout_input = input("設定超時時間 (5-120秒，直接按 Enter 保持不變): ").strip()
     if timeout_input.isdigit():
         timeout = int(timeout_input)
@@ -101,7 +103,7 @@ def setup_general_settings():
         print(f"✅ 超時時間設定為: {timeout} 秒")
 
     # Max retries
-    print(f"\n目前最大重試次數: {api_config.get_max_retries()}")
+    print(f"\n目前最大重試次數: {snap['max_retries']}")
     retries_input = input("設定最大重試次數 (0-10次，直接按 Enter 保持不變): ").strip()
     if retries_input.isdigit():
         retries = int(retries_input)
@@ -23,13 +23,14 @@ def main():
         print(f"  模型: {provider_status['model']}")
 
     # Show available providers
-    available = api_config.get_available_providers()
+    settings = status["settings"]
+    available = settings["available_providers"]
     print(f"\n🚀 可用的 AI 提供商: {', '.join(available) if available else '無'}")
 
     if available:
-        print(f"📌 預設提供商: {api_config.get_default_provider()}")
-        print(f"⏱️  超時時間: {api_config.get_timeout()} 秒")
-        print(f"🔄 最大重試: {api_config.get_max_retries()} 次")
+        print(f"📌 預設提供商: {settings['default_provider']}")
+        print(f"⏱️  超時時間: {settings['timeout']} 秒")
+        print(f"🔄 最大重試: {settings['max_retries']} 次")
     else:
         print("\n⚠️  尚未設定任何 API Key")
         print("請執行以下命令來設定:")
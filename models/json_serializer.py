@@ -3,11 +3,22 @@ JSON serialization utilities for vocabulary data.
 """
 
 import json
+import orjson
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, BinaryIO
 from models.vocabulary import Word, VocabularyData
 
 
+def _dump_option(pretty: bool) -> int:
+    """Get the orjson option flags for compact or indented output."""
+    return orjson.OPT_INDENT_2 if pretty else 0
+
+
+def _join_word_bytes(words: List[Word]) -> bytes:
+    """Encode words as a compact JSON array from their cached encodings."""
+    return b'[' + b','.join([word.to_json_bytes() for word in words]) + b']'
+
+
 class VocabularyJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder for vocabulary data with datetime handling."""
 
@@ -22,17 +33,21 @@ class VocabularyJSONSerializer:
     """JSON serialization and deserialization for vocabulary data."""
 
     @staticmethod
-    def serialize_word(word: Word) -> str:
+    def serialize_word(word: Word, pretty: bool = False) -> str:
         """
         Serialize a Word object to JSON string.
 
         Args:
             word: Word object to serialize
+            pretty: Indent the output for human reading (e.g. exports)
 
         Returns:
             JSON string representation of the word
         """
-        return json.dumps(word.to_dict(), cls=VocabularyJSONEncoder, ensure_ascii=False, indent=2)
+        if not pretty:
+            # Reuse the encoding the word caches until it is next updated
+            return word.to_json_bytes().decode('utf-8')
+        return orjson.dumps(word._as_dict(), option=_dump_option(pretty)).decode('utf-8')
 
     @staticmethod
     def deserialize_word(json_str: str) -> Word:
@@ -50,7 +65,7 @@ class VocabularyJSONSerializer:
             ValueError: If required fields are missing
         """
         try:
-            data = json.loads(json_str)
+            data = orjson.loads(json_str)
             return Word.from_dict(data)
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"Invalid JSON format: {e.msg}", e.doc, e.pos)
@@ -58,17 +73,44 @@ class VocabularyJSONSerializer:
             raise ValueError(f"Error creating Word from JSON data: {str(e)}")
 
     @staticmethod
-    def serialize_vocabulary_data(vocab_data: VocabularyData) -> str:
+    def serialize_vocabulary_data(vocab_data: VocabularyData, pretty: bool = False) -> str:
         """
         Serialize VocabularyData object to JSON string.
 
         Args:
             vocab_data: VocabularyData object to serialize
+            pretty: Indent the output for human reading (e.g. exports)
 
         Returns:
             JSON string representation of the vocabulary data
         """
-        return json.dumps(vocab_data.to_dict(), cls=VocabularyJSONEncoder, ensure_ascii=False, indent=2)
+        if not pretty:
+            data = (b'{"vocabulary":' + _join_word_bytes(vocab_data.vocabulary)
+                    + b',"metadata":' + orjson.dumps(vocab_data.metadata) + b'}')
+            return data.decode('utf-8')
+        return orjson.dumps(vocab_data.to_dict(), option=_dump_option(pretty)).decode('utf-8')
+
+    @staticmethod
+    def dump_vocabulary_data(vocab_data: VocabularyData, fp: BinaryIO) -> None:
+        """
+        Stream VocabularyData to a binary file as compact JSON.
+
+        Each word is written separately using its cached encoding, so the
+        full document is never held in memory as one string and unchanged
+        words are not re-encoded.
+
+        Args:
+            vocab_data: VocabularyData object to write
+            fp: File object opened in binary write mode
+        """
+        fp.write(b'{"vocabulary":[')
+        for i, word in enumerate(vocab_data.vocabulary):
+            if i:
+                fp.write(b',')
+            fp.write(word.to_json_bytes())
+        fp.write(b'],"metadata":')
+        fp.write(orjson.dumps(vocab_data.metadata))
+        fp.write(b'}')
 
     @staticmethod
     def deserialize_vocabulary_data(json_str: str) -> VocabularyData:
@@ -86,26 +128,30 @@ class VocabularyJSONSerializer:
             ValueError: If data structure is invalid
         """
         try:
-            data = json.loads(json_str)
+            data = VocabularyJSONSerializer.validate_and_parse(json_str, "vocabulary")
             return VocabularyData.from_dict(data)
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Invalid JSON format: {e.msg}", e.doc, e.pos)
+        except json.JSONDecodeError:
+            # validate_and_parse has already added the "Invalid JSON format" prefix
+            raise
         except Exception as e:
             raise ValueError(f"Error creating VocabularyData from JSON data: {str(e)}")
 
     @staticmethod
-    def serialize_word_list(words: List[Word]) -> str:
+    def serialize_word_list(words: List[Word], pretty: bool = False) -> str:
         """
         Serialize a list of Word objects to JSON string.
 
         Args:
             words: List of Word objects to serialize
+            pretty: Indent the output for human reading (e.g. exports)
 
         Returns:
             JSON string representation of the word list
         """
-        word_dicts = [word.to_dict() for word in words]
-        return json.dumps(word_dicts, cls=VocabularyJSONEncoder, ensure_ascii=False, indent=2)
+        if not pretty:
+            return _join_word_bytes(words).decode('utf-8')
+        word_dicts = [word._as_dict() for word in words]
+        return orjson.dumps(word_dicts, option=_dump_option(pretty)).decode('utf-8')
 
     @staticmethod
     def deserialize_word_list(json_str: str) -> List[Word]:
@@ -123,19 +169,11 @@ class VocabularyJSONSerializer:
             ValueError: If data structure is invalid
         """
         try:
-            data = json.loads(json_str)
-            if not isinstance(data, list):
-                raise ValueError("JSON data must be a list for word list deserialization")
-
-            words = []
-            for word_data in data:
-                if not isinstance(word_data, dict):
-                    raise ValueError("Each item in the list must be a dictionary")
-                words.append(Word.from_dict(word_data))
-
-            return words
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Invalid JSON format: {e.msg}", e.doc, e.pos)
+            data = VocabularyJSONSerializer.validate_and_parse(json_str, "word_list")
+            return [Word.from_dict(word_data) for word_data in data]
+        except json.JSONDecodeError:
+            # validate_and_parse has already added the "Invalid JSON format" prefix
+            raise
         except Exception as e:
             raise ValueError(f"Error creating word list from JSON data: {str(e)}")
 
@@ -183,12 +221,31 @@ class VocabularyJSONSerializer:
         Returns:
             True if structure is valid
 
+        Raises:
+            json.JSONDecodeError: If JSON is invalid
+            ValueError: If structure is invalid
+        """
+        VocabularyJSONSerializer.validate_and_parse(json_str, expected_type)
+        return True
+
+    @staticmethod
+    def validate_and_parse(json_str: str, expected_type: str = "vocabulary") -> Any:
+        """
+        Parse JSON and validate its structure in a single pass.
+
+        Args:
+            json_str: JSON string to parse
+            expected_type: Expected data type ("vocabulary", "word", or "word_list")
+
+        Returns:
+            The parsed dictionary or list
+
         Raises:
             json.JSONDecodeError: If JSON is invalid
             ValueError: If structure is invalid
         """
         try:
-            data = json.loads(json_str)
+            data = orjson.loads(json_str)
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"Invalid JSON format: {e.msg}", e.doc, e.pos)
 
@@ -218,4 +275,4 @@ class VocabularyJSONSerializer:
         else:
             raise ValueError(f"Unknown expected_type: {expected_type}")
 
-        return True
\ No newline at end of file
+        return data
\ No newline at end of file
@@ -4,14 +4,129 @@ Core vocabulary data model for the English vocabulary notebook application.
 
 from datetime import datetime
 from typing import List, Optional, Dict, Any
+import os
+import sys
+import time
 import uuid
 
+import orjson
+
+# Bound once for the per-word date parsing in Word.from_dict. The C
+# implementation is already faster than slicing the fixed-width string and
+# calling int() on each part, so no handwritten parser is used.
+_fromiso = datetime.fromisoformat
+
+
+def _uuid7(ms: int, rand: bytes) -> str:
+    """
+    Build a time-ordered version 7 UUID string.
+    
+    Args:
+        ms: Unix timestamp in milliseconds
+        rand: 10 random bytes
+        
+    Returns:
+        UUID string whose leading bits sort by creation time
+    """
+    bits = int.from_bytes(rand, "big")
+    value = (
+        (ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | (bits >> 68) << 64
+        | 0x2 << 62
+        | (bits & 0x3FFFFFFFFFFFFFFF)
+    )
+    return str(uuid.UUID(int=value))
+
+
+def _clean(value: str) -> str:
+    """
+    Strip surrounding whitespace, skipping the call for already-clean values.
+    
+    Args:
+        value: Raw string field
+        
+    Returns:
+        The value without leading or trailing whitespace
+    """
+    if not value or not (value[0].isspace() or value[-1].isspace()):
+        return value
+    return value.strip()
+
+
+def _intern_all(values: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Intern the strings of a loaded synonym or antonym list.
+    
+    The same short words recur across many entries, so interning lets a
+    loaded vocabulary keep one copy of each.
+    
+    Args:
+        values: Parsed list of strings
+        
+    Returns:
+        List holding the interned strings (non-string items unchanged)
+    """
+    if not values:
+        return values
+    return [sys.intern(value) if type(value) is str else value for value in values]
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    """
+    Parse a stored ISO date, returning None if it is missing or invalid.
+    
+    Args:
+        value: Stored date value
+        
+    Returns:
+        Parsed datetime, or None
+    """
+    try:
+        return _fromiso(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _validate(word: str, chinese_meaning: str) -> List[str]:
+    """
+    Validate raw word fields without constructing a Word.
+    
+    Args:
+        word: The stripped English word
+        chinese_meaning: The stripped Chinese meaning
+        
+    Returns:
+        List of validation error messages
+    """
+    errors = []
+    
+    if not word:
+        errors.append("英文單字不能為空")
+    elif len(word) > 100:
+        errors.append("英文單字長度不能超過100個字符")
+    
+    if not chinese_meaning:
+        errors.append("中文解釋不能為空")
+    elif len(chinese_meaning) > 200:
+        errors.append("中文解釋長度不能超過200個字符")
+    
+    return errors
+
 
 class Word:
     """
     Core Word model representing a vocabulary entry.
     """
     
+    # Public data fields, in serialization order
+    FIELDS = (
+        "id", "word", "chinese_meaning", "english_meaning", "phonetic",
+        "example_sentence", "synonyms", "antonyms", "created_date", "updated_date"
+    )
+    
+    __slots__ = FIELDS + ("_dict_cache", "_cached_bytes", "_search_text")
+    
     def __init__(
         self,
         word: str,
@@ -36,16 +151,18 @@ class Word:
             antonyms: List of antonymous words
             word_id: Unique identifier (auto-generated if not provided)
         """
-        self.id = word_id or str(uuid.uuid4())
-        self.word = word.strip()
-        self.chinese_meaning = chinese_meaning.strip()
-        self.english_meaning = english_meaning.strip()
-        self.phonetic = phonetic.strip()
-        self.example_sentence = example_sentence.strip()
+        self.id = word_id if word_id else _uuid7(time.time_ns() // 1_000_000, os.urandom(10))
+        self.word = _clean(word)
+        self.chinese_meaning = _clean(chinese_meaning)
+        self.english_meaning = _clean(english_meaning)
+        self.phonetic = _clean(phonetic)
+        self.example_sentence = _clean(example_sentence)
         self.synonyms = synonyms or []
         self.antonyms = antonyms or []
-        self.created_date = datetime.now()
-        self.updated_date = datetime.now()
+        self.created_date = self.updated_date = datetime.now()
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        self._cached_bytes: Optional[bytes] = None
+        self._search_text: Optional[str] = None
     
     def validate(self) -> List[str]:
         """
@@ -54,29 +171,64 @@ class Word:
         Returns:
             List of validation error messages
         """
-        errors = []
+        return _validate(self.word, self.chinese_meaning)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert Word instance to dictionary for JSON serialization.
         
-        if not self.word:
-            errors.append("英文單字不能為空")
+        Returns:
+            New dictionary representation of the word, safe to modify
+        """
+        return dict(self._as_dict())
+    
+    def _as_dict(self) -> Dict[str, Any]:
+        """
+        Get the cached dictionary representation of the word.
         
-        if not self.chinese_meaning:
-            errors.append("中文解釋不能為空")
+        The dictionary is built once and kept in sync by update_fields, so
+        repeated saves never rebuild it. It is shared with the word and only
+        handed to code that encodes it straight away; callers must not
+        modify it.
         
-        if len(self.word) > 100:
-            errors.append("英文單字長度不能超過100個字符")
+        Returns:
+            Cached dictionary representation of the word
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Get the compact JSON encoding of the word.
         
-        if len(self.chinese_meaning) > 200:
-            errors.append("中文解釋長度不能超過200個字符")
+        Like the dictionary form, the encoding is cached until the word is changed through
+        update_fields, so unchanged words are not re-encoded on every save.
         
-        return errors
+        Returns:
+            UTF-8 encoded JSON object for the word
+        """
+        if self._cached_bytes is None:
+            self._cached_bytes = orjson.dumps(self._as_dict())
+        return self._cached_bytes
     
-    def to_dict(self) -> Dict[str, Any]:
+    def search_text(self) -> str:
         """
-        Convert Word instance to dictionary for JSON serialization.
+        Get the lowercased searchable text of the word.
+        
+        The word, Chinese meaning and English meaning are joined with NUL
+        separators, so a substring test against the result matches exactly
+        when it matches one of the fields. Cached until update_fields.
         
         Returns:
-            Dictionary representation of the word
+            Lowercased search text
         """
+        if self._search_text is None:
+            self._search_text = f"{self.word}\x00{self.chinese_meaning}\x00{self.english_meaning}".lower()
+        return self._search_text
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the dictionary representation of the word."""
         return {
             "id": self.id,
             "word": self.word,
@@ -101,32 +253,51 @@ class Word:
         Returns:
             Word instance
         """
-        word = cls(
-            word=data.get("word", ""),
-            chinese_meaning=data.get("chinese_meaning", ""),
-            english_meaning=data.get("english_meaning", ""),
-            phonetic=data.get("phonetic", ""),
-            example_sentence=data.get("example_sentence", ""),
-            synonyms=data.get("synonyms", []),
-            antonyms=data.get("antonyms", []),
-            word_id=data.get("id")
-        )
-        
-        # Parse dates if available
-        if "created_date" in data:
-            try:
-                word.created_date = datetime.fromisoformat(data["created_date"])
-            except (ValueError, TypeError):
-                pass
-        
-        if "updated_date" in data:
-            try:
-                word.updated_date = datetime.fromisoformat(data["updated_date"])
-            except (ValueError, TypeError):
-                pass
+        # Fill the slots directly rather than going through __init__, which
+        # would stamp datetime.now() only for the dates to be overwritten;
+        # keep this in step with __init__
+        word = cls.__new__(cls)
+        word_id = data.get("id")
+        word.id = word_id if word_id else _uuid7(time.time_ns() // 1_000_000, os.urandom(10))
+        word.word = _clean(data.get("word", ""))
+        word.chinese_meaning = _clean(data.get("chinese_meaning", ""))
+        word.english_meaning = _clean(data.get("english_meaning", ""))
+        word.phonetic = _clean(data.get("phonetic", ""))
+        word.example_sentence = _clean(data.get("example_sentence", ""))
+        word.synonyms = _intern_all(data.get("synonyms")) or []
+        word.antonyms = _intern_all(data.get("antonyms")) or []
+        word._dict_cache = None
+        word._cached_bytes = None
+        word._search_text = None
+        
+        # Parse dates if available, falling back to the current time
+        created_date = _parse_date(data.get("created_date"))
+        updated_date = _parse_date(data.get("updated_date"))
+        if created_date is None or updated_date is None:
+            now = datetime.now()
+            created_date = created_date or now
+            updated_date = updated_date or now
+        word.created_date = created_date
+        word.updated_date = updated_date
         
         return word
     
+    @staticmethod
+    def bulk_new_ids(count: int) -> List[str]:
+        """
+        Generate several time-ordered (version 7) word IDs from one clock
+        read and one urandom call.
+        
+        Args:
+            count: Number of IDs to generate
+            
+        Returns:
+            List of UUID strings
+        """
+        ms = time.time_ns() // 1_000_000
+        random_bytes = os.urandom(10 * count)
+        return [_uuid7(ms, random_bytes[i:i + 10]) for i in range(0, 10 * count, 10)]
+    
     def update_fields(self, **kwargs) -> None:
         """
         Update word fields and set updated_date.
@@ -134,11 +305,19 @@ class Word:
         Args:
             **kwargs: Fields to update
         """
+        # Patch the cached dictionary in place rather than rebuilding it
+        cached = self._dict_cache
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in Word.FIELDS:
                 setattr(self, key, value)
+                if cached is not None:
+                    cached[key] = value.isoformat() if isinstance(value, datetime) else value
         
         self.updated_date = datetime.now()
+        if cached is not None:
+            cached["updated_date"] = self.updated_date.isoformat()
+        self._cached_bytes = None
+        self._search_text = None
     
     def __str__(self) -> str:
         return f"{self.word} - {self.chinese_meaning}"
@@ -152,16 +331,144 @@ class VocabularyData:
     Container class for vocabulary data with metadata.
     """
     
+    __slots__ = ("_vocabulary", "metadata", "_by_id", "_duplicate_ids", "_word_keys", "_word_counts")
+    
     def __init__(self):
-        self.vocabulary: List[Word] = []
+        self._vocabulary: List[Word] = []
         self.metadata = {
             "total_words": 0,
             "last_updated": datetime.now().isoformat()
         }
+        # Lookup indexes, built on first use and reset to None whenever they
+        # may no longer match the list. _by_id maps each ID to its first entry.
+        self._by_id: Optional[Dict[str, Word]] = None
+        self._duplicate_ids = False
+        # Lowercased word text by id() of each stored Word, and how many
+        # entries share each text
+        self._word_keys: Optional[Dict[int, str]] = None
+        self._word_counts: Optional[Dict[str, int]] = None
+    
+    @property
+    def vocabulary(self) -> List[Word]:
+        """
+        Get the list of stored words.
+        
+        Change it through the methods of this class, or assign a new list;
+        changing the list in place bypasses the lookup indexes.
+        """
+        return self._vocabulary
+    
+    @vocabulary.setter
+    def vocabulary(self, words: List[Word]) -> None:
+        self._vocabulary = words
+        self._invalidate_indexes()
+    
+    def _invalidate_indexes(self) -> None:
+        """Drop both lookup indexes so they are rebuilt on next use."""
+        self._by_id = None
+        self._duplicate_ids = False
+        self._word_keys = None
+        self._word_counts = None
+    
+    def _index(self) -> Dict[str, Word]:
+        """
+        Get the ID index, building it if needed.
+        
+        Returns:
+            Dictionary mapping word IDs to the first Word with that ID
+        """
+        if self._by_id is None:
+            index = {}
+            for word in self._vocabulary:
+                index.setdefault(word.id, word)
+            self._by_id = index
+            self._duplicate_ids = len(index) != len(self._vocabulary)
+        return self._by_id
+    
+    def _index_word(self, word: Word) -> None:
+        """Add a newly appended word to the ID index."""
+        if self._by_id.setdefault(word.id, word) is not word:
+            self._duplicate_ids = True
+    
+    def _text_index(self) -> Dict[str, int]:
+        """
+        Get the lowercased word counts, building them if needed.
+        
+        Returns:
+            Dictionary mapping lowercased words to their number of entries
+        """
+        if self._word_counts is None:
+            self._word_keys = {}
+            self._word_counts = {}
+            for word in self._vocabulary:
+                self._count_text(word)
+        return self._word_counts
+    
+    def _count_text(self, word: Word) -> None:
+        """Add a word's text to the text index."""
+        key = word.word.lower()
+        self._word_keys[id(word)] = key
+        self._word_counts[key] = self._word_counts.get(key, 0) + 1
+    
+    def _uncount_text(self, word: Word) -> None:
+        """Remove the text indexed for a stored word from the text index."""
+        key = self._word_keys.pop(id(word), None)
+        if key is None:
+            return
+        remaining = self._word_counts[key] - 1
+        if remaining:
+            self._word_counts[key] = remaining
+        else:
+            del self._word_counts[key]
+    
+    def has_word(self, text: str) -> bool:
+        """
+        Check whether a word with the given text exists, ignoring case.
+        
+        Args:
+            text: English word to look for
+            
+        Returns:
+            True if an entry has the same word
+        """
+        return text.lower() in self._text_index()
+    
+    def reindex_word(self, word: Word) -> None:
+        """
+        Refresh the indexes after a stored word was changed in place.
+        
+        Args:
+            word: Word already in the vocabulary
+        """
+        # A changed ID cannot be patched in place: the old key is unknown
+        if self._by_id is not None and self._by_id.get(word.id) is not word:
+            self._by_id = None
+        self._text_index()
+        self._uncount_text(word)
+        self._count_text(word)
     
     def add_word(self, word: Word) -> None:
         """Add a word to the vocabulary list."""
-        self.vocabulary.append(word)
+        self._index()
+        self._text_index()
+        self._vocabulary.append(word)
+        self._index_word(word)
+        self._count_text(word)
+        self.update_metadata()
+    
+    def bulk_add(self, words: List[Word]) -> None:
+        """
+        Add several words to the vocabulary list, updating metadata once.
+        
+        Args:
+            words: Word instances to append, in order
+        """
+        self._index()
+        self._text_index()
+        self._vocabulary.extend(words)
+        for word in words:
+            self._index_word(word)
+            self._count_text(word)
         self.update_metadata()
     
     def remove_word(self, word_id: str) -> bool:
@@ -171,19 +478,43 @@ class VocabularyData:
         Returns:
             True if word was removed, False if not found
         """
-        for i, word in enumerate(self.vocabulary):
-            if word.id == word_id:
-                del self.vocabulary[i]
-                self.update_metadata()
-                return True
-        return False
+        self._text_index()
+        index = self._index()
+        word = index.get(word_id)
+        if word is None:
+            return False
+        self._vocabulary.remove(word)
+        if self._duplicate_ids:
+            # A later entry may share the ID; let the next lookup find it
+            self._by_id = None
+        else:
+            del index[word_id]
+        self._uncount_text(word)
+        self.update_metadata()
+        return True
+    
+    def replace_word(self, word: Word) -> bool:
+        """
+        Replace the word with the same ID, keeping its position.
+        
+        Returns:
+            True if word was replaced, False if not found
+        """
+        index = self._index()
+        existing = index.get(word.id)
+        if existing is None:
+            return False
+        self._text_index()
+        self._vocabulary[self._vocabulary.index(existing)] = word
+        index[word.id] = word
+        self._uncount_text(existing)
+        self._count_text(word)
+        self.update_metadata()
+        return True
     
     def find_word_by_id(self, word_id: str) -> Optional[Word]:
         """Find a word by its ID."""
-        for word in self.vocabulary:
-            if word.id == word_id:
-                return word
-        return None
+        return self._index().get(word_id)
     
     def update_metadata(self) -> None:
         """Update metadata information."""
@@ -202,12 +533,18 @@ class VocabularyData:
         """Create VocabularyData from dictionary."""
         vocab_data = cls()
         
-        # Load vocabulary words
-        for word_data in data.get("vocabulary", []):
-            word = Word.from_dict(word_data)
-            vocab_data.vocabulary.append(word)
+        # Load vocabulary words, generating IDs for entries without one in a single batch
+        words_data = data.get("vocabulary", [])
+        missing_ids = sum(1 for word_data in words_data if not word_data.get("id"))
+        new_ids = iter(Word.bulk_new_ids(missing_ids))
+        words = []
+        for word_data in words_data:
+            if not word_data.get("id"):
+                word_data = {**word_data, "id": next(new_ids)}
+            words.append(Word.from_dict(word_data))
+        vocab_data.vocabulary = words
         
-        # Load metadata
-        vocab_data.metadata = data.get("metadata", vocab_data.metadata)
+        # Load metadata into a dict of our own, since update_metadata writes to it
+        vocab_data.metadata = dict(data.get("metadata", vocab_data.metadata))
         
         return vocab_data
\ No newline at end of file
@@ -6,25 +6,14 @@ Generates self-signed SSL certificates for development/testing purposes.
 
 import os
 import sys
-import subprocess
 import argparse
+from datetime import datetime, timedelta
 from pathlib import Path
 
-
-def check_openssl():
-    """Check if OpenSSL is available."""
-    try:
-        result = subprocess.run(['openssl', 'version'],
-                              capture_output=True, text=True, check=True)
-        print(f"✓ OpenSSL 已找到: {result.stdout.strip()}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ 錯誤: 找不到 OpenSSL")
-        print("請安裝 OpenSSL:")
-        print("  Windows: https://slproweb.com/products/Win32OpenSSL.html")
-        print("  Linux: sudo apt-get install openssl")
-        print("  macOS: brew install openssl")
-        return False
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
 
 
 def generate_ssl_certificate(cert_dir, domain="localhost", days=365, key_size=2048):
@@ -44,7 +33,14 @@ def generate_ssl_certificate(cert_dir, domain="localhost", days=365, key_size=20
     key_file = cert_dir / "key.pem"
 
     # Certificate subject
-    subject = f"/C=TW/ST=Taiwan/L=Taipei/O=Development/OU=IT/CN={domain}"
+    subject = x509.Name([
+        x509.NameAttribute(NameOID.COUNTRY_NAME, "TW"),
+        x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "Taiwan"),
+        x509.NameAttribute(NameOID.LOCALITY_NAME, "Taipei"),
+        x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Development"),
+        x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, "IT"),
+        x509.NameAttribute(NameOID.COMMON_NAME, domain),
+    ])
 
     print(f"🔧 正在生成 SSL 憑證...")
     print(f"📁 憑證目錄: {cert_dir.absolute()}")
@@ -53,17 +49,26 @@ def generate_ssl_certificate(cert_dir, domain="localhost", days=365, key_size=20
     print(f"🔑 金鑰大小: {key_size} bits")
 
     try:
-        # Generate private key and certificate in one command
-        cmd = [
-            'openssl', 'req', '-x509', '-newkey', f'rsa:{key_size}',
-            '-keyout', str(key_file),
-            '-out', str(cert_file),
-            '-days', str(days),
-            '-nodes',  # No passphrase
-            '-subj', subject
-        ]
-
-        subprocess.run(cmd, check=True, capture_output=True)
+        # Generate private key and self-signed certificate in-process
+        key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+        now = datetime.utcnow()
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(subject)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=days))
+            .sign(key, hashes.SHA256())
+        )
+
+        key_file.write_bytes(key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()  # No passphrase
+        ))
+        cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
 
         print("✅ SSL 憑證生成成功!")
         print(f"📜 憑證檔案: {cert_file}")
@@ -77,19 +82,9 @@ def generate_ssl_certificate(cert_dir, domain="localhost", days=365, key_size=20
 
         # Display certificate info
         print("\n📋 憑證資訊:")
-        try:
-            result = subprocess.run(['openssl', 'x509', '-in', str(cert_file),
-                                   '-text', '-noout'],
-                                  capture_output=True, text=True, check=True)
-
-            # Extract relevant info
-            lines = result.stdout.split('\n')
-            for line in lines:
-                if 'Not Before:' in line or 'Not After:' in line or 'Subject:' in line:
-                    print(f"  {line.strip()}")
-
-        except subprocess.CalledProcessError:
-            print("  無法顯示憑證詳細資訊")
+        print(f"  Not Before: {cert.not_valid_before} UTC")
+        print(f"  Not After : {cert.not_valid_after} UTC")
+        print(f"  Subject: {cert.subject.rfc4514_string()}")
 
         print("\n⚠️  注意事項:")
         print("- 這是自簽名憑證，瀏覽器會顯示安全警告")
@@ -99,10 +94,8 @@ def generate_ssl_certificate(cert_dir, domain="localhost", days=365, key_size=20
 
         return True
 
-    except subprocess.CalledProcessError as e:
+    except (OSError, ValueError) as e:
         print(f"❌ 憑證生成失敗: {e}")
-        if e.stderr:
-            print(f"錯誤詳情: {e.stderr.decode()}")
         return False
 
 
@@ -148,10 +141,6 @@ def main():
     print("🔒 SSL 憑證生成工具")
     print("=" * 40)
 
-    # Check if OpenSSL is available
-    if not check_openssl():
-        sys.exit(1)
-
     # Check if certificates already exist
     cert_dir = Path(args.output)
     cert_file = cert_dir / "cert.pem"
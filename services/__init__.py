@@ -1,13 +1,38 @@
 # Services package initialization
+#
+# Service classes are imported on first attribute access (PEP 562), so
+# importing one submodule does not pull in aiohttp and the AI services.
 
-from .vocabulary_service import VocabularyService
-from .ai_word_service import AIWordService, WordInfo, ai_word_service
-from .ai_service_tester import AIServiceTester
+from importlib import import_module
+
+# Public name -> submodule that defines it. The shared AIWordService is
+# reached through get_ai_word_service(): the name ai_word_service belongs to
+# the submodule, which the import system binds here once it is imported.
+_LAZY_ATTRS = {
+    'VocabularyService': 'vocabulary_service',
+    'AIWordService': 'ai_word_service',
+    'WordInfo': 'ai_word_service',
+    'get_ai_word_service': 'ai_word_service',
+    'AIServiceTester': 'ai_service_tester',
+}
 
 __all__ = [
     'VocabularyService',
     'AIWordService',
     'WordInfo',
-    'ai_word_service',
+    'get_ai_word_service',
     'AIServiceTester'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
@@ -1,30 +1,103 @@
 """
 AI service connection testing utilities.
+
+aiohttp is imported only by the functions that open connections, so the
+key format checks can be used without paying its import cost.
 """
 
 import asyncio
-import aiohttp
-import json
+import atexit
+import hashlib
+import string
 import sys
-from typing import Dict, Tuple
+import time
+import weakref
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from config.api_config import api_config
+from services import loop_thread
+from services.loop_thread import run_coro_sync
+
+if TYPE_CHECKING:
+    import aiohttp
 
 # Fix Windows asyncio event loop issue
 if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
+# Deletes every character allowed in an API key, so a key body made only
+# of allowed characters translates to an empty string
+_STRIP_KEY_CHARS = str.maketrans('', '', string.ascii_letters + string.digits + '_-')
+
+# How long test_connection_sync reuses a live test result, in seconds
+SUCCESS_RESULT_TTL = 300
+FAILURE_RESULT_TTL = 30
+
+# (provider, model, sha256 of key) -> (expiry time, (success, message))
+_key_validation_cache: Dict[Tuple[str, str, str], Tuple[float, Tuple[bool, str]]] = {}
+
+
+def _validation_cache_key(provider: str, model: str, api_key: str) -> Tuple[str, str, str]:
+    """Build a cache key that does not keep the API key itself in memory."""
+    return provider, model, hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _get_cached_result(key: Tuple[str, str, str]) -> Optional[Tuple[bool, str]]:
+    """Get an unexpired connection test result, or None."""
+    entry = _key_validation_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+
+def _store_result(key: Tuple[str, str, str], result: Tuple[bool, str]) -> None:
+    """Remember a connection test result; failures expire sooner."""
+    ttl = SUCCESS_RESULT_TTL if result[0] else FAILURE_RESULT_TTL
+    _key_validation_cache[key] = (time.monotonic() + ttl, result)
+
 
 class AIServiceTester:
     """Test AI service connections and API keys."""
 
+    # One keep-alive session per event loop; sessions cannot cross loops
+    _sessions = weakref.WeakKeyDictionary()
+
+    @classmethod
+    async def _get_session(cls) -> "aiohttp.ClientSession":
+        """
+        Get the shared HTTP session for the running event loop.
+
+        Repeated key tests reuse its pooled connections instead of setting
+        up a new connector, TCP connection and TLS handshake each time.
+
+        Returns:
+            Open ClientSession bound to the current loop
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = cls._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession()
+            cls._sessions[loop] = session
+        return session
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared HTTP session of the running event loop."""
+        session = cls._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
     @staticmethod
-    async def test_openai_connection(api_key: str, model: str = None) -> Tuple[bool, str]:
+    async def test_openai_connection(api_key: str, model: str = None,
+                                     session: Optional["aiohttp.ClientSession"] = None) -> Tuple[bool, str]:
         """
         Test OpenAI API connection.
 
         Args:
             api_key: OpenAI API key
             model: Model name to test (optional)
+            session: Shared session to send the request on (optional)
 
         Returns:
             Tuple of (success, message)
@@ -32,6 +105,8 @@ class AIServiceTester:
         if not api_key or not api_key.startswith("sk-"):
             return False, "無效的 OpenAI API Key 格式"
 
+        import aiohttp
+
         if not model:
             model = api_config.get_openai_model()
 
@@ -53,28 +128,32 @@ class AIServiceTester:
         try:
             timeout = aiohttp.ClientTimeout(total=api_config.get_timeout())
 
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers=headers,
-                    json=payload
-                ) as response:
+            # Use the caller's session when given, otherwise the shared one
+            if session is None:
+                session = await AIServiceTester._get_session()
+
+            async with session.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=timeout
+            ) as response:
 
-                    if response.status == 200:
-                        return True, f"OpenAI API 連線成功 (模型: {model})"
+                if response.status == 200:
+                    return True, f"OpenAI API 連線成功 (模型: {model})"
 
-                    elif response.status == 401:
-                        return False, "API Key 無效或已過期"
+                elif response.status == 401:
+                    return False, "API Key 無效或已過期"
 
-                    elif response.status == 429:
-                        return False, "API 使用量超過限制"
+                elif response.status == 429:
+                    return False, "API 使用量超過限制"
 
-                    elif response.status == 404:
-                        return False, f"模型 '{model}' 不存在或無權限使用"
+                elif response.status == 404:
+                    return False, f"模型 '{model}' 不存在或無權限使用"
 
-                    else:
-                        error_text = await response.text()
-                        return False, f"API 錯誤 ({response.status}): {error_text[:100]}"
+                else:
+                    error_text = await response.text()
+                    return False, f"API 錯誤 ({response.status}): {error_text[:100]}"
 
         except asyncio.TimeoutError:
             return False, f"連線超時 ({api_config.get_timeout()}秒)"
@@ -86,13 +165,15 @@ class AIServiceTester:
             return False, f"未知錯誤: {str(e)}"
 
     @staticmethod
-    async def test_gemini_connection(api_key: str, model: str = None) -> Tuple[bool, str]:
+    async def test_gemini_connection(api_key: str, model: str = None,
+                                     session: Optional["aiohttp.ClientSession"] = None) -> Tuple[bool, str]:
         """
         Test Gemini API connection.
 
         Args:
             api_key: Gemini API key
             model: Model name to test (optional)
+            session: Shared session to send the request on (optional)
 
         Returns:
             Tuple of (success, message)
@@ -100,6 +181,8 @@ class AIServiceTester:
         if not api_key or not api_key.startswith("AIzaSy"):
             return False, "無效的 Gemini API Key 格式"
 
+        import aiohttp
+
         if not model:
             model = api_config.get_gemini_model()
 
@@ -121,35 +204,39 @@ class AIServiceTester:
         try:
             timeout = aiohttp.ClientTimeout(total=api_config.get_timeout())
 
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
+            # Use the caller's session when given, otherwise the shared one
+            if session is None:
+                session = await AIServiceTester._get_session()
+
+            url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
 
-                async with session.post(
-                    url,
-                    headers={"Content-Type": "application/json"},
-                    json=payload
-                ) as response:
+            async with session.post(
+                url,
+                headers={"Content-Type": "application/json"},
+                json=payload,
+                timeout=timeout
+            ) as response:
 
-                    if response.status == 200:
-                        return True, f"Gemini API 連線成功 (模型: {model})"
+                if response.status == 200:
+                    return True, f"Gemini API 連線成功 (模型: {model})"
 
-                    elif response.status == 400:
-                        error_data = await response.json()
-                        error_msg = error_data.get("error", {}).get("message", "請求格式錯誤")
-                        return False, f"請求錯誤: {error_msg}"
+                elif response.status == 400:
+                    error_data = await response.json()
+                    error_msg = error_data.get("error", {}).get("message", "請求格式錯誤")
+                    return False, f"請求錯誤: {error_msg}"
 
-                    elif response.status == 403:
-                        return False, "API Key 無效或無權限"
+                elif response.status == 403:
+                    return False, "API Key 無效或無權限"
 
-                    elif response.status == 404:
-                        return False, f"模型 '{model}' 不存在"
+                elif response.status == 404:
+                    return False, f"模型 '{model}' 不存在"
 
-                    elif response.status == 429:
-                        return False, "API 使用量超過限制"
+                elif response.status == 429:
+                    return False, "API 使用量超過限制"
 
-                    else:
-                        error_text = await response.text()
-                        return False, f"API 錯誤 ({response.status}): {error_text[:100]}"
+                else:
+                    error_text = await response.text()
+                    return False, f"API 錯誤 ({response.status}): {error_text[:100]}"
 
         except asyncio.TimeoutError:
             return False, f"連線超時 ({api_config.get_timeout()}秒)"
@@ -165,6 +252,9 @@ class AIServiceTester:
         """
         Synchronous wrapper for connection testing.
 
+        Results are reused for SUCCESS_RESULT_TTL seconds (FAILURE_RESULT_TTL
+        for failures) while the saved key and model stay the same.
+
         Args:
             provider: Provider name ("openai" or "gemini")
 
@@ -177,18 +267,27 @@ class AIServiceTester:
                 if not api_key:
                     return False, "未設定 OpenAI API Key"
 
-                return asyncio.run(AIServiceTester.test_openai_connection(api_key))
+                model = api_config.get_openai_model()
+                test_connection = AIServiceTester.test_openai_connection
 
             elif provider == "gemini":
                 api_key = api_config.get_gemini_api_key()
                 if not api_key:
                     return False, "未設定 Gemini API Key"
 
-                return asyncio.run(AIServiceTester.test_gemini_connection(api_key))
+                model = api_config.get_gemini_model()
+                test_connection = AIServiceTester.test_gemini_connection
 
             else:
                 return False, f"不支援的提供商: {provider}"
 
+            cache_key = _validation_cache_key(provider, model, api_key)
+            result = _get_cached_result(cache_key)
+            if result is None:
+                result = run_coro_sync(test_connection(api_key, model))
+                _store_result(cache_key, result)
+            return result
+
         except Exception as e:
             return False, f"測試過程發生錯誤: {str(e)}"
 
@@ -204,25 +303,33 @@ class AIServiceTester:
         Returns:
             Tuple of (success, message)
         """
+        # Checks run cheapest first: length, then prefix, then the charset
         if provider == "openai":
-            if not api_key or not api_key.startswith("sk-") or len(api_key) < 20:
+            if not api_key:
                 return False, "OpenAI API Key 格式不正確 (應以 'sk-' 開頭且長度足夠)"
 
-            # Additional format validation
             if len(api_key) < 51:  # OpenAI keys are typically 51 characters
                 return False, "OpenAI API Key 長度不足"
 
+            if not api_key.startswith("sk-"):
+                return False, "OpenAI API Key 格式不正確 (應以 'sk-' 開頭且長度足夠)"
+
+            if api_key[3:].translate(_STRIP_KEY_CHARS):
+                return False, "OpenAI API Key 包含無效字符"
+
             return True, "OpenAI API Key 格式正確"
 
         elif provider == "gemini":
-            if not api_key or not api_key.startswith("AIzaSy"):
+            if not api_key:
                 return False, "Gemini API Key 格式不正確 (應以 'AIzaSy' 開頭)"
 
             if len(api_key) != 39:
                 return False, f"Gemini API Key 長度不正確 (應為39字符，目前為{len(api_key)}字符)"
 
-            # Check if the key contains only valid characters
-            if not api_key.replace("AIzaSy", "").replace("-", "").replace("_", "").isalnum():
+            if not api_key.startswith("AIzaSy"):
+                return False, "Gemini API Key 格式不正確 (應以 'AIzaSy' 開頭)"
+
+            if api_key[6:].translate(_STRIP_KEY_CHARS):
                 return False, "Gemini API Key 包含無效字符"
 
             return True, "Gemini API Key 格式正確"
@@ -231,6 +338,13 @@ class AIServiceTester:
             return False, f"不支援的提供商: {provider}"
 
 
+@atexit.register
+def _close_background_session() -> None:
+    """Close the session the sync wrappers opened on the background loop."""
+    if loop_thread.is_started():
+        run_coro_sync(AIServiceTester.aclose(), timeout=5)
+
+
 # Convenience functions
 def test_openai_key(api_key: str = None) -> Tuple[bool, str]:
     """Test OpenAI API key."""
@@ -243,7 +357,7 @@ def test_openai_key(api_key: str = None) -> Tuple[bool, str]:
         return format_valid, format_msg
 
     # Then test connection
-    return asyncio.run(AIServiceTester.test_openai_connection(api_key))
+    return run_coro_sync(AIServiceTester.test_openai_connection(api_key))
 
 
 def test_gemini_key(api_key: str = None) -> Tuple[bool, str]:
@@ -257,7 +371,7 @@ def test_gemini_key(api_key: str = None) -> Tuple[bool, str]:
         return format_valid, format_msg
 
     # Then test connection
-    return asyncio.run(AIServiceTester.test_gemini_connection(api_key))
+    return run_coro_sync(AIServiceTester.test_gemini_connection(api_key))
 
 
 def validate_key_format(provider: str, api_key: str) -> Tuple[bool, str]:
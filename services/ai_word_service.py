@@ -4,18 +4,229 @@ AI-powered word information generation service.
 
 import asyncio
 import aiohttp
+import atexit
 import json
+import orjson
+import re
 import sys
-from typing import Dict, Optional, List, Tuple
-from dataclasses import dataclass
+import threading
+import weakref
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Dict, Optional, List, Set, Tuple
+from dataclasses import dataclass, field
 from config.api_config import api_config
+from services import loop_thread
+from services.loop_thread import run_coro_sync
+
+# Number of words sent in one request by batch_generate
+BATCH_SIZE = 10
+
+# Generated results kept in memory, and the lowest confidence worth reusing
+RESULT_CACHE_SIZE = 1024
+MIN_CACHED_CONFIDENCE = 0.5
+
+# Confidence scoring tables used by _calculate_confidence_score
+_PROVIDER_SCORES = {
+    "openai": 0.40,    # OpenAI base reliability
+    "gemini": 0.35,    # Gemini base reliability
+}
+_ERROR_RE = re.compile(r'？|\?|未知|不確定|unknown|not sure|unclear', re.IGNORECASE)
+_IPA_CHARS = frozenset('ɪɛæɑɔʊʌəɜɝɚɨɯɤɘɵɞɶœɐɞaeiouɪʏʊɤɯɨəɘɵɞɶœɐɞbpfvθðszʃʒʧʤmnŋlrjwɹɻʔhɦɡkɢqχʁħʕʜʢʡɕʑɺɾɭɳɖɟcɲʎʟɬɮʘǀǃǂǁɓɗʄɠʛ')
+
+# Static instructions sent as the system message. Keeping them identical
+# across requests, with only the word(s) in the user message, lets the
+# providers reuse the cached prompt prefix.
+_SYSTEM_INSTRUCTIONS = """你是一個專業的英語詞典助手，專門提供準確的單字資訊。請嚴格按照要求的JSON格式回應。
+
+每個單字的資訊格式如下：
+
+{
+    "chinese_meaning": "中文翻譯（簡潔明確）",
+    "english_meaning": "英文定義（用英文解釋）",
+    "phonetic": "音標（IPA格式，包含斜線）",
+    "example_sentence": "例句（展示單字用法，優先使用科技類例句）",
+    "synonyms": ["同義詞1", "同義詞2", "同義詞3"],
+    "antonyms": ["反義詞1", "反義詞2"]
+}
+
+要求：
+1. 中文翻譯要準確且常用
+2. 英文定義要清楚易懂
+3. 音標使用標準IPA格式
+4. 例句要自然實用
+5. 同義詞和反義詞各提供2-3個
+6. 如果是多義詞，提供最常用的意思
+7. 只回應JSON，不要其他文字
+
+重要：單字形式要求
+- 如果輸入的是複數名詞（如words, books），請轉換為單數形式（word, book）
+- 如果輸入的是動詞變化形式（如running, walked, goes），請轉換為原型動詞（run, walk, go）
+- 形容詞保持原形式，但請在中文翻譯中標明級別：
+  * 原級形容詞：good → "好的"
+  * 比較級形容詞：better → "更好的（比較級）"
+  * 最高級形容詞：best → "最好的（最高級）"
+- 所有資訊（音標、定義、例句）都應該對應實際輸入的單字形式"""
+
+# Drops the hyphens and apostrophes allowed inside English words
+_WORD_PUNCTUATION_TABLE = str.maketrans('', '', "-'")
+
+# User messages; only the word (or JSON list of words) varies per request
+_WORD_PROMPT_TEMPLATE = '請為英文單字 "%s" 提供資訊，以JSON格式回應。'
+_BATCH_PROMPT_TEMPLATE = (
+    "請為以下每個英文單字提供資訊，以JSON物件回應。"
+    "物件的鍵必須是輸入的單字本身（保持原樣，不要改寫），每個值都使用指定的格式，"
+    "每個單字都要有對應的鍵：%s"
+)
+
+# Longest wait honoured from a rate-limit response, in seconds
+MAX_RETRY_DELAY = 60.0
+
+# Connection failures worth another attempt; other client errors (bad
+# URL, broken payload, ...) would only fail the same way again
+_RETRYABLE_NETWORK_ERRORS = (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError)
+
+# Longest backoff between attempts after a connection failure, in seconds
+MAX_NETWORK_RETRY_DELAY = 10.0
+
+# One component of an OpenAI reset duration such as "6m0s" or "20ms"
+_DURATION_PART_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse an OpenAI rate-limit reset duration into seconds."""
+    parts = _DURATION_PART_RE.findall(value)
+    if not parts or "".join(num + unit for num, unit in parts) != value.strip():
+        return None
+    return sum(float(num) * _DURATION_UNITS[unit] for num, unit in parts)
+
+
+def _retry_delay(headers, attempt: int) -> float:
+    """
+    Work out how long to wait after a 429 response.
+
+    Uses Retry-After when it is given in seconds, then OpenAI's
+    x-ratelimit-reset-* headers, and falls back to exponential backoff.
+
+    Args:
+        headers: Response headers
+        attempt: Zero-based attempt number
+
+    Returns:
+        Delay in seconds, capped at MAX_RETRY_DELAY
+    """
+    delay = None
+
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = None  # HTTP-date form; fall through
+
+    if delay is None:
+        resets = [
+            _parse_duration(headers[name])
+            for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+            if headers.get(name)
+        ]
+        resets = [reset for reset in resets if reset is not None]
+        if resets:
+            delay = max(resets)
+
+    if delay is None:
+        delay = 2 ** attempt  # Exponential backoff
+
+    return max(0.0, min(delay, MAX_RETRY_DELAY))
+
+
+# Completeness graders: each returns the share of the completeness score
+# a field earns, given the stripped value and the lowercased input word
+def _grade_chinese_meaning(value: str, word: str) -> float:
+    if not value:
+        return 0.0
+    if 2 <= len(value) <= 20 and not any(char in value for char in ('？', '?', '未知', '不確定')):
+        return 0.25
+    return 0.15
+
+
+def _grade_english_meaning(value: str, word: str) -> float:
+    if not value:
+        return 0.0
+    if 10 <= len(value) <= 100 and not value.lower().startswith('i don'):
+        return 0.20
+    return 0.10
+
+
+def _grade_phonetic(value: str, word: str) -> float:
+    if value.startswith('/') and value.endswith('/') and len(value) > 3:
+        return 0.15
+    if value.startswith('[') and value.endswith(']'):
+        return 0.10
+    if len(value) > 2:
+        return 0.05
+    return 0.0
+
+
+def _grade_example(value: str, word: str) -> float:
+    if not value:
+        return 0.0
+    if word in value.lower() and 4 <= len(value.split()) <= 20:
+        return 0.20
+    if len(value) >= 10:
+        return 0.10
+    return 0.0
+
+
+def _grade_synonyms(value: List[str], word: str) -> float:
+    if not isinstance(value, list) or not value:
+        return 0.0
+    return 0.10 if len(value) >= 2 else 0.05
+
+
+def _grade_antonyms(value: List[str], word: str) -> float:
+    if not isinstance(value, list) or not value:
+        return 0.0
+    return 0.10
+
+
+_COMPLETENESS_GRADERS = (
+    ("chinese_meaning", _grade_chinese_meaning),    # required
+    ("english_meaning", _grade_english_meaning),
+    ("phonetic", _grade_phonetic),
+    ("example_sentence", _grade_example),
+    ("synonyms", _grade_synonyms),
+    ("antonyms", _grade_antonyms),
+)
+
+
+def _openai_content(data: Dict) -> str:
+    """Get the message text from an OpenAI chat completion."""
+    return data["choices"][0]["message"]["content"]
+
+
+def _gemini_content(data: Dict) -> str:
+    """Get the text of the first Gemini candidate."""
+    if not data.get("candidates"):
+        raise Exception("Gemini 沒有回應內容")
+    return data["candidates"][0]["content"]["parts"][0]["text"]
+
+
+def _api_error_message(body: bytes) -> str:
+    """Get the error message from a JSON error response body."""
+    try:
+        message = orjson.loads(body).get("error", {}).get("message")
+    except (orjson.JSONDecodeError, AttributeError):
+        message = None
+    return message or "請求格式錯誤"
+
 
 # Fix Windows asyncio event loop issue
 if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
-@dataclass
+@dataclass(slots=True)
 class WordInfo:
     """Data class for AI-generated word information."""
     word: str
@@ -23,17 +234,11 @@ class WordInfo:
     english_meaning: str = ""
     phonetic: str = ""
     example_sentence: str = ""
-    synonyms: List[str] = None
-    antonyms: List[str] = None
+    synonyms: List[str] = field(default_factory=list)
+    antonyms: List[str] = field(default_factory=list)
     confidence_score: float = 0.0
     provider: str = ""
 
-    def __post_init__(self):
-        if self.synonyms is None:
-            self.synonyms = []
-        if self.antonyms is None:
-            self.antonyms = []
-
 
 class AIWordService:
     """Service for generating word information using AI APIs."""
@@ -41,6 +246,46 @@ class AIWordService:
     def __init__(self):
         self.timeout = aiohttp.ClientTimeout(total=api_config.get_timeout())
         self.max_retries = api_config.get_max_retries()
+        # One keep-alive session per event loop; sessions cannot cross loops
+        self._sessions = weakref.WeakKeyDictionary()
+        # LRU of (provider, model, word) -> WordInfo; the sync wrappers run on
+        # several threads, so access goes through a lock
+        self._cache: "OrderedDict[Tuple[str, str, str], WordInfo]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # (loop, cache key) -> task generating that word, so concurrent
+        # callers asking for the same word share one API request
+        self._inflight: Dict[Tuple, "asyncio.Task[WordInfo]"] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session for the running event loop.
+
+        Reusing the session keeps connections, TLS sessions and DNS results
+        alive across requests to the same provider.
+
+        Returns:
+            Open ClientSession bound to the current loop
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # Bounded pool with cached DNS; batch concurrency stays under the per-host cap
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                ttl_dns_cache=600,
+                use_dns_cache=True,
+                enable_cleanup_closed=True
+            )
+            session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
+            self._sessions[loop] = session
+        return session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session of the running event loop."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
 
     async def generate_word_info(self, word: str, provider: str = None) -> WordInfo:
         """
@@ -57,16 +302,121 @@ class AIWordService:
             ValueError: If word is invalid or provider not available
             Exception: If API call fails
         """
+        word = self._normalize_word(word)
+        provider = self._resolve_provider(provider)
+
+        cache_key = self._cache_key(provider, word)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        inflight_key = (loop, cache_key)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = loop.create_task(self._generate_and_cache(word, provider, cache_key))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda done: self._inflight_done(inflight_key, done))
+
+        # Shielded so one caller being cancelled does not fail the others
+        return await asyncio.shield(task)
+
+    async def _generate_and_cache(self, word: str, provider: str, cache_key: Tuple[str, str, str]) -> WordInfo:
+        """Request a word from the provider and store the result in the cache."""
+        if provider == "openai":
+            word_info = await self._generate_with_openai(word)
+        elif provider == "gemini":
+            word_info = await self._generate_with_gemini(word)
+        else:
+            raise ValueError(f"不支援的提供商: {provider}")
+
+        self._cache_put(cache_key, word_info)
+        return word_info
+
+    def _inflight_done(self, key: Tuple, task: "asyncio.Task[WordInfo]") -> None:
+        """Forget a finished in-flight request."""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved even if every caller was cancelled
+
+    @staticmethod
+    def _cache_key(provider: str, word: str) -> Tuple[str, str, str]:
+        """Build the result cache key, including the model in use."""
+        model = api_config.get_openai_model() if provider == "openai" else api_config.get_gemini_model()
+        return provider, model, word
+
+    def _cache_get(self, key: Tuple[str, str, str]) -> Optional[WordInfo]:
+        """
+        Look up a previously generated result.
+
+        Args:
+            key: Key from _cache_key
+
+        Returns:
+            Cached WordInfo (shared, do not modify), or None on a miss
+        """
+        with self._cache_lock:
+            word_info = self._cache.get(key)
+            if word_info is not None:
+                self._cache.move_to_end(key)
+            return word_info
+
+    def _cache_put(self, key: Tuple[str, str, str], word_info: WordInfo) -> None:
+        """
+        Remember a generated result if it is confident enough to reuse.
+
+        Args:
+            key: Key from _cache_key
+            word_info: Generated result
+        """
+        if word_info.confidence_score < MIN_CACHED_CONFIDENCE:
+            return
+
+        with self._cache_lock:
+            self._cache[key] = word_info
+            self._cache.move_to_end(key)
+            if len(self._cache) > RESULT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _normalize_word(word: str) -> str:
+        """
+        Strip and lowercase a word, rejecting input that is not an English word.
+
+        Args:
+            word: Raw input word
+
+        Returns:
+            Normalized word
+
+        Raises:
+            ValueError: If word is empty or not a valid English word
+        """
         if not word or not word.strip():
             raise ValueError("單字不能為空")
 
         word = word.strip().lower()
 
         # Validate word format (basic English word check)
-        if not word.replace("-", "").replace("'", "").isalpha():
+        if not word.translate(_WORD_PUNCTUATION_TABLE).isalpha():
             raise ValueError("請輸入有效的英文單字")
 
-        # Determine provider
+        return word
+
+    @staticmethod
+    def _resolve_provider(provider: Optional[str]) -> str:
+        """
+        Pick the provider to use, falling back to the first available one.
+
+        Args:
+            provider: Requested provider, or None for the configured default
+
+        Returns:
+            Provider name
+
+        Raises:
+            ValueError: If no provider has a valid API key
+        """
         if not provider:
             provider = api_config.get_default_provider()
 
@@ -77,16 +427,57 @@ class AIWordService:
             else:
                 raise ValueError("沒有可用的 AI 提供商，請先設定 API Key")
 
-        # Generate word information
-        if provider == "openai":
-            return await self._generate_with_openai(word)
-        elif provider == "gemini":
-            return await self._generate_with_gemini(word)
-        else:
-            raise ValueError(f"不支援的提供商: {provider}")
+        return provider
+
+    def _build_word_info(self, word: str, word_data: Dict, provider: str) -> WordInfo:
+        """
+        Build a WordInfo from one word's parsed AI response.
+
+        Args:
+            word: Normalized input word
+            word_data: Parsed JSON object for the word
+            provider: AI provider used
+
+        Returns:
+            WordInfo object with confidence score
+        """
+        # Calculate confidence score based on content quality
+        confidence_score = self._calculate_confidence_score(word_data, word, provider)
+
+        return WordInfo(
+            word=word,
+            chinese_meaning=word_data.get("chinese_meaning", ""),
+            english_meaning=word_data.get("english_meaning", ""),
+            phonetic=word_data.get("phonetic", ""),
+            example_sentence=word_data.get("example_sentence", ""),
+            synonyms=word_data.get("synonyms") or [],
+            antonyms=word_data.get("antonyms") or [],
+            confidence_score=confidence_score,
+            provider=provider
+        )
 
     async def _generate_with_openai(self, word: str) -> WordInfo:
         """Generate word information using OpenAI API."""
+        prompt = _WORD_PROMPT_TEMPLATE % word
+
+        word_data = await self._request_openai_json(prompt, max_tokens=500)
+        return self._build_word_info(word, word_data, "openai")
+
+    async def _request_openai_json(self, prompt: str, max_tokens: int) -> Dict:
+        """
+        Send a prompt to OpenAI and parse the JSON object it answers with.
+
+        Args:
+            prompt: User message naming the word(s); instructions are in the system message
+            max_tokens: Completion token limit
+
+        Returns:
+            Parsed JSON object from the model
+
+        Raises:
+            ValueError: If the API key is not configured
+            Exception: If the API call fails
+        """
         api_key = api_config.get_openai_api_key()
         model = api_config.get_openai_model()
 
@@ -98,159 +489,69 @@ class AIWordService:
             "Content-Type": "application/json"
         }
 
-        # Construct prompt for comprehensive word information
-        prompt = f"""請為英文單字 "{word}" 提供以下資訊，以JSON格式回應：
-
-{{
-    "chinese_meaning": "中文翻譯（簡潔明確）",
-    "english_meaning": "英文定義（用英文解釋）",
-    "phonetic": "音標（IPA格式，包含斜線）",
-    "example_sentence": "例句（展示單字用法，優先使用科技類例句）",
-    "synonyms": ["同義詞1", "同義詞2", "同義詞3"],
-    "antonyms": ["反義詞1", "反義詞2"]
-}}
-
-要求：
-1. 中文翻譯要準確且常用
-2. 英文定義要清楚易懂
-3. 音標使用標準IPA格式
-4. 例句要自然實用
-5. 同義詞和反義詞各提供2-3個
-6. 如果是多義詞，提供最常用的意思
-7. 只回應JSON，不要其他文字
-
-重要：單字形式要求
-- 如果輸入的是複數名詞（如words, books），請轉換為單數形式（word, book）
-- 如果輸入的是動詞變化形式（如running, walked, goes），請轉換為原型動詞（run, walk, go）
-- 形容詞保持原形式，但請在中文翻譯中標明級別：
-  * 原級形容詞：good → "好的"
-  * 比較級形容詞：better → "更好的（比較級）"
-  * 最高級形容詞：best → "最好的（最高級）"
-- 所有資訊（音標、定義、例句）都應該對應實際輸入的單字形式"""
-
         payload = {
             "model": model,
             "messages": [
                 {
                     "role": "system",
-                    "content": "你是一個專業的英語詞典助手，專門提供準確的單字資訊。請嚴格按照要求的JSON格式回應。"
+                    "content": _SYSTEM_INSTRUCTIONS
                 },
                 {
                     "role": "user",
                     "content": prompt
                 }
             ],
-            "max_tokens": 500,
+            "max_tokens": max_tokens,
             "temperature": 0.3,
             "response_format": {"type": "json_object"}
         }
 
-        for attempt in range(self.max_retries + 1):
-            try:
-                async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                    async with session.post(
-                        "https://api.openai.com/v1/chat/completions",
-                        headers=headers,
-                        json=payload
-                    ) as response:
-
-                        if response.status == 200:
-                            data = await response.json()
-                            content = data["choices"][0]["message"]["content"]
-
-                            # Parse JSON response
-                            word_data = json.loads(content)
-
-                            # Calculate confidence score based on content quality
-                            confidence_score = self._calculate_confidence_score(
-                                word_data, word, "openai"
-                            )
-
-                            return WordInfo(
-                                word=word,
-                                chinese_meaning=word_data.get("chinese_meaning", ""),
-                                english_meaning=word_data.get("english_meaning", ""),
-                                phonetic=word_data.get("phonetic", ""),
-                                example_sentence=word_data.get("example_sentence", ""),
-                                synonyms=word_data.get("synonyms", []),
-                                antonyms=word_data.get("antonyms", []),
-                                confidence_score=confidence_score,
-                                provider="openai"
-                            )
-
-                        elif response.status == 401:
-                            raise Exception("OpenAI API Key 無效或已過期")
-
-                        elif response.status == 429:
-                            if attempt < self.max_retries:
-                                await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                                continue
-                            raise Exception("OpenAI API 使用量超過限制")
-
-                        elif response.status == 404:
-                            raise Exception(f"OpenAI 模型 '{model}' 不存在或無權限使用")
-
-                        else:
-                            error_text = await response.text()
-                            raise Exception(f"OpenAI API 錯誤 ({response.status}): {error_text[:200]}")
-
-            except json.JSONDecodeError:
-                if attempt < self.max_retries:
-                    continue
-                raise Exception("OpenAI 回應格式錯誤，無法解析JSON")
+        return await self._post_chat(
+            "OpenAI",
+            "https://api.openai.com/v1/chat/completions",
+            headers,
+            payload,
+            _openai_content,
+            {
+                401: "OpenAI API Key 無效或已過期",
+                404: f"OpenAI 模型 '{model}' 不存在或無權限使用"
+            }
+        )
 
-            except asyncio.TimeoutError:
-                if attempt < self.max_retries:
-                    continue
-                raise Exception(f"OpenAI API 連線超時 ({api_config.get_timeout()}秒)")
+    async def _generate_with_gemini(self, word: str) -> WordInfo:
+        """Generate word information using Gemini API."""
+        prompt = _WORD_PROMPT_TEMPLATE % word
 
-            except aiohttp.ClientError as e:
-                if attempt < self.max_retries:
-                    await asyncio.sleep(1)
-                    continue
-                raise Exception(f"網路連線錯誤: {str(e)}")
+        word_data = await self._request_gemini_json(prompt, max_tokens=500)
+        return self._build_word_info(word, word_data, "gemini")
 
-        raise Exception("OpenAI API 呼叫失敗，已達最大重試次數")
+    async def _request_gemini_json(self, prompt: str, max_tokens: int) -> Dict:
+        """
+        Send a prompt to Gemini and parse the JSON object it answers with.
 
-    async def _generate_with_gemini(self, word: str) -> WordInfo:
-        """Generate word information using Gemini API."""
+        Args:
+            prompt: User message naming the word(s); instructions are in the system instruction
+            max_tokens: Output token limit
+
+        Returns:
+            Parsed JSON object from the model
+
+        Raises:
+            ValueError: If the API key is not configured
+            Exception: If the API call fails
+        """
         api_key = api_config.get_gemini_api_key()
         model = api_config.get_gemini_model()
 
         if not api_key:
             raise ValueError("Gemini API Key 未設定")
 
-        # Construct prompt for comprehensive word information
-        prompt = f"""請為英文單字 "{word}" 提供以下資訊，以JSON格式回應：
-
-{{
-    "chinese_meaning": "中文翻譯（簡潔明確）",
-    "english_meaning": "英文定義（用英文解釋）",
-    "phonetic": "音標（IPA格式，包含斜線）",
-    "example_sentence": "例句（展示單字用法，優先使用科技類例句）",
-    "synonyms": ["同義詞1", "同義詞2", "同義詞3"],
-    "antonyms": ["反義詞1", "反義詞2"]
-}}
-
-要求：
-1. 中文翻譯要準確且常用
-2. 英文定義要清楚易懂
-3. 音標使用標準IPA格式
-4. 例句要自然實用
-5. 同義詞和反義詞各提供2-3個
-6. 如果是多義詞，提供最常用的意思
-7. 只回應JSON，不要其他文字
-
-重要：單字形式要求
-- 如果輸入的是複數名詞（如words, books），請轉換為單數形式（word, book）
-- 如果輸入的是動詞變化形式（如running, walked, goes），請轉換為原型動詞（run, walk, go）
-- 形容詞保持原形式，但請在中文翻譯中標明級別：
-  * 原級形容詞：good → "好的"
-  * 比較級形容詞：better → "更好的（比較級）"
-  * 最高級形容詞：best → "最好的（最高級）"
-- 所有資訊（音標、定義、例句）都應該對應實際輸入的單字形式"""
-
         payload = {
+            "systemInstruction": {
+                "parts": [
+                    {"text": _SYSTEM_INSTRUCTIONS}
+                ]
+            },
             "contents": [
                 {
                     "parts": [
@@ -259,89 +560,144 @@ class AIWordService:
                 }
             ],
             "generationConfig": {
-                "maxOutputTokens": 500,
+                "maxOutputTokens": max_tokens,
                 "temperature": 0.3,
                 "responseMimeType": "application/json"
             }
         }
 
+        return await self._post_chat(
+            "Gemini",
+            f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}",
+            {"Content-Type": "application/json"},
+            payload,
+            _gemini_content,
+            {
+                403: "Gemini API Key 無效或無權限",
+                404: f"Gemini 模型 '{model}' 不存在"
+            }
+        )
+
+    async def _post_chat(self, label: str, url: str, headers: Dict[str, str], payload: Dict,
+                         extract_content: Callable[[Dict], str],
+                         status_errors: Dict[int, str]) -> Dict:
+        """
+        POST a chat request and parse the JSON object the model answers with.
+
+        Holds the retry and status handling shared by all providers.
+
+        Args:
+            label: Provider name used in error messages
+            url: Endpoint URL
+            headers: Request headers
+            payload: JSON request body
+            extract_content: Returns the model's text from the decoded response
+            status_errors: Error messages for provider-specific status codes
+
+        Returns:
+            Parsed JSON object from the model
+
+        Raises:
+            Exception: If the API call fails
+        """
         for attempt in range(self.max_retries + 1):
             try:
-                async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
-
-                    async with session.post(
-                        url,
-                        headers={"Content-Type": "application/json"},
-                        json=payload
-                    ) as response:
-
-                        if response.status == 200:
-                            data = await response.json()
-
-                            if "candidates" in data and data["candidates"]:
-                                content = data["candidates"][0]["content"]["parts"][0]["text"]
-
-                                # Parse JSON response
-                                word_data = json.loads(content)
-
-                                # Calculate confidence score based on content quality
-                                confidence_score = self._calculate_confidence_score(
-                                    word_data, word, "gemini"
-                                )
-
-                                return WordInfo(
-                                    word=word,
-                                    chinese_meaning=word_data.get("chinese_meaning", ""),
-                                    english_meaning=word_data.get("english_meaning", ""),
-                                    phonetic=word_data.get("phonetic", ""),
-                                    example_sentence=word_data.get("example_sentence", ""),
-                                    synonyms=word_data.get("synonyms", []),
-                                    antonyms=word_data.get("antonyms", []),
-                                    confidence_score=confidence_score,
-                                    provider="gemini"
-                                )
-                            else:
-                                raise Exception("Gemini 沒有回應內容")
-
-                        elif response.status == 400:
-                            error_data = await response.json()
-                            error_msg = error_data.get("error", {}).get("message", "請求格式錯誤")
-                            raise Exception(f"Gemini API 請求錯誤: {error_msg}")
-
-                        elif response.status == 403:
-                            raise Exception("Gemini API Key 無效或無權限")
-
-                        elif response.status == 404:
-                            raise Exception(f"Gemini 模型 '{model}' 不存在")
-
-                        elif response.status == 429:
-                            if attempt < self.max_retries:
-                                await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                                continue
-                            raise Exception("Gemini API 使用量超過限制")
-
-                        else:
-                            error_text = await response.text()
-                            raise Exception(f"Gemini API 錯誤 ({response.status}): {error_text[:200]}")
-
-            except json.JSONDecodeError:
+                session = await self._get_session()
+                async with session.post(url, headers=headers, json=payload) as response:
+
+                    if response.status == 200:
+                        # Read the whole (small) body rather than streaming: leaving a
+                        # stream early would close the pooled keep-alive connection
+                        data = orjson.loads(await response.read())
+
+                        # Parse JSON response
+                        return orjson.loads(extract_content(data))
+
+                    elif response.status == 429:
+                        if attempt < self.max_retries:
+                            await asyncio.sleep(_retry_delay(response.headers, attempt))
+                            continue
+                        raise Exception(f"{label} API 使用量超過限制")
+
+                    elif response.status in status_errors:
+                        raise Exception(status_errors[response.status])
+
+                    elif response.status == 400:
+                        error_msg = _api_error_message(await response.read())
+                        raise Exception(f"{label} API 請求錯誤: {error_msg}")
+
+                    else:
+                        error_text = await response.text()
+                        raise Exception(f"{label} API 錯誤 ({response.status}): {error_text[:200]}")
+
+            except orjson.JSONDecodeError:
                 if attempt < self.max_retries:
                     continue
-                raise Exception("Gemini 回應格式錯誤，無法解析JSON")
+                raise Exception(f"{label} 回應格式錯誤，無法解析JSON")
 
             except asyncio.TimeoutError:
                 if attempt < self.max_retries:
                     continue
-                raise Exception(f"Gemini API 連線超時 ({api_config.get_timeout()}秒)")
+                raise Exception(f"{label} API 連線超時 ({api_config.get_timeout()}秒)")
 
-            except aiohttp.ClientError as e:
+            except _RETRYABLE_NETWORK_ERRORS as e:
                 if attempt < self.max_retries:
-                    await asyncio.sleep(1)
+                    await asyncio.sleep(min(2 ** attempt, MAX_NETWORK_RETRY_DELAY))
                     continue
                 raise Exception(f"網路連線錯誤: {str(e)}")
 
-        raise Exception("Gemini API 呼叫失敗，已達最大重試次數")
+            except aiohttp.ClientError as e:
+                raise Exception(f"網路連線錯誤: {str(e)}")
+
+        raise Exception(f"{label} API 呼叫失敗，已達最大重試次數")
+
+    @staticmethod
+    def _build_batch_prompt(words: List[str]) -> str:
+        """
+        Build one prompt asking for the information of several words.
+
+        Args:
+            words: Normalized words to include
+
+        Returns:
+            Prompt requesting a JSON object keyed by word
+        """
+        return _BATCH_PROMPT_TEMPLATE % json.dumps(words, ensure_ascii=False)
+
+    async def _generate_batch(self, words: List[str], provider: str) -> Dict[str, WordInfo]:
+        """
+        Generate information for several words with a single API request.
+
+        Args:
+            words: Normalized words
+            provider: Resolved AI provider
+
+        Returns:
+            Dictionary of word to WordInfo for every word the response covered
+
+        Raises:
+            Exception: If the API call fails
+        """
+        prompt = self._build_batch_prompt(words)
+        max_tokens = 500 * len(words)
+
+        if provider == "openai":
+            data = await self._request_openai_json(prompt, max_tokens)
+        elif provider == "gemini":
+            data = await self._request_gemini_json(prompt, max_tokens)
+        else:
+            raise ValueError(f"不支援的提供商: {provider}")
+
+        if not isinstance(data, dict):
+            return {}
+
+        entries = {str(key).strip().lower(): value for key, value in data.items()}
+        results = {}
+        for word in words:
+            word_data = entries.get(word)
+            if isinstance(word_data, dict) and word_data.get("chinese_meaning"):
+                results[word] = self._build_word_info(word, word_data, provider)
+        return results
 
     def _calculate_confidence_score(self, word_data: Dict, original_word: str, provider: str) -> float:
         """
@@ -358,66 +714,27 @@ class AIWordService:
         score = 0.0
 
         # Base score by provider (40% of total)
-        provider_scores = {
-            "openai": 0.40,    # OpenAI base reliability
-            "gemini": 0.35,    # Gemini base reliability
-        }
-        score += provider_scores.get(provider, 0.30)
+        score += _PROVIDER_SCORES.get(provider, 0.30)
 
-        # Content completeness score (35% of total)
-        completeness_score = 0.0
-        max_completeness = 0.35
-
-        # Chinese meaning (required - 25% of completeness)
         chinese_meaning = word_data.get("chinese_meaning", "").strip()
-        if chinese_meaning:
-            if len(chinese_meaning) >= 2 and len(chinese_meaning) <= 20 and not any(char in chinese_meaning for char in ['？', '?', '未知', '不確定']):
-                completeness_score += 0.25 * max_completeness
-            elif chinese_meaning:
-                completeness_score += 0.15 * max_completeness
-
-        # English meaning (20% of completeness)
         english_meaning = word_data.get("english_meaning", "").strip()
-        if english_meaning:
-            if len(english_meaning) >= 10 and len(english_meaning) <= 100 and not english_meaning.lower().startswith('i don'):
-                completeness_score += 0.20 * max_completeness
-            elif english_meaning:
-                completeness_score += 0.10 * max_completeness
-
-        # Phonetic (15% of completeness)
         phonetic = word_data.get("phonetic", "").strip()
-        if phonetic:
-            if phonetic.startswith('/') and phonetic.endswith('/') and len(phonetic) > 3:
-                completeness_score += 0.15 * max_completeness
-            elif phonetic.startswith('[') and phonetic.endswith(']'):
-                completeness_score += 0.10 * max_completeness
-            elif len(phonetic) > 2:
-                completeness_score += 0.05 * max_completeness
-
-        # Example sentence (20% of completeness)
         example = word_data.get("example_sentence", "").strip()
-        if example:
-            words_in_example = len(example.split())
-            if original_word.lower() in example.lower() and words_in_example >= 4 and words_in_example <= 20:
-                completeness_score += 0.20 * max_completeness
-            elif len(example) >= 10:
-                completeness_score += 0.10 * max_completeness
-
-        # Synonyms (10% of completeness)
-        synonyms = word_data.get("synonyms", [])
-        if isinstance(synonyms, list) and synonyms:
-            if len(synonyms) >= 2:
-                completeness_score += 0.10 * max_completeness
-            else:
-                completeness_score += 0.05 * max_completeness
+        word_lower = original_word.lower()
 
-        # Antonyms (10% of completeness)
-        antonyms = word_data.get("antonyms", [])
-        if isinstance(antonyms, list) and antonyms:
-            if len(antonyms) >= 1:
-                completeness_score += 0.10 * max_completeness
-            else:
-                completeness_score += 0.05 * max_completeness
+        # Content completeness score (35% of total)
+        max_completeness = 0.35
+        values = {
+            "chinese_meaning": chinese_meaning,
+            "english_meaning": english_meaning,
+            "phonetic": phonetic,
+            "example_sentence": example,
+            "synonyms": word_data.get("synonyms", []),
+            "antonyms": word_data.get("antonyms", []),
+        }
+        completeness_score = sum(
+            grade(values[field], word_lower) * max_completeness for field, grade in _COMPLETENESS_GRADERS
+        )
 
         score += completeness_score
 
@@ -426,27 +743,20 @@ class AIWordService:
         max_quality = 0.25
 
         # Check for error indicators
-        error_indicators = ['？', '?', '未知', '不確定', 'unknown', 'not sure', 'unclear']
-        has_errors = False
-
-        for field in [chinese_meaning, english_meaning, example]:
-            if any(indicator in field.lower() for indicator in error_indicators):
-                has_errors = True
-                break
+        has_errors = any(_ERROR_RE.search(field) for field in (chinese_meaning, english_meaning, example))
 
         if not has_errors:
             quality_score += 0.40 * max_quality
 
         # Check phonetic quality
         if phonetic:
-            ipa_chars = set('ɪɛæɑɔʊʌəɜɝɚɨɯɤɘɵɞɶœɐɞaeiouɪʏʊɤɯɨəɘɵɞɶœɐɞbpfvθðszʃʒʧʤmnŋlrjwɹɻʔhɦɡkɢqχʁħʕʜʢʡɕʑɺɾɭɳɖɟcɲʎʟɬɮʘǀǃǂǁɓɗʄɠʛ')
-            if any(char in ipa_chars for char in phonetic):
+            if not _IPA_CHARS.isdisjoint(phonetic):
                 quality_score += 0.30 * max_quality
             elif phonetic.startswith('/') and phonetic.endswith('/'):
                 quality_score += 0.20 * max_quality
 
         # Check example sentence quality
-        if example and original_word.lower() in example.lower():
+        if example and word_lower in example.lower():
             words_count = len(example.split())
             if 5 <= words_count <= 15:
                 quality_score += 0.30 * max_quality
@@ -471,6 +781,9 @@ class AIWordService:
         """
         Synchronous wrapper for generate_word_info.
 
+        Runs on the shared background loop, so the HTTP session and its
+        connections are reused across calls.
+
         Args:
             word: English word to generate information for
             provider: AI provider to use
@@ -478,40 +791,138 @@ class AIWordService:
         Returns:
             WordInfo object with generated information
         """
-        return asyncio.run(self.generate_word_info(word, provider))
+        return run_coro_sync(self.generate_word_info(word, provider))
 
     async def batch_generate(self, words: List[str], provider: str = None) -> List[WordInfo]:
         """
-        Generate information for multiple words concurrently.
+        Generate information for multiple words.
+
+        Words are sent BATCH_SIZE at a time in a single request each; words
+        missing from a batch response are retried individually.
 
         Args:
             words: List of English words
             provider: AI provider to use
 
         Returns:
-            List of WordInfo objects
+            List of WordInfo objects, in the same order as words
+        """
+        results: List[Optional[WordInfo]] = [None] * len(words)
+        async for i, info in self.batch_generate_iter(words, provider):
+            results[i] = info
+        return results
+
+    async def batch_generate_iter(self, words: List[str],
+                                  provider: str = None) -> AsyncIterator[Tuple[int, WordInfo]]:
+        """
+        Generate information for multiple words, yielding each result as it is ready.
+
+        Cached and invalid words are yielded first, then generated words as
+        their requests finish, so callers can show results without waiting
+        for the slowest request. Closing the iterator early cancels the
+        requests still in flight.
+
+        Args:
+            words: List of English words
+            provider: AI provider to use
+
+        Yields:
+            (index into words, WordInfo) pairs, one per input word
         """
         if not words:
-            return []
+            return
+
+        def failed(word: str, error: Exception) -> WordInfo:
+            # Return error info for failed words
+            return WordInfo(
+                word=word,
+                chinese_meaning=f"生成失敗: {str(error)}",
+                confidence_score=0.0,
+                provider=provider or "unknown"
+            )
+
+        try:
+            resolved_provider = self._resolve_provider(provider)
+        except ValueError as e:
+            for i, word in enumerate(words):
+                yield i, failed(word, e)
+            return
+
+        # Map each normalized word to the input positions it fills,
+        # answering previously generated words from the cache
+        positions: Dict[str, List[int]] = {}
+        for i, word in enumerate(words):
+            try:
+                normalized = self._normalize_word(word)
+            except ValueError as e:
+                yield i, failed(word, e)
+                continue
+
+            cached = self._cache_get(self._cache_key(resolved_provider, normalized))
+            if cached is not None:
+                yield i, cached
+            else:
+                positions.setdefault(normalized, []).append(i)
+
+        if not positions:
+            return
+
+        # Finished results are handed from the request tasks to this generator
+        ready: "asyncio.Queue[Tuple[int, WordInfo]]" = asyncio.Queue()
+        emitted: Set[int] = set()
+
+        def emit(i: int, info: WordInfo) -> None:
+            # Report each position once, so a late result after a failure
+            # cannot make the generator stop early
+            if i not in emitted:
+                emitted.add(i)
+                ready.put_nowait((i, info))
 
         # Limit concurrent requests to avoid rate limiting
-        semaphore = asyncio.Semaphore(3)
+        semaphore = asyncio.Semaphore(api_config.get_max_concurrency())
 
-        async def generate_single(word: str) -> WordInfo:
+        async def generate_single(word: str) -> None:
             async with semaphore:
                 try:
-                    return await self.generate_word_info(word, provider)
+                    info = await self.generate_word_info(word, resolved_provider)
                 except Exception as e:
-                    # Return error info for failed words
-                    return WordInfo(
-                        word=word,
-                        chinese_meaning=f"生成失敗: {str(e)}",
-                        confidence_score=0.0,
-                        provider=provider or "unknown"
-                    )
+                    for i in positions[word]:
+                        emit(i, failed(words[i], e))
+                    return
+            for i in positions[word]:
+                emit(i, info)
 
-        tasks = [generate_single(word) for word in words]
-        return await asyncio.gather(*tasks)
+        async def generate_chunk(chunk: List[str]) -> None:
+            try:
+                async with semaphore:
+                    generated = await self._generate_batch(chunk, resolved_provider)
+
+                for word, info in generated.items():
+                    self._cache_put(self._cache_key(resolved_provider, word), info)
+                    for i in positions[word]:
+                        emit(i, info)
+
+                # Fall back to one request per word the batch response left out
+                missing = [word for word in chunk if word not in generated]
+                await asyncio.gather(*(generate_single(word) for word in missing))
+            except Exception as e:
+                # Whatever fails, every position of the chunk must get a
+                # result, or the generator below would wait forever
+                for word in chunk:
+                    for i in positions[word]:
+                        emit(i, failed(words[i], e))
+
+        unique_words = list(positions)
+        tasks = [
+            asyncio.create_task(generate_chunk(unique_words[i:i + BATCH_SIZE]))
+            for i in range(0, len(unique_words), BATCH_SIZE)
+        ]
+        try:
+            for _ in range(sum(len(indexes) for indexes in positions.values())):
+                yield await ready.get()
+        finally:
+            for task in tasks:
+                task.cancel()
 
     def validate_word(self, word: str) -> Tuple[bool, str]:
         """
@@ -535,7 +946,7 @@ class AIWordService:
             return False, "單字長度至少需要2個字符"
 
         # Check for basic English word pattern
-        if not word.replace("-", "").replace("'", "").isalpha():
+        if not word.translate(_WORD_PUNCTUATION_TABLE).isalpha():
             return False, "請輸入有效的英文單字（只能包含字母、連字號和撇號）"
 
         # Check for common non-words
@@ -549,6 +960,27 @@ class AIWordService:
 ai_word_service = AIWordService()
 
 
+def get_ai_word_service() -> AIWordService:
+    """
+    Get the global AIWordService.
+
+    The services package exports this function rather than the instance:
+    a package attribute named ai_word_service would be replaced by this
+    submodule as soon as it is imported.
+
+    Returns:
+        Shared AIWordService instance
+    """
+    return ai_word_service
+
+
+@atexit.register
+def _close_background_session() -> None:
+    """Close the session the sync wrappers opened on the background loop."""
+    if loop_thread.is_started():
+        run_coro_sync(ai_word_service.close(), timeout=5)
+
+
 # Convenience functions
 def generate_word_info(word: str, provider: str = None) -> WordInfo:
     """Generate word information synchronously."""
@@ -8,13 +8,23 @@ Contains 370,000+ English words for autocomplete functionality.
 """
 
 import os
-from typing import List, Dict, Any
+from array import array
+from itertools import accumulate
+from typing import List, Dict, Any, Tuple
 import bisect
 
+# Every word starting with a prefix sorts before the prefix followed by
+# this byte, which never occurs in UTF-8 text
+_MAX_BYTE = b'\xff'
+
 
 class EnglishWordsService:
     """
     Service for providing English word suggestions from the dwyl/english-words dataset.
+
+    The sorted words are stored as one newline-separated UTF-8 buffer plus
+    an array of start offsets, instead of 370k separate str objects; only
+    the words returned to callers are decoded.
     """
 
     def __init__(self, words_file_path: str = "words_alpha.txt"):
@@ -25,8 +35,13 @@ class EnglishWordsService:
             words_file_path: Path to the words file
         """
         self.words_file_path = words_file_path
-        self._words = []
+        self._blob = b''
+        # Start offset of each word in self._blob, plus the end of the buffer
+        self._offsets = array('I', [0])
         self._loaded = False
+        # Two-character prefix -> (start, end) range of word indexes, filled
+        # in as prefixes are first queried
+        self._prefix_ranges: Dict[bytes, Tuple[int, int]] = {}
 
     def _load_words(self) -> None:
         """
@@ -37,24 +52,34 @@ class EnglishWordsService:
 
         if not os.path.exists(self.words_file_path):
             print(f"Warning: English words file not found at {self.words_file_path}")
-            self._words = []
             self._loaded = True
             return
 
         try:
-            with open(self.words_file_path, 'r', encoding='utf-8') as f:
-                self._words = [line.strip().lower() for line in f if line.strip()]
+            # One word per line: lowercase and split the whole file at once
+            # rather than stripping each line in Python
+            with open(self.words_file_path, 'rb') as f:
+                words = f.read().lower().split()
 
             # Sort words for binary search optimization
-            self._words.sort()
+            words.sort()
+            self._blob = b'\n'.join(words) + b'\n' if words else b''
+            self._offsets = array('I', accumulate((len(word) + 1 for word in words), initial=0))
             self._loaded = True
-            print(f"Loaded {len(self._words)} English words")
+            print(f"Loaded {len(words)} English words")
 
         except Exception as e:
             print(f"Error loading English words: {e}")
-            self._words = []
             self._loaded = True
 
+    def _word_at(self, index: int) -> bytes:
+        """Get the encoded word at an index of the sorted list."""
+        return self._blob[self._offsets[index]:self._offsets[index + 1] - 1]
+
+    def _bisect(self, key: bytes, low: int, high: int) -> int:
+        """Find the first word index in [low, high) whose word is not less than key."""
+        return bisect.bisect_left(range(len(self._offsets) - 1), key, low, high, key=self._word_at)
+
     def get_suggestions(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get English word suggestions for autocomplete.
@@ -71,34 +96,48 @@ class EnglishWordsService:
 
         self._load_words()
 
-        if not self._words:
+        if not self._blob:
             return []
 
         query_lower = query.lower()
-        suggestions = []
+        query_bytes = query_lower.encode('utf-8')
+
+        # Find the run of words that start with the query using binary search
+        # within the block of words sharing its first two characters
+        low, high = self._prefix_range(query_lower[:2].encode('utf-8'))
+        start_index = self._bisect(query_bytes, low, high)
+        end_index = self._bisect(query_bytes + _MAX_BYTE, start_index, high)
 
-        # Find words that start with the query using binary search
-        start_index = bisect.bisect_left(self._words, query_lower)
-
-        # Collect words that start with the query
-        for i in range(start_index, min(start_index + limit * 2, len(self._words))):
-            word = self._words[i]
-            if word.startswith(query_lower):
-                suggestions.append({
-                    'word': word,
-                    'display_text': word,
-                    'match_type': 'starts_with',
-                    'source': 'english_dictionary'
-                })
-
-                if len(suggestions) >= limit:
-                    break
-            else:
-                # Since words are sorted, we can break when we no longer find matches
-                break
+        suggestions = []
+        for i in range(start_index, min(end_index, start_index + limit)):
+            word = self._word_at(i).decode('utf-8')
+            suggestions.append({
+                'word': word,
+                'display_text': word,
+                'match_type': 'starts_with',
+                'source': 'english_dictionary'
+            })
 
         return suggestions
 
+    def _prefix_range(self, prefix: bytes) -> Tuple[int, int]:
+        """
+        Get the range of word indexes starting with a short prefix.
+
+        Args:
+            prefix: Encoded lowercase prefix (two characters)
+
+        Returns:
+            Tuple of (start, end) word indexes
+        """
+        bounds = self._prefix_ranges.get(prefix)
+        if bounds is None:
+            count = len(self._offsets) - 1
+            start = self._bisect(prefix, 0, count)
+            end = self._bisect(prefix + _MAX_BYTE, start, count)
+            bounds = self._prefix_ranges[prefix] = (start, end)
+        return bounds
+
     def is_valid_word(self, word: str) -> bool:
         """
         Check if a word exists in the English dictionary.
@@ -114,10 +153,14 @@ class EnglishWordsService:
 
         self._load_words()
 
-        if not self._words:
+        if not self._blob:
             return False
 
-        return word.lower() in self._words
+        # Binary search the sorted words instead of scanning them
+        word_bytes = word.lower().encode('utf-8')
+        count = len(self._offsets) - 1
+        index = self._bisect(word_bytes, 0, count)
+        return index < count and self._word_at(index) == word_bytes
 
     def get_word_count(self) -> int:
         """
@@ -127,4 +170,4 @@ class EnglishWordsService:
             Number of words
         """
         self._load_words()
-        return len(self._words)
+        return len(self._offsets) - 1
@@ -0,0 +1,64 @@
+"""
+Shared background event loop for calling async services from sync code.
+
+Flask views run synchronously. Instead of creating and tearing down an
+event loop with asyncio.run() on every call, coroutines are submitted to
+one long-lived loop running in a daemon thread, so loop-bound resources
+such as aiohttp sessions survive between requests.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background event loop, starting its thread on first use.
+
+    Returns:
+        The running background loop
+    """
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="async-services-loop", daemon=True)
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def is_started() -> bool:
+    """Check whether the background loop has been started."""
+    return _loop is not None
+
+
+def run_coro_sync(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the background loop and wait for its result.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait for the result (optional)
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        RuntimeError: If called from the background loop itself
+        Exception: Whatever the coroutine raises
+    """
+    loop = get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_coro_sync() cannot be called from the background loop")
+
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
@@ -0,0 +1,169 @@
+"""
+Append-only operation log for vocabulary data.
+
+Each mutation is appended to a JSONL file next to the vocabulary snapshot
+instead of rewriting the whole snapshot. Loading reads the snapshot and
+replays the log; compaction folds the log back into the snapshot.
+"""
+
+import os
+from datetime import datetime
+from typing import Any, Dict, List
+
+import orjson
+
+from models.vocabulary import Word, VocabularyData
+
+# Operation types
+OP_ADD = 'add'
+OP_UPDATE = 'update'
+OP_REMOVE = 'remove'
+
+
+def wal_path_for(data_file_path: str) -> str:
+    """
+    Get the operation log path for a vocabulary data file.
+
+    Args:
+        data_file_path: Path to the JSON snapshot
+
+    Returns:
+        Path to the JSONL operation log
+    """
+    return data_file_path + '.wal.jsonl'
+
+
+def make_op(op: str, word: Word = None, word_id: str = None) -> Dict[str, Any]:
+    """
+    Build an operation record.
+
+    Args:
+        op: Operation type (OP_ADD, OP_UPDATE or OP_REMOVE)
+        word: Word for add/update operations
+        word_id: Word ID for remove operations
+
+    Returns:
+        Operation dictionary ready to append
+    """
+    record = {'op': op, 'ts': datetime.now().isoformat()}
+    if word is not None:
+        record['word'] = word._as_dict()
+    if word_id is not None:
+        record['id'] = word_id
+    return record
+
+
+def append_ops(path: str, ops: List[Dict[str, Any]]) -> None:
+    """
+    Append operations to the log with a single write and fsync.
+
+    A torn final line left by a crash mid-append is cut off first, so the
+    new entries start on a line of their own instead of merging with it.
+
+    Args:
+        path: Operation log path
+        ops: Operation dictionaries to append
+
+    Raises:
+        IOError: If the log cannot be written
+    """
+    if not ops:
+        return
+
+    payload = b''.join(orjson.dumps(op) + b'\n' for op in ops)
+    with open(path, 'a+b') as f:
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b'\n':
+                f.seek(0)
+                f.truncate(f.read().rfind(b'\n') + 1)
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_ops(path: str) -> List[Dict[str, Any]]:
+    """
+    Read all operations from the log.
+
+    A torn final line (from a crash mid-append) is ignored.
+
+    Args:
+        path: Operation log path
+
+    Returns:
+        List of operation dictionaries
+    """
+    try:
+        with open(path, 'rb') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return []
+
+    ops = []
+    for i, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            ops.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            if i == len(lines) - 1:
+                break
+            raise ValueError(f"Invalid operation log entry at line {i + 1}")
+    return ops
+
+
+def apply_op(vocab_data: VocabularyData, op: Dict[str, Any]) -> None:
+    """
+    Apply one operation to vocabulary data.
+
+    Adds and updates are upserts and removes of unknown IDs are ignored, so
+    replaying a log that was already folded into the snapshot is harmless.
+
+    Args:
+        vocab_data: VocabularyData to mutate
+        op: Operation dictionary
+    """
+    kind = op.get('op')
+    if kind in (OP_ADD, OP_UPDATE):
+        word = Word.from_dict(op['word'])
+        if not vocab_data.replace_word(word):
+            vocab_data.add_word(word)
+    elif kind == OP_REMOVE:
+        vocab_data.remove_word(op['id'])
+    else:
+        raise ValueError(f"Unknown operation type: {kind}")
+
+
+def replay(vocab_data: VocabularyData, path: str) -> int:
+    """
+    Replay the operation log onto vocabulary data.
+
+    Args:
+        vocab_data: VocabularyData loaded from the snapshot
+        path: Operation log path
+
+    Returns:
+        Number of operations replayed
+    """
+    ops = read_ops(path)
+    for op in ops:
+        apply_op(vocab_data, op)
+
+    if ops and 'ts' in ops[-1]:
+        vocab_data.metadata['last_updated'] = ops[-1]['ts']
+
+    return len(ops)
+
+
+def truncate(path: str) -> None:
+    """
+    Empty the operation log after its contents were compacted.
+
+    Args:
+        path: Operation log path
+    """
+    if os.path.exists(path):
+        with open(path, 'wb'):
+            pass
@@ -3,12 +3,17 @@ Vocabulary service for managing word data operations.
 This service handles CRUD operations and business logic for vocabulary management.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
-import json
+import bisect
 import os
+import threading
+
+import orjson
 
 from models.vocabulary import Word, VocabularyData
+from models.json_serializer import VocabularyJSONSerializer
+from services import vocab_wal
 
 # Time filter constants
 TIME_FILTERS = {
@@ -20,6 +25,14 @@ TIME_FILTERS = {
     'all': None  # Show all words
 }
 
+# Time window of each filter except 'all', built once for the date lookups
+_FILTER_WINDOWS = {key: timedelta(days=days) for key, days in TIME_FILTERS.items() if days is not None}
+
+# Number of logged operations after which the snapshot is rewritten.
+# Between compactions a mutation costs one fsynced append to the log
+# (a whole batch shares one), so writes are never deferred in memory.
+WAL_COMPACT_THRESHOLD = 200
+
 TIME_FILTER_LABELS = {
     'recent_3_days': '近三天',
     'recent_week': '近一週',
@@ -44,6 +57,17 @@ class VocabularyService:
             data_file_path: Path to the JSON data file
         """
         self.data_file_path = data_file_path
+        self.wal_file_path = vocab_wal.wal_path_for(data_file_path)
+        self._wal_op_count = 0
+        # Loaded data is kept until the snapshot or log changes on disk;
+        # the signature is (mtime_ns, size) of both files
+        self._cache: Optional[VocabularyData] = None
+        self._cache_signature = None
+        # Cached words newest first, plus their creation dates oldest first
+        # for bisecting; rebuilt after the data changes
+        self._by_date: Optional[Tuple[List[Word], List[datetime]]] = None
+        # Serializes mutations of the shared cached data between request threads
+        self._lock = threading.RLock()
         self._ensure_data_file_exists()
 
     def _ensure_data_file_exists(self) -> None:
@@ -59,6 +83,74 @@ class VocabularyService:
             self._save_data(empty_data)
 
     def _load_data(self) -> VocabularyData:
+        """
+        Load vocabulary data from the JSON snapshot and replay the operation log.
+
+        The result is cached in memory and only reloaded when either file is
+        changed by something other than this service.
+
+        Returns:
+            VocabularyData instance
+        """
+        with self._lock:
+            signature = self._file_signature()
+            if self._cache is None or signature != self._cache_signature:
+                vocab_data = self._load_snapshot()
+                self._wal_op_count = vocab_wal.replay(vocab_data, self.wal_file_path)
+                self._cache = vocab_data
+                self._cache_signature = signature
+                self._by_date = None
+            return self._cache
+
+    def _file_signature(self) -> tuple:
+        """
+        Get the modification time and size of the snapshot and the log.
+
+        Returns:
+            Tuple with an (mtime_ns, size) pair, or None if missing, per file
+        """
+        signature = []
+        for path in (self.data_file_path, self.wal_file_path):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    def _remember_written(self, vocab_data: VocabularyData) -> None:
+        """
+        Mark data this service just wrote as the current cache.
+
+        Args:
+            vocab_data: Data matching the files on disk
+        """
+        self._cache = vocab_data
+        self._cache_signature = self._file_signature()
+        self._by_date = None
+
+    def _invalidate_cache(self) -> None:
+        """Drop the cached data so the next access reloads it from disk."""
+        self._cache = None
+        self._cache_signature = None
+        self._by_date = None
+
+    def _date_index(self) -> Tuple[List[Word], List[datetime]]:
+        """
+        Get the words sorted by creation date.
+
+        Returns:
+            Tuple of (words newest first, creation dates oldest first)
+        """
+        with self._lock:
+            vocab_data = self._load_data()
+            if self._by_date is None:
+                newest_first = sorted(vocab_data.vocabulary, key=lambda w: w.created_date, reverse=True)
+                self._by_date = (newest_first, [word.created_date for word in reversed(newest_first)])
+            return self._by_date
+
+    def _load_snapshot(self) -> VocabularyData:
         """
         Load vocabulary data from JSON file.
 
@@ -66,21 +158,24 @@ class VocabularyService:
             VocabularyData instance
 
         Raises:
-            FileNotFoundError: If data file doesn't exist
-            json.JSONDecodeError: If JSON is invalid
+            ValueError: If JSON is invalid
         """
         try:
-            with open(self.data_file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if not content:
-                    # Empty file, return empty data
-                    return VocabularyData()
-                data = json.loads(content)
-                return VocabularyData.from_dict(data)
+            # orjson parses the UTF-8 bytes directly, without decoding to str first
+            with open(self.data_file_path, 'rb') as f:
+                content = f.read()
+            if not content or content.isspace():
+                # Empty file, return empty data
+                return VocabularyData()
+            data = orjson.loads(content)
+            # Release the raw text before the Word objects are built, so the
+            # file contents, the parsed dicts and the words never all peak together
+            del content
+            return VocabularyData.from_dict(data)
         except FileNotFoundError:
             # Return empty data if file doesn't exist
             return VocabularyData()
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format in data file: {e}")
 
     def _save_data(self, vocab_data: VocabularyData) -> None:
@@ -93,21 +188,68 @@ class VocabularyService:
         Raises:
             IOError: If file cannot be written
         """
+        # Write to a temporary file and swap it in, so a crash mid-write
+        # leaves the previous snapshot intact
+        temp_path = self.data_file_path + '.tmp'
         try:
-            with open(self.data_file_path, 'w', encoding='utf-8') as f:
-                json.dump(vocab_data.to_dict(), f, ensure_ascii=False, indent=2)
+            with open(temp_path, 'wb') as f:
+                VocabularyJSONSerializer.dump_vocabulary_data(vocab_data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.data_file_path)
         except IOError as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             raise IOError(f"Cannot write to data file: {e}")
 
+    def _append_ops(self, vocab_data: VocabularyData, ops: List[Dict[str, Any]]) -> None:
+        """
+        Record mutations in the operation log, compacting when it grows large.
+
+        Args:
+            vocab_data: VocabularyData with the operations already applied
+            ops: Operation dictionaries to append
+
+        Raises:
+            IOError: If the log or snapshot cannot be written
+        """
+        try:
+            vocab_wal.append_ops(self.wal_file_path, ops)
+        except IOError as e:
+            # The cached data already contains the unlogged changes
+            self._invalidate_cache()
+            raise IOError(f"Cannot write to operation log: {e}")
+
+        self._wal_op_count += len(ops)
+        self._remember_written(vocab_data)
+        if self._wal_op_count >= WAL_COMPACT_THRESHOLD:
+            self.compact(vocab_data)
+
+    def compact(self, vocab_data: Optional[VocabularyData] = None) -> None:
+        """
+        Fold the operation log into the JSON snapshot and empty the log.
+
+        Args:
+            vocab_data: Current data (loaded from disk if omitted)
+        """
+        with self._lock:
+            if vocab_data is None:
+                vocab_data = self._load_data()
+
+            self._save_data(vocab_data)
+            vocab_wal.truncate(self.wal_file_path)
+            self._wal_op_count = 0
+            self._remember_written(vocab_data)
+
     def get_all_words(self) -> List[Word]:
         """
         Get all vocabulary words.
 
         Returns:
-            List of Word instances
+            New list of the Word instances, safe to reorder or extend
         """
         vocab_data = self._load_data()
-        return vocab_data.vocabulary
+        return list(vocab_data.vocabulary)
 
     def get_word_by_id(self, word_id: str) -> Optional[Word]:
         """
@@ -140,14 +282,15 @@ class VocabularyService:
         if validation_errors:
             raise ValueError(f"Word validation failed: {', '.join(validation_errors)}")
 
-        # Check for duplicate words
-        if self.word_exists(word.word):
-            raise ValueError(f"Word '{word.word}' already exists")
+        with self._lock:
+            # Check for duplicate words
+            if self.word_exists(word.word):
+                raise ValueError(f"Word '{word.word}' already exists")
 
-        # Load current data, add word, and save
-        vocab_data = self._load_data()
-        vocab_data.add_word(word)
-        self._save_data(vocab_data)
+            # Load current data, add word, and save
+            vocab_data = self._load_data()
+            vocab_data.add_word(word)
+            self._append_ops(vocab_data, [vocab_wal.make_op(vocab_wal.OP_ADD, word=word)])
 
         return word
 
@@ -179,40 +322,47 @@ class VocabularyService:
                 'duplicate_words': []
             }
 
-        vocab_data = self._load_data()
-        successful_words = []
-        failed_words = []
-        duplicate_words = []
-
-        for word in words:
-            try:
-                # Validate word data
-                validation_errors = word.validate()
-                if validation_errors:
+        with self._lock:
+            vocab_data = self._load_data()
+            successful_words = []
+            failed_words = []
+            duplicate_words = []
+            # Lowercased texts accepted so far in this batch
+            batch_keys = set()
+
+            for word in words:
+                try:
+                    # Validate word data
+                    validation_errors = word.validate()
+                    if validation_errors:
+                        failed_words.append({
+                            'word': word.word,
+                            'error': f"Validation failed: {', '.join(validation_errors)}"
+                        })
+                        continue
+
+                    # Check for duplicate words (both in existing data and current batch)
+                    key = word.word.lower()
+                    if key in batch_keys or vocab_data.has_word(key):
+                        duplicate_words.append(word.word)
+                        continue
+
+                    # Add word to batch
+                    batch_keys.add(key)
+                    successful_words.append(word)
+
+                except Exception as e:
                     failed_words.append({
                         'word': word.word,
-                        'error': f"Validation failed: {', '.join(validation_errors)}"
+                        'error': str(e)
                     })
-                    continue
-
-                # Check for duplicate words (both in existing data and current batch)
-                if self.word_exists(word.word) or any(w.word.lower() == word.word.lower() for w in successful_words):
-                    duplicate_words.append(word.word)
-                    continue
 
-                # Add word to batch
-                vocab_data.add_word(word)
-                successful_words.append(word)
-
-            except Exception as e:
-                failed_words.append({
-                    'word': word.word,
-                    'error': str(e)
-                })
-
-        # Save all successful words at once
-        if successful_words:
-            self._save_data(vocab_data)
+            # Add and log all successful words at once
+            if successful_words:
+                vocab_data.bulk_add(successful_words)
+                self._append_ops(vocab_data, [
+                    vocab_wal.make_op(vocab_wal.OP_ADD, word=word) for word in successful_words
+                ])
 
         return {
             'success_count': len(successful_words),
@@ -237,22 +387,26 @@ class VocabularyService:
         Raises:
             ValueError: If validation fails
         """
-        vocab_data = self._load_data()
-        word = vocab_data.find_word_by_id(word_id)
+        with self._lock:
+            vocab_data = self._load_data()
+            word = vocab_data.find_word_by_id(word_id)
 
-        if not word:
-            return None
+            if not word:
+                return None
 
-        # Update fields
-        word.update_fields(**kwargs)
+            # Update fields
+            word.update_fields(**kwargs)
+            vocab_data.reindex_word(word)
 
-        # Validate updated word
-        validation_errors = word.validate()
-        if validation_errors:
-            raise ValueError(f"Word validation failed: {', '.join(validation_errors)}")
+            # Validate updated word
+            validation_errors = word.validate()
+            if validation_errors:
+                # The cached word was already changed; reload it from disk next time
+                self._invalidate_cache()
+                raise ValueError(f"Word validation failed: {', '.join(validation_errors)}")
 
-        # Save updated data
-        self._save_data(vocab_data)
+            # Log updated word
+            self._append_ops(vocab_data, [vocab_wal.make_op(vocab_wal.OP_UPDATE, word=word)])
 
         return word
 
@@ -266,11 +420,12 @@ class VocabularyService:
         Returns:
             True if word was deleted, False if not found
         """
-        vocab_data = self._load_data()
-        success = vocab_data.remove_word(word_id)
+        with self._lock:
+            vocab_data = self._load_data()
+            success = vocab_data.remove_word(word_id)
 
-        if success:
-            self._save_data(vocab_data)
+            if success:
+                self._append_ops(vocab_data, [vocab_wal.make_op(vocab_wal.OP_REMOVE, word_id=word_id)])
 
         return success
 
@@ -285,7 +440,7 @@ class VocabularyService:
             True if word exists, False otherwise
         """
         vocab_data = self._load_data()
-        return any(w.word.lower() == word.lower() for w in vocab_data.vocabulary)
+        return vocab_data.has_word(word)
 
     def search_words(self, query: str) -> List[Word]:
         """
@@ -303,15 +458,10 @@ class VocabularyService:
         vocab_data = self._load_data()
         query_lower = query.lower()
 
-        matching_words = []
-        for word in vocab_data.vocabulary:
-            # Search in word, Chinese meaning, and English meaning
-            if (query_lower in word.word.lower() or
-                query_lower in word.chinese_meaning.lower() or
-                query_lower in word.english_meaning.lower()):
-                matching_words.append(word)
-
-        return matching_words
+        # Search in word, Chinese meaning, and English meaning, using the
+        # lowercased text each Word keeps instead of lowercasing per query.
+        # A plain substring test beats a compiled re.escape() pattern here.
+        return [word for word in vocab_data.vocabulary if query_lower in word.search_text()]
 
     def get_autocomplete_suggestions(self, query: str, limit: int = 10) -> List[Dict[str, str]]:
         """
@@ -406,24 +556,16 @@ class VocabularyService:
         Returns:
             List of Word instances within the time range
         """
-        vocab_data = self._load_data()
+        newest_first, dates = self._date_index()
 
         # If 'all' or invalid filter, return all words
-        if time_filter == 'all' or time_filter not in TIME_FILTERS:
-            filtered_words = vocab_data.vocabulary
-        else:
-            days = TIME_FILTERS[time_filter]
-            cutoff_date = datetime.now() - timedelta(days=days)
-
-            filtered_words = [
-                word for word in vocab_data.vocabulary
-                if word.created_date >= cutoff_date
-            ]
-
-        # Sort by creation date (newest first)
-        filtered_words.sort(key=lambda w: w.created_date, reverse=True)
+        window = _FILTER_WINDOWS.get(time_filter)
+        if window is None:
+            return list(newest_first)
 
-        return filtered_words
+        # Words on or after the cutoff are the head of the newest-first list
+        cutoff_date = datetime.now() - window
+        return newest_first[:len(dates) - bisect.bisect_left(dates, cutoff_date)]
 
     def get_total_word_count(self) -> int:
         """
@@ -442,21 +584,16 @@ class VocabularyService:
         Returns:
             Dictionary with time filter keys and word counts
         """
-        vocab_data = self._load_data()
+        _, dates = self._date_index()
         now = datetime.now()
         stats = {}
 
-        # Calculate count for each time range
-        for filter_key, days in TIME_FILTERS.items():
-            if days is None:  # 'all' filter
-                continue
-            cutoff_date = now - timedelta(days=days)
-            count = sum(1 for word in vocab_data.vocabulary
-                       if word.created_date >= cutoff_date)
-            stats[filter_key] = count
+        # Count the words on or after each cutoff by bisecting the sorted dates
+        for filter_key, window in _FILTER_WINDOWS.items():
+            stats[filter_key] = len(dates) - bisect.bisect_left(dates, now - window)
 
         # Add total count
-        stats['all'] = len(vocab_data.vocabulary)
+        stats['all'] = len(dates)
 
         return stats
 
@@ -471,17 +608,13 @@ class VocabularyService:
         Returns:
             List of Word instances within the date range
         """
-        vocab_data = self._load_data()
-
-        filtered_words = [
-            word for word in vocab_data.vocabulary
-            if start_date <= word.created_date <= end_date
-        ]
-
-        # Sort by creation date (newest first)
-        filtered_words.sort(key=lambda w: w.created_date, reverse=True)
+        newest_first, dates = self._date_index()
 
-        return filtered_words
+        # Both bounds are inclusive; positions in the newest-first list
+        # mirror positions in the oldest-first dates
+        start = len(dates) - bisect.bisect_right(dates, end_date)
+        end = len(dates) - bisect.bisect_left(dates, start_date)
+        return newest_first[start:end]
 
     def get_learning_progress_stats(self) -> Dict[str, Any]:
         """
@@ -492,25 +625,34 @@ class VocabularyService:
         """
         vocab_data = self._load_data()
         now = datetime.now()
+        today = now.date()
+        week = timedelta(weeks=1)
 
-        # Calculate daily stats for the last 30 days
-        daily_stats = {}
-        for i in range(30):
-            date = now - timedelta(days=i)
-            date_str = date.strftime('%Y-%m-%d')
-            count = sum(1 for word in vocab_data.vocabulary
-                       if word.created_date.date() == date.date())
-            daily_stats[date_str] = count
-
-        # Calculate weekly stats for the last 12 weeks
-        weekly_stats = {}
-        for i in range(12):
-            week_start = now - timedelta(weeks=i+1)
-            week_end = now - timedelta(weeks=i)
-            week_key = f"Week {i+1}"
-            count = sum(1 for word in vocab_data.vocabulary
-                       if week_start <= word.created_date <= week_end)
-            weekly_stats[week_key] = count
+        # Bucket every word in one pass: by days since its creation date
+        # for the last 30 days, and by whole weeks of age for the last 12
+        daily_counts = [0] * 30
+        weekly_counts = [0] * 12
+        for word in vocab_data.vocabulary:
+            days_ago = (today - word.created_date.date()).days
+            if 0 <= days_ago < 30:
+                daily_counts[days_ago] += 1
+
+            age = now - word.created_date
+            if age < timedelta(0):
+                continue
+            weeks_ago = age // week
+            if weeks_ago < 12:
+                weekly_counts[weeks_ago] += 1
+            # Week ranges include both ends, so a word exactly on a
+            # boundary belongs to the newer week as well
+            if age == weeks_ago * week and 0 < weeks_ago <= 12:
+                weekly_counts[weeks_ago - 1] += 1
+
+        daily_stats = {
+            (today - timedelta(days=i)).strftime('%Y-%m-%d'): daily_counts[i]
+            for i in range(30)
+        }
+        weekly_stats = {f"Week {i+1}": weekly_counts[i] for i in range(12)}
 
         return {
             'daily_stats': daily_stats,
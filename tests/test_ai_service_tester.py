@@ -4,67 +4,72 @@ Unit tests for AI service testing functionality.
 
 import unittest
 from unittest.mock import patch, AsyncMock
+from services import ai_service_tester
 from services.ai_service_tester import AIServiceTester, validate_key_format
 
 
-class TestAIServiceTester(unittest.TestCase):
-    """Test cases for AIServiceTester."""
+class _FakeResponse:
+    """Minimal aiohttp response stand-in, usable as an async context manager."""
 
-    def test_validate_openai_key_format(self):
-        """Test OpenAI key format validation."""
-        # Valid key
-        valid_key = "sk-" + "a" * 48  # 51 characters total
-        success, message = validate_key_format("openai", valid_key)
-        self.assertTrue(success)
-        self.assertIn("格式正確", message)
+    def __init__(self, status):
+        self.status = status
 
-        # Invalid prefix
-        invalid_prefix = "ak-" + "a" * 48
-        success, message = validate_key_format("openai", invalid_prefix)
-        self.assertFalse(success)
-        self.assertIn("sk-", message)
+    async def __aenter__(self):
+        return self
 
-        # Too short
-        too_short = "sk-abc"
-        success, message = validate_key_format("openai", too_short)
-        self.assertFalse(success)
-        self.assertIn("長度不足", message)
+    async def __aexit__(self, *exc_info):
+        return False
 
-        # Empty key
-        success, message = validate_key_format("openai", "")
-        self.assertFalse(success)
-        self.assertIn("格式不正確", message)
+    async def text(self):
+        return ""
 
-    def test_validate_gemini_key_format(self):
-        """Test Gemini key format validation."""
-        # Valid key (39 characters)
-        valid_key = "AIzaSy" + "a" * 33  # 39 characters total
-        success, message = validate_key_format("gemini", valid_key)
-        self.assertTrue(success)
-        self.assertIn("格式正確", message)
 
-        # Invalid prefix
-        invalid_prefix = "AIzaBy" + "a" * 33
-        success, message = validate_key_format("gemini", invalid_prefix)
-        self.assertFalse(success)
-        self.assertIn("AIzaSy", message)
+class _FakeSession:
+    """Session stand-in whose post() always answers with one status."""
 
-        # Wrong length
-        wrong_length = "AIzaSy" + "a" * 20  # Too short
-        success, message = validate_key_format("gemini", wrong_length)
-        self.assertFalse(success)
-        self.assertIn("長度不正確", message)
+    def __init__(self, status):
+        self.status = status
+        self.urls = []
 
-        # Invalid characters
-        invalid_chars = "AIzaSy" + "!" * 33
-        success, message = validate_key_format("gemini", invalid_chars)
-        self.assertFalse(success)
-        self.assertIn("無效字符", message)
+    def post(self, url, **kwargs):
+        self.urls.append(url)
+        return _FakeResponse(self.status)
 
-        # Empty key
-        success, message = validate_key_format("gemini", "")
-        self.assertFalse(success)
-        self.assertIn("格式不正確", message)
+
+class TestAIServiceTester(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AIServiceTester."""
+
+    async def asyncTearDown(self):
+        """Close the shared session opened on this test's loop."""
+        await AIServiceTester.aclose()
+
+    def _check_key_formats(self, provider, cases):
+        """Check each (key, expected success, expected message part) case separately."""
+        for key, expected_ok, expected_text in cases:
+            with self.subTest(key=key):
+                success, message = validate_key_format(provider, key)
+                self.assertEqual(success, expected_ok)
+                self.assertIn(expected_text, message)
+
+    def test_validate_openai_key_format(self):
+        """Test OpenAI key format validation."""
+        self._check_key_formats("openai", [
+            ("sk-" + "a" * 48, True, "格式正確"),      # Valid key (51 characters)
+            ("ak-" + "a" * 48, False, "sk-"),          # Invalid prefix
+            ("sk-abc", False, "長度不足"),              # Too short
+            ("sk-" + "!" * 48, False, "無效字符"),      # Invalid characters
+            ("", False, "格式不正確"),                  # Empty key
+        ])
+
+    def test_validate_gemini_key_format(self):
+        """Test Gemini key format validation."""
+        self._check_key_formats("gemini", [
+            ("AIzaSy" + "a" * 33, True, "格式正確"),    # Valid key (39 characters)
+            ("AIzaBy" + "a" * 33, False, "AIzaSy"),     # Invalid prefix
+            ("AIzaSy" + "a" * 20, False, "長度不正確"),  # Wrong length
+            ("AIzaSy" + "!" * 33, False, "無效字符"),    # Invalid characters
+            ("", False, "格式不正確"),                   # Empty key
+        ])
 
     def test_validate_invalid_provider(self):
         """Test validation with invalid provider."""
@@ -72,84 +77,103 @@ class TestAIServiceTester(unittest.TestCase):
         self.assertFalse(success)
         self.assertIn("不支援的提供商", message)
 
-    @patch('aiohttp.ClientSession.post')
-    async def test_openai_connection_success(self, mock_post):
+    async def test_openai_connection_success(self):
         """Test successful OpenAI connection."""
-        # Mock successful response
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_post.return_value.__aenter__.return_value = mock_response
+        session = _FakeSession(200)
 
         valid_key = "sk-" + "a" * 48
-        success, message = await AIServiceTester.test_openai_connection(valid_key, "gpt-5-nano")
+        success, message = await AIServiceTester.test_openai_connection(valid_key, "gpt-5-nano", session=session)
 
         self.assertTrue(success)
         self.assertIn("連線成功", message)
         self.assertIn("gpt-5-nano", message)
+        self.assertEqual(session.urls, ["https://api.openai.com/v1/chat/completions"])
 
-    @patch('aiohttp.ClientSession.post')
-    async def test_openai_connection_invalid_key(self, mock_post):
+    async def test_openai_connection_invalid_key(self):
         """Test OpenAI connection with invalid key."""
-        # Mock 401 response
-        mock_response = AsyncMock()
-        mock_response.status = 401
-        mock_post.return_value.__aenter__.return_value = mock_response
+        session = _FakeSession(401)
 
         valid_key = "sk-" + "a" * 48
-        success, message = await AIServiceTester.test_openai_connection(valid_key)
+        success, message = await AIServiceTester.test_openai_connection(valid_key, session=session)
 
         self.assertFalse(success)
         self.assertIn("無效或已過期", message)
 
-    @patch('aiohttp.ClientSession.post')
-    async def test_gemini_connection_success(self, mock_post):
+    async def test_gemini_connection_success(self):
         """Test successful Gemini connection."""
-        # Mock successful response
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_post.return_value.__aenter__.return_value = mock_response
+        session = _FakeSession(200)
 
         valid_key = "AIzaSy" + "a" * 33
-        success, message = await AIServiceTester.test_gemini_connection(valid_key, "gemini-2.5-flash-pro")
+        success, message = await AIServiceTester.test_gemini_connection(valid_key, "gemini-2.5-flash-pro", session=session)
 
         self.assertTrue(success)
         self.assertIn("連線成功", message)
         self.assertIn("gemini-2.5-flash-pro", message)
+        self.assertIn("/models/gemini-2.5-flash-pro:generateContent", session.urls[0])
 
-    @patch('aiohttp.ClientSession.post')
-    async def test_gemini_connection_invalid_key(self, mock_post):
+    async def test_gemini_connection_invalid_key(self):
         """Test Gemini connection with invalid key."""
-        # Mock 403 response
-        mock_response = AsyncMock()
-        mock_response.status = 403
-        mock_post.return_value.__aenter__.return_value = mock_response
+        session = _FakeSession(403)
 
         valid_key = "AIzaSy" + "a" * 33
-        success, message = await AIServiceTester.test_gemini_connection(valid_key)
+        success, message = await AIServiceTester.test_gemini_connection(valid_key, session=session)
 
         self.assertFalse(success)
         self.assertIn("無效或無權限", message)
 
-    def test_invalid_key_format_openai(self):
-        """Test OpenAI connection with invalid key format."""
-        import asyncio
+    async def test_session_is_shared_per_loop(self):
+        """Test that connection tests reuse one session until it is closed."""
+        session = await AIServiceTester._get_session()
+        self.assertIs(await AIServiceTester._get_session(), session)
 
+        await AIServiceTester.aclose()
+        self.assertTrue(session.closed)
+        self.assertIsNot(await AIServiceTester._get_session(), session)
+
+    async def test_invalid_key_format_openai(self):
+        """Test OpenAI connection with invalid key format."""
         invalid_key = "invalid-key"
-        success, message = asyncio.run(AIServiceTester.test_openai_connection(invalid_key))
+        success, message = await AIServiceTester.test_openai_connection(invalid_key)
 
         self.assertFalse(success)
         self.assertIn("無效的 OpenAI API Key 格式", message)
 
-    def test_invalid_key_format_gemini(self):
+    async def test_invalid_key_format_gemini(self):
         """Test Gemini connection with invalid key format."""
-        import asyncio
-
         invalid_key = "invalid-key"
-        success, message = asyncio.run(AIServiceTester.test_gemini_connection(invalid_key))
+        success, message = await AIServiceTester.test_gemini_connection(invalid_key)
 
         self.assertFalse(success)
         self.assertIn("無效的 Gemini API Key 格式", message)
 
 
+class TestConnectionResultCache(unittest.TestCase):
+    """Test cases for caching test_connection_sync results."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        ai_service_tester._key_validation_cache.clear()
+        self.addCleanup(ai_service_tester._key_validation_cache.clear)
+
+    @patch('services.ai_service_tester.api_config')
+    def test_repeated_test_uses_cached_result(self, mock_config):
+        """Test that a successful live test is reused for the same key."""
+        mock_config.get_openai_api_key.return_value = "sk-" + "a" * 48
+        mock_config.get_openai_model.return_value = "gpt-5-nano"
+
+        with patch.object(AIServiceTester, 'test_openai_connection',
+                          AsyncMock(return_value=(True, "ok"))) as mock_test:
+            first = AIServiceTester.test_connection_sync("openai")
+            second = AIServiceTester.test_connection_sync("openai")
+
+            # A different key is tested again
+            mock_config.get_openai_api_key.return_value = "sk-" + "b" * 48
+            AIServiceTester.test_connection_sync("openai")
+
+        self.assertEqual(first, (True, "ok"))
+        self.assertEqual(second, (True, "ok"))
+        self.assertEqual(mock_test.await_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
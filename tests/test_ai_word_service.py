@@ -0,0 +1,298 @@
+"""
+Unit tests for the AI word generation service.
+"""
+
+import aiohttp
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+from services.ai_word_service import AIWordService, _retry_delay
+
+
+def _word_data(meaning):
+    """Build a minimal AI response entry for one word."""
+    return {
+        "chinese_meaning": meaning,
+        "english_meaning": "a test definition",
+        "phonetic": "/test/",
+        "example_sentence": "",
+        "synonyms": [],
+        "antonyms": []
+    }
+
+
+class TestBatchGenerate(unittest.TestCase):
+    """Test cases for AIWordService.batch_generate."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.service = AIWordService()
+        patcher = patch.object(AIWordService, '_resolve_provider', return_value="openai")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_words_share_one_request(self):
+        """Test that a batch is answered by a single request, in input order."""
+        response = {"apple": _word_data("蘋果"), "banana": _word_data("香蕉")}
+        with patch.object(self.service, '_request_openai_json',
+                          AsyncMock(return_value=response)) as mock_request:
+            results = asyncio.run(self.service.batch_generate(["Banana", "apple", "apple"]))
+
+        self.assertEqual(mock_request.await_count, 1)
+        self.assertEqual([info.chinese_meaning for info in results], ["香蕉", "蘋果", "蘋果"])
+
+    def test_missing_word_falls_back_to_single_request(self):
+        """Test that a word left out of the batch response is requested alone."""
+        responses = [{"apple": _word_data("蘋果")}, _word_data("香蕉")]
+        with patch.object(self.service, '_request_openai_json',
+                          AsyncMock(side_effect=responses)) as mock_request:
+            results = asyncio.run(self.service.batch_generate(["apple", "banana"]))
+
+        self.assertEqual(mock_request.await_count, 2)
+        self.assertEqual(results[1].chinese_meaning, "香蕉")
+
+    def test_invalid_and_failed_words_report_errors(self):
+        """Test that invalid words and failed requests yield error entries."""
+        with patch.object(self.service, '_request_openai_json',
+                          AsyncMock(side_effect=Exception("boom"))):
+            results = asyncio.run(self.service.batch_generate(["apple", "123"]))
+
+        self.assertIn("boom", results[0].chinese_meaning)
+        self.assertEqual(results[1].word, "123")
+        self.assertEqual(results[1].confidence_score, 0.0)
+
+    def test_iter_yields_every_position(self):
+        """Test that batch_generate_iter yields invalid words first and covers every input."""
+        response = {"apple": _word_data("蘋果"), "banana": _word_data("香蕉")}
+
+        async def collect():
+            return [pair async for pair in self.service.batch_generate_iter(["apple", "123", "banana", "apple"])]
+
+        with patch.object(self.service, '_request_openai_json', AsyncMock(return_value=response)):
+            pairs = asyncio.run(collect())
+
+        self.assertEqual(pairs[0][0], 1)
+        self.assertEqual(sorted(i for i, _ in pairs), [0, 1, 2, 3])
+        self.assertEqual(dict(pairs)[3].chinese_meaning, "蘋果")
+
+    def test_iter_finishes_when_a_task_fails_unexpectedly(self):
+        """Test that an error outside the request still yields a result for every word."""
+        response = {"apple": _word_data("蘋果"), "banana": _word_data("香蕉")}
+
+        async def collect():
+            return [pair async for pair in self.service.batch_generate_iter(["apple", "banana"])]
+
+        with patch.object(self.service, '_request_openai_json', AsyncMock(return_value=response)), \
+                patch.object(self.service, '_cache_put', side_effect=RuntimeError("cache broke")):
+            pairs = asyncio.run(asyncio.wait_for(collect(), timeout=5))
+
+        self.assertEqual(sorted(i for i, _ in pairs), [0, 1])
+        self.assertIn("cache broke", dict(pairs)[1].chinese_meaning)
+
+
+class TestPackageExports(unittest.TestCase):
+    """Test cases for the lazy services package exports."""
+
+    def test_shared_instance_after_submodule_import(self):
+        """Test that the package resolves the shared service after the submodule is imported."""
+        import services.ai_word_service as module
+        from services import get_ai_word_service
+
+        self.assertIs(get_ai_word_service(), module.ai_word_service)
+        self.assertIsInstance(get_ai_word_service(), AIWordService)
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for the generate_word_info result cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.service = AIWordService()
+        patcher = patch.object(AIWordService, '_resolve_provider', return_value="openai")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_repeated_word_is_served_from_cache(self):
+        """Test that a confident result is reused without another request."""
+        word_data = _word_data("蘋果")
+        word_data["example_sentence"] = "I eat an apple every day."
+        with patch.object(self.service, '_request_openai_json',
+                          AsyncMock(return_value=word_data)) as mock_request:
+            first = asyncio.run(self.service.generate_word_info("apple"))
+            second = asyncio.run(self.service.generate_word_info(" Apple "))
+
+        self.assertEqual(mock_request.await_count, 1)
+        self.assertIs(first, second)
+
+    def test_low_confidence_result_is_not_cached(self):
+        """Test that weak results are requested again."""
+        with patch.object(self.service, '_request_openai_json',
+                          AsyncMock(return_value={"chinese_meaning": ""})) as mock_request:
+            asyncio.run(self.service.generate_word_info("apple"))
+            asyncio.run(self.service.generate_word_info("apple"))
+
+        self.assertEqual(mock_request.await_count, 2)
+
+    def test_concurrent_requests_for_one_word_are_coalesced(self):
+        """Test that simultaneous calls for the same word share one request."""
+        async def slow_response(prompt, max_tokens):
+            await asyncio.sleep(0.01)
+            return {"chinese_meaning": ""}
+
+        async def run():
+            return await asyncio.gather(*(self.service.generate_word_info("apple") for _ in range(3)))
+
+        with patch.object(self.service, '_request_openai_json',
+                          AsyncMock(side_effect=slow_response)) as mock_request:
+            results = asyncio.run(run())
+
+        self.assertEqual(mock_request.await_count, 1)
+        self.assertIs(results[0], results[2])
+        self.assertEqual(self.service._inflight, {})
+
+
+class TestProviderRequests(unittest.TestCase):
+    """Test cases for parsing provider responses."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.service = AIWordService()
+        patcher = patch('services.ai_word_service.api_config')
+        self.mock_config = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _session_returning(self, status, body):
+        """Build a fake session whose post() answers with one response."""
+        response = MagicMock()
+        response.status = status
+        response.read = AsyncMock(return_value=body)
+        session = MagicMock()
+        session.post.return_value.__aenter__.return_value = response
+        return session
+
+    def test_openai_response_is_parsed(self):
+        """Test that the message content of an OpenAI response is decoded."""
+        self.mock_config.get_openai_api_key.return_value = "sk-" + "a" * 48
+        body = json.dumps({
+            "choices": [{"message": {"content": json.dumps({"chinese_meaning": "蘋果"})}}]
+        }).encode('utf-8')
+        session = self._session_returning(200, body)
+
+        with patch.object(self.service, '_get_session', AsyncMock(return_value=session)):
+            data = asyncio.run(self.service._request_openai_json("prompt", 500))
+
+        self.assertEqual(data, {"chinese_meaning": "蘋果"})
+
+    def test_gemini_response_is_parsed(self):
+        """Test that the candidate text of a Gemini response is decoded."""
+        self.mock_config.get_gemini_api_key.return_value = "AIzaSy" + "a" * 33
+        body = json.dumps({
+            "candidates": [{"content": {"parts": [{"text": '{"chinese_meaning": "香蕉"}'}]}}]
+        }).encode('utf-8')
+        session = self._session_returning(200, body)
+
+        with patch.object(self.service, '_get_session', AsyncMock(return_value=session)):
+            data = asyncio.run(self.service._request_gemini_json("prompt", 500))
+
+        self.assertEqual(data, {"chinese_meaning": "香蕉"})
+
+    def test_error_statuses_are_reported(self):
+        """Test provider-specific and 400 error messages."""
+        self.mock_config.get_gemini_api_key.return_value = "AIzaSy" + "a" * 33
+        for status, body, expected in [
+            (403, b"", "Gemini API Key 無效或無權限"),
+            (400, b'{"error": {"message": "bad field"}}', "Gemini API 請求錯誤: bad field"),
+            (400, b"not json", "Gemini API 請求錯誤: 請求格式錯誤"),
+        ]:
+            session = self._session_returning(status, body)
+            with patch.object(self.service, '_get_session', AsyncMock(return_value=session)):
+                with self.assertRaises(Exception) as ctx:
+                    asyncio.run(self.service._request_gemini_json("prompt", 500))
+            self.assertEqual(str(ctx.exception), expected)
+            self.assertEqual(session.post.call_count, 1)
+
+    def test_only_connection_failures_are_retried(self):
+        """Test that dropped connections are retried and other client errors are not."""
+        self.mock_config.get_openai_api_key.return_value = "sk-" + "a" * 48
+        body = json.dumps({
+            "choices": [{"message": {"content": '{"chinese_meaning": "蘋果"}'}}]
+        }).encode('utf-8')
+        session = self._session_returning(200, body)
+        ok = session.post.return_value
+        session.post.side_effect = [aiohttp.ServerDisconnectedError(), ok]
+
+        with patch.object(self.service, '_get_session', AsyncMock(return_value=session)), \
+                patch('services.ai_word_service.asyncio.sleep', AsyncMock()):
+            data = asyncio.run(self.service._request_openai_json("prompt", 500))
+        self.assertEqual(data, {"chinese_meaning": "蘋果"})
+
+        session.post.reset_mock()
+        session.post.side_effect = aiohttp.InvalidURL("bad")
+        with patch.object(self.service, '_get_session', AsyncMock(return_value=session)):
+            with self.assertRaises(Exception):
+                asyncio.run(self.service._request_openai_json("prompt", 500))
+        self.assertEqual(session.post.call_count, 1)
+
+
+class TestRetryDelay(unittest.TestCase):
+    """Test cases for the rate-limit retry delay."""
+
+    def test_retry_after_seconds(self):
+        """Test that a numeric Retry-After header is honoured."""
+        self.assertEqual(_retry_delay({"Retry-After": "7"}, 0), 7.0)
+
+    def test_openai_reset_headers(self):
+        """Test that OpenAI reset durations are used when Retry-After is missing."""
+        headers = {"x-ratelimit-reset-requests": "1m30s", "x-ratelimit-reset-tokens": "250ms"}
+        self.assertEqual(_retry_delay(headers, 0), 60.0)  # 90s capped
+        self.assertEqual(_retry_delay({"x-ratelimit-reset-tokens": "250ms"}, 0), 0.25)
+
+    def test_fallback_to_exponential_backoff(self):
+        """Test backoff when no usable header is present."""
+        self.assertEqual(_retry_delay({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 2), 4)
+        self.assertEqual(_retry_delay({}, 1), 2)
+
+
+class TestConfidenceScore(unittest.TestCase):
+    """Test cases for AIWordService._calculate_confidence_score."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.service = AIWordService()
+
+    def test_scores(self):
+        """Test scores for complete, partial, doubtful and empty responses."""
+        complete = {
+            "chinese_meaning": "蘋果",
+            "english_meaning": "a round fruit of a tree",
+            "phonetic": "/ˈæpəl/",
+            "example_sentence": "She ate a green apple at lunch.",
+            "synonyms": ["fruit", "pome"],
+            "antonyms": ["none"]
+        }
+        partial = {
+            "chinese_meaning": "蘋果",
+            "english_meaning": "a fruit",
+            "phonetic": "[apl]",
+            "example_sentence": "An apple a day keeps doctors away, they say, as an old and very long proverb goes.",
+            "synonyms": ["fruit"],
+            "antonyms": []
+        }
+        doubtful = {
+            "chinese_meaning": "未知",
+            "english_meaning": "unknown",
+            "phonetic": "ap",
+            "example_sentence": "",
+            "synonyms": [],
+            "antonyms": []
+        }
+
+        self.assertEqual(self.service._calculate_confidence_score(complete, "apple", "openai"), 1.0)
+        self.assertEqual(self.service._calculate_confidence_score(partial, "apple", "gemini"), 0.82)
+        self.assertEqual(self.service._calculate_confidence_score(doubtful, "apple", "gemini"), 0.359)
+        self.assertEqual(self.service._calculate_confidence_score({}, "apple", "other"), 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
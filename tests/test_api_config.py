@@ -6,31 +6,43 @@ import unittest
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import patch
 from config.api_config import APIConfigManager
 
 
 class TestAPIConfigManager(unittest.TestCase):
     """Test cases for APIConfigManager."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temporary directory for test config
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = os.path.join(self.temp_dir, "test_api_keys.json")
-        self.config_manager = APIConfigManager(self.config_file)
-
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        """Set up one temporary directory and config manager for the class."""
+        # Creating the manager writes the encryption key and derives the
+        # cipher, so do it once and reset its settings between tests
+        # Keep the config writes in RAM where a tmpfs is available
+        base_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        cls._temp_dir = tempfile.TemporaryDirectory(dir=base_dir)
+        cls.temp_dir = cls._temp_dir.name
+        cls.config_file = os.path.join(cls.temp_dir, "test_api_keys.json")
+        cls.config_manager = APIConfigManager(cls.config_file)
+
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
-        # Clean up temporary files
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        cls._temp_dir.cleanup()
+
+    def setUp(self):
+        """Reset the shared config manager to the default settings."""
+        self.config_manager.config = APIConfigManager._default_config()
+        self.config_manager._invalidate_ssl_cache()
+        self.config_manager._save_config()
 
     def test_initial_config_creation(self):
         """Test initial configuration creation."""
-        # Config should be created with default values
-        self.assertFalse(self.config_manager.is_openai_enabled())
-        self.assertFalse(self.config_manager.is_gemini_enabled())
-        self.assertEqual(self.config_manager.get_default_provider(), "openai")
+        # A manager on a new file should be created with default values
+        config_manager = APIConfigManager(os.path.join(self.temp_dir, "fresh_api_keys.json"))
+        self.assertFalse(config_manager.is_openai_enabled())
+        self.assertFalse(config_manager.is_gemini_enabled())
+        self.assertEqual(config_manager.get_default_provider(), "openai")
 
     def test_openai_api_key_management(self):
         """Test OpenAI API key management."""
@@ -49,6 +61,26 @@ class TestAPIConfigManager(unittest.TestCase):
         stored_key = raw_config["openai"]["api_key"]
         self.assertNotEqual(stored_key, test_key)  # Should be encrypted
 
+    def test_unchanged_key_is_not_encrypted_again(self):
+        """Test that decrypted keys are reused and re-setting a key keeps its ciphertext."""
+        test_key = "sk-" + "a" * 48
+        self.config_manager.set_openai_api_key(test_key)
+        stored_key = self.config_manager.config["openai"]["api_key"]
+
+        with patch.object(self.config_manager, '_decrypt_value') as mock_decrypt, \
+                patch.object(self.config_manager, '_encrypt_value') as mock_encrypt:
+            self.assertEqual(self.config_manager.get_openai_api_key(), test_key)
+            self.config_manager.set_openai_api_key(test_key)
+
+        mock_decrypt.assert_not_called()
+        mock_encrypt.assert_not_called()
+        self.assertEqual(self.config_manager.config["openai"]["api_key"], stored_key)
+
+        # A new key is encrypted as usual
+        self.config_manager.set_openai_api_key("sk-" + "b" * 48)
+        self.assertNotEqual(self.config_manager.config["openai"]["api_key"], stored_key)
+        self.assertEqual(self.config_manager.get_openai_api_key(), "sk-" + "b" * 48)
+
     def test_gemini_api_key_management(self):
         """Test Gemini API key management."""
         test_key = "AIzaSyTest123456789"
@@ -116,6 +148,13 @@ class TestAPIConfigManager(unittest.TestCase):
         self.config_manager.set_max_retries(-1)  # Too low
         self.assertEqual(self.config_manager.get_max_retries(), 0)  # Should be minimum
 
+        # Test concurrency bounds
+        self.assertEqual(self.config_manager.get_max_concurrency(), 3)
+        self.config_manager.set_max_concurrency(50)  # Too high
+        self.assertEqual(self.config_manager.get_max_concurrency(), 10)  # Should be capped
+        self.config_manager.set_max_concurrency(0)  # Too low
+        self.assertEqual(self.config_manager.get_max_concurrency(), 1)  # Should be minimum
+
     def test_api_key_validation(self):
         """Test API key validation."""
         # Test valid OpenAI key (51 characters)
@@ -169,6 +208,10 @@ class TestAPIConfigManager(unittest.TestCase):
         self.assertIn("openai", providers)
         self.assertIn("gemini", providers)
 
+        # Clearing a key refreshes the cached result
+        self.config_manager.clear_api_key("openai")
+        self.assertEqual(self.config_manager.get_available_providers(), ["gemini"])
+
     def test_clear_api_keys(self):
         """Test clearing API keys."""
         # Set keys
@@ -218,6 +261,58 @@ class TestAPIConfigManager(unittest.TestCase):
         # Check settings
         self.assertEqual(len(status["settings"]["available_providers"]), 2)
 
+    def test_status_summary_refreshes_after_change(self):
+        """Test that the memoized status summary is cleared by setters."""
+        self.assertFalse(self.config_manager.get_status_summary()["openai"]["valid"])
+
+        self.config_manager.set_openai_api_key("sk-" + "a" * 48)
+        self.config_manager.set_timeout(60)
+
+        status = self.config_manager.get_status_summary()
+        self.assertTrue(status["openai"]["valid"])
+        self.assertEqual(status["settings"]["timeout"], 60)
+
+    def test_status_summary_is_a_fresh_copy(self):
+        """Test that changing a returned summary does not affect later calls."""
+        status = self.config_manager.get_status_summary()
+        status["server"]["cert_exists"] = "changed"
+        status["settings"]["available_providers"].append("changed")
+
+        fresh = self.config_manager.get_status_summary()
+        self.assertIsNot(fresh, status)
+        self.assertIsNot(fresh["server"], status["server"])
+        self.assertNotEqual(fresh["server"]["cert_exists"], "changed")
+        self.assertNotIn("changed", fresh["settings"]["available_providers"])
+
+    def test_new_certificate_is_seen_immediately(self):
+        """Test that certificate files created after a failed check are found at once."""
+        cert_file = os.path.join(self.temp_dir, "new_cert.pem")
+        key_file = os.path.join(self.temp_dir, "new_key.pem")
+        self.config_manager.set_cert_file(cert_file)
+        self.config_manager.set_key_file(key_file)
+        self.assertFalse(self.config_manager.validate_ssl_certificates()["cert_exists"])
+
+        for path in (cert_file, key_file):
+            Path(path).touch()
+        self.addCleanup(os.remove, cert_file)
+        self.addCleanup(os.remove, key_file)
+
+        validation = self.config_manager.validate_ssl_certificates()
+        self.assertTrue(validation["cert_exists"])
+        self.assertTrue(validation["key_exists"])
+
+    def test_snapshot(self):
+        """Test reading general settings through snapshot."""
+        self.config_manager.set_openai_api_key("sk-" + "a" * 48)
+        self.config_manager.set_timeout(45)
+
+        snap = self.config_manager.snapshot()
+
+        self.assertEqual(snap["timeout"], 45)
+        self.assertEqual(snap["max_retries"], self.config_manager.get_max_retries())
+        self.assertEqual(snap["default_provider"], self.config_manager.get_default_provider())
+        self.assertEqual(snap["available_providers"], ["openai"])
+
     def test_export_config(self):
         """Test configuration export."""
         # Set up configuration
@@ -247,6 +342,51 @@ class TestAPIConfigManager(unittest.TestCase):
         self.assertEqual(new_manager.get_default_provider(), "openai")
         self.assertTrue(new_manager.is_openai_enabled())
 
+    def test_batch_writes_once_on_exit(self):
+        """Test that setters inside batch() are saved together when it exits."""
+        with self.config_manager.batch():
+            self.config_manager.set_timeout(60)
+            with self.config_manager.batch():
+                self.config_manager.set_max_retries(5)
+            self.assertEqual(self.config_manager.get_max_retries(), 5)
+
+            # Nothing is written while the outer block is open
+            self.assertEqual(APIConfigManager(self.config_file).get_timeout(), 30)
+
+        reloaded = APIConfigManager(self.config_file)
+        self.assertEqual(reloaded.get_timeout(), 60)
+        self.assertEqual(reloaded.get_max_retries(), 5)
+
+    def test_legacy_fernet_values_still_decrypt(self):
+        """Test that values encrypted by the old Fernet scheme are readable."""
+        import base64
+        from cryptography.fernet import Fernet
+
+        fernet = Fernet(self.config_manager._get_encryption_key())
+        legacy_value = base64.b64encode(fernet.encrypt(b"sk-legacy-key")).decode()
+
+        self.assertEqual(self.config_manager._decrypt_value(legacy_value), "sk-legacy-key")
+        self.assertEqual(self.config_manager._decrypt_value("not-encrypted"), "")
+
+    def test_partial_config_is_normalized(self):
+        """Test loading a config file with missing sections and keys."""
+        config_file = os.path.join(self.temp_dir, "partial_api_keys.json")
+        with open(config_file, 'w', encoding='utf-8') as f:
+            f.write('{"openai": {"model": "gpt-4"}, "settings": {"timeout": 60}}')
+
+        manager = APIConfigManager(config_file)
+
+        # Existing values are kept
+        self.assertEqual(manager.get_openai_model(), "gpt-4")
+        self.assertEqual(manager.get_timeout(), 60)
+
+        # Missing keys and sections fall back to defaults
+        self.assertFalse(manager.is_openai_enabled())
+        self.assertEqual(manager.get_max_retries(), 3)
+        self.assertEqual(manager.get_gemini_model(), "gemini-2.5-flash-pro")
+        self.assertEqual(manager.get_server_port(), 8080)
+        self.assertFalse(manager.is_passcode_configured())
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
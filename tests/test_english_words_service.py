@@ -0,0 +1,59 @@
+"""
+Unit tests for the English words suggestion service.
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+
+from services.english_words_service import EnglishWordsService
+
+
+class TestEnglishWordsService(unittest.TestCase):
+    """Test cases for EnglishWordsService."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.words_file = os.path.join(self.temp_dir, "words.txt")
+        with open(self.words_file, 'w', encoding='utf-8') as f:
+            f.write("apple\napply\nApricot\nbanana\nband\nbandana\nbe\n\n")
+        self.service = EnglishWordsService(self.words_file)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_get_suggestions(self):
+        """Test prefix suggestions come back sorted and limited."""
+        words = [s['word'] for s in self.service.get_suggestions("ban")]
+        self.assertEqual(words, ["banana", "band", "bandana"])
+
+        words = [s['word'] for s in self.service.get_suggestions("AP", limit=2)]
+        self.assertEqual(words, ["apple", "apply"])
+
+        self.assertEqual(self.service.get_suggestions("a"), [])
+        self.assertEqual(self.service.get_suggestions("zz"), [])
+
+    def test_is_valid_word(self):
+        """Test exact dictionary lookups."""
+        self.assertTrue(self.service.is_valid_word("apricot"))
+        self.assertTrue(self.service.is_valid_word("Band"))
+        self.assertFalse(self.service.is_valid_word("ban"))
+        self.assertFalse(self.service.is_valid_word("zebra"))
+        self.assertFalse(self.service.is_valid_word(""))
+
+    def test_get_word_count(self):
+        """Test the number of loaded words."""
+        self.assertEqual(self.service.get_word_count(), 7)
+
+    def test_missing_file(self):
+        """Test that a missing words file yields no suggestions."""
+        service = EnglishWordsService(os.path.join(self.temp_dir, "missing.txt"))
+        self.assertEqual(service.get_suggestions("ap"), [])
+        self.assertFalse(service.is_valid_word("apple"))
+
+
+if __name__ == '__main__':
+    unittest.main()
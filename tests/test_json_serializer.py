@@ -2,6 +2,7 @@
 Unit tests for JSON serialization functionality.
 """
 
+import io
 import unittest
 import json
 from datetime import datetime
@@ -65,6 +66,17 @@ class TestVocabularyJSONSerializer(unittest.TestCase):
         self.assertIn("created_date", data)
         self.assertIn("updated_date", data)
 
+    def test_serialize_word_follows_updates(self):
+        """Test that cached compact output is refreshed after update_fields."""
+        first = VocabularyJSONSerializer.serialize_word(self.test_word)
+        self.test_word.update_fields(chinese_meaning="範例")
+        second = VocabularyJSONSerializer.serialize_word(self.test_word)
+
+        self.assertEqual(json.loads(first)["chinese_meaning"], "例子")
+        self.assertEqual(json.loads(second)["chinese_meaning"], "範例")
+        self.assertEqual(json.loads(VocabularyJSONSerializer.serialize_word_list([self.test_word]))[0],
+                         json.loads(second))
+
     def test_deserialize_word(self):
         """Test deserializing a Word object."""
         json_str = VocabularyJSONSerializer.serialize_word(self.test_word)
@@ -107,6 +119,15 @@ class TestVocabularyJSONSerializer(unittest.TestCase):
         self.assertEqual(data["vocabulary"][0]["word"], "example")
         self.assertEqual(data["metadata"]["total_words"], 1)
 
+    def test_dump_vocabulary_data(self):
+        """Test streaming VocabularyData to a binary file."""
+        buffer = io.BytesIO()
+        VocabularyJSONSerializer.dump_vocabulary_data(self.vocab_data, buffer)
+
+        data = json.loads(buffer.getvalue().decode('utf-8'))
+
+        self.assertEqual(data, json.loads(VocabularyJSONSerializer.serialize_vocabulary_data(self.vocab_data)))
+
     def test_deserialize_vocabulary_data(self):
         """Test deserializing VocabularyData object."""
         json_str = VocabularyJSONSerializer.serialize_vocabulary_data(self.vocab_data)
@@ -123,6 +144,16 @@ class TestVocabularyJSONSerializer(unittest.TestCase):
         with self.assertRaises(json.JSONDecodeError):
             VocabularyJSONSerializer.deserialize_vocabulary_data(invalid_json)
 
+    def test_invalid_json_message_is_prefixed_once(self):
+        """Test that every deserializer reports a single "Invalid JSON format" prefix."""
+        for deserialize in (VocabularyJSONSerializer.deserialize_word,
+                            VocabularyJSONSerializer.deserialize_vocabulary_data,
+                            VocabularyJSONSerializer.deserialize_word_list):
+            with self.subTest(deserialize=deserialize.__name__):
+                with self.assertRaises(json.JSONDecodeError) as ctx:
+                    deserialize("{ invalid json }")
+                self.assertEqual(str(ctx.exception).count("Invalid JSON format"), 1)
+
     def test_serialize_word_list(self):
         """Test serializing a list of Word objects."""
         word2 = Word(word="test", chinese_meaning="測試")
@@ -303,6 +334,15 @@ class TestVocabularyJSONSerializer(unittest.TestCase):
 
         self.assertIn("Unknown expected_type", str(context.exception))
 
+    def test_validate_and_parse_returns_data(self):
+        """Test that validate_and_parse returns the parsed object."""
+        json_str = VocabularyJSONSerializer.serialize_vocabulary_data(self.vocab_data)
+
+        data = VocabularyJSONSerializer.validate_and_parse(json_str, "vocabulary")
+
+        self.assertIsInstance(data, dict)
+        self.assertEqual(data["vocabulary"][0]["word"], "example")
+
     def test_chinese_characters_preservation(self):
         """Test that Chinese characters are properly preserved in serialization."""
         word_with_chinese = Word(
@@ -0,0 +1,45 @@
+"""
+Unit tests for the shared background event loop.
+"""
+
+import asyncio
+import unittest
+from services.loop_thread import get_loop, run_coro_sync
+
+
+class TestLoopThread(unittest.TestCase):
+    """Test cases for run_coro_sync."""
+
+    def test_runs_coroutines_on_one_loop(self):
+        """Test that results are returned and every call uses the same loop."""
+        async def current_loop():
+            await asyncio.sleep(0)
+            return asyncio.get_running_loop()
+
+        first = run_coro_sync(current_loop())
+        second = run_coro_sync(current_loop())
+
+        self.assertIs(first, second)
+        self.assertIs(first, get_loop())
+
+    def test_propagates_exceptions(self):
+        """Test that exceptions raised by the coroutine reach the caller."""
+        async def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            run_coro_sync(fail())
+
+    def test_rejects_calls_from_the_loop_itself(self):
+        """Test that waiting on the loop from inside it is refused instead of deadlocking."""
+        async def nested():
+            async def inner():
+                return 1
+            run_coro_sync(inner())
+
+        with self.assertRaises(RuntimeError):
+            run_coro_sync(nested())
+
+
+if __name__ == '__main__':
+    unittest.main()
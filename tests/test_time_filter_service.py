@@ -14,17 +14,18 @@ from models.vocabulary import Word
 class TestTimeFilterService(unittest.TestCase):
     """Test cases for time filter functionality in VocabularyService."""
 
-    def setUp(self):
-        """Set up test environment."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up one service shared by the tests, which only read from it."""
         # Create temporary file for testing
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
+        cls.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
+        cls.temp_file.close()
 
-        self.service = VocabularyService(self.temp_file.name)
+        cls.service = VocabularyService(cls.temp_file.name)
 
         # Create test words with different dates
         now = datetime.now()
-        self.test_words = []
+        cls.test_words = []
 
         # Create words and manually set their created_date
         word_data = [
@@ -43,16 +44,18 @@ class TestTimeFilterService(unittest.TestCase):
             )
             # Manually set the created_date
             w.created_date = now - timedelta(days=days_ago)
-            self.test_words.append(w)
+            cls.test_words.append(w)
 
-        # Add test words to service
-        for word in self.test_words:
-            self.service.add_word(word)
+        # Add test words to service with a single log append
+        result = cls.service.add_words_batch(cls.test_words)
+        assert result['success_count'] == len(cls.test_words), result
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test environment."""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        for path in (cls.temp_file.name, cls.service.wal_file_path):
+            if os.path.exists(path):
+                os.unlink(path)
 
     def test_get_words_by_time_filter_recent_3_days(self):
         """Test filtering words from recent 3 days."""
@@ -158,6 +161,21 @@ class TestTimeFilterService(unittest.TestCase):
         # Check total words count
         self.assertEqual(stats['total_words'], len(self.test_words))
 
+    def test_learning_progress_buckets(self):
+        """Test daily and weekly bucket counts."""
+        stats = self.service.get_learning_progress_stats()
+        now = datetime.now()
+
+        self.assertEqual(len(stats['daily_stats']), 30)
+        self.assertEqual(stats['daily_stats'][(now - timedelta(days=1)).strftime('%Y-%m-%d')], 1)
+        self.assertEqual(stats['daily_stats'][(now - timedelta(days=5)).strftime('%Y-%m-%d')], 1)
+        self.assertEqual(sum(stats['daily_stats'].values()), 3)
+
+        self.assertEqual(stats['weekly_stats']['Week 1'], 2)
+        self.assertEqual(stats['weekly_stats']['Week 3'], 1)
+        self.assertEqual(stats['weekly_stats']['Week 7'], 1)
+        self.assertEqual(sum(stats['weekly_stats'].values()), 4)
+
     def test_get_time_filter_label(self):
         """Test getting time filter labels."""
         self.assertEqual(VocabularyService.get_time_filter_label('recent_3_days'), '近三天')
@@ -0,0 +1,111 @@
+"""
+Unit tests for the vocabulary operation log.
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+
+from models.vocabulary import Word, VocabularyData
+from services import vocab_wal
+from services.vocabulary_service import VocabularyService
+
+
+class TestVocabWAL(unittest.TestCase):
+    """Test cases for the append-only operation log."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, "vocabulary.json")
+        self.wal_file = vocab_wal.wal_path_for(self.data_file)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_replay_add_update_remove(self):
+        """Test replaying add, update and remove operations."""
+        word1 = Word(word="alpha", chinese_meaning="甲")
+        word2 = Word(word="beta", chinese_meaning="乙")
+        vocab_wal.append_ops(self.wal_file, [
+            vocab_wal.make_op(vocab_wal.OP_ADD, word=word1),
+            vocab_wal.make_op(vocab_wal.OP_ADD, word=word2)
+        ])
+        word1.update_fields(chinese_meaning="甲甲")
+        vocab_wal.append_ops(self.wal_file, [vocab_wal.make_op(vocab_wal.OP_UPDATE, word=word1)])
+        vocab_wal.append_ops(self.wal_file, [vocab_wal.make_op(vocab_wal.OP_REMOVE, word_id=word2.id)])
+
+        vocab_data = VocabularyData()
+        count = vocab_wal.replay(vocab_data, self.wal_file)
+
+        self.assertEqual(count, 4)
+        self.assertEqual(len(vocab_data.vocabulary), 1)
+        self.assertEqual(vocab_data.vocabulary[0].chinese_meaning, "甲甲")
+
+    def test_replay_is_idempotent(self):
+        """Test that replaying an add twice does not duplicate the word."""
+        word = Word(word="alpha", chinese_meaning="甲")
+        op = vocab_wal.make_op(vocab_wal.OP_ADD, word=word)
+        vocab_wal.append_ops(self.wal_file, [op, op])
+
+        vocab_data = VocabularyData()
+        vocab_wal.replay(vocab_data, self.wal_file)
+
+        self.assertEqual(len(vocab_data.vocabulary), 1)
+
+    def test_replay_without_last_updated(self):
+        """Test replaying onto metadata that has no last_updated entry."""
+        vocab_wal.append_ops(self.wal_file, [vocab_wal.make_op(vocab_wal.OP_REMOVE, word_id="missing")])
+        vocab_data = VocabularyData()
+        vocab_data.metadata = {"total_words": 0}
+
+        vocab_wal.replay(vocab_data, self.wal_file)
+
+        self.assertIn("last_updated", vocab_data.metadata)
+
+    def test_torn_last_line_is_ignored(self):
+        """Test that a partially written final entry is skipped."""
+        word = Word(word="alpha", chinese_meaning="甲")
+        vocab_wal.append_ops(self.wal_file, [vocab_wal.make_op(vocab_wal.OP_ADD, word=word)])
+        with open(self.wal_file, 'ab') as f:
+            f.write(b'{"op":"add","word":{"wo')
+
+        ops = vocab_wal.read_ops(self.wal_file)
+
+        self.assertEqual(len(ops), 1)
+
+    def test_append_after_torn_line_survives_reloads(self):
+        """Test that entries appended after a torn line are not lost or merged."""
+        service = VocabularyService(self.data_file)
+        service.add_word(Word(word="alpha", chinese_meaning="甲"))
+        with open(self.wal_file, 'ab') as f:
+            f.write(b'{"op":"add","word":{"wo')
+
+        VocabularyService(self.data_file).add_word(Word(word="beta", chinese_meaning="乙"))
+        words = [w.word for w in VocabularyService(self.data_file).get_all_words()]
+        self.assertEqual(words, ["alpha", "beta"])
+
+        VocabularyService(self.data_file).add_word(Word(word="gamma", chinese_meaning="丙"))
+        words = [w.word for w in VocabularyService(self.data_file).get_all_words()]
+        self.assertEqual(words, ["alpha", "beta", "gamma"])
+
+    def test_service_persists_through_log_and_compaction(self):
+        """Test that service mutations survive reload before and after compaction."""
+        service = VocabularyService(self.data_file)
+        word = service.add_word(Word(word="alpha", chinese_meaning="甲"))
+        service.update_word(word.id, english_meaning="first letter")
+
+        reloaded = VocabularyService(self.data_file).get_word_by_id(word.id)
+        self.assertEqual(reloaded.english_meaning, "first letter")
+
+        service.compact()
+        self.assertEqual(os.path.getsize(self.wal_file), 0)
+
+        reloaded = VocabularyService(self.data_file).get_word_by_id(word.id)
+        self.assertEqual(reloaded.english_meaning, "first letter")
+
+
+if __name__ == '__main__':
+    unittest.main()
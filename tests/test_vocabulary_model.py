@@ -3,24 +3,78 @@ Unit tests for the vocabulary model classes.
 """
 
 import unittest
-from datetime import datetime
+import uuid
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from unittest.mock import patch
 from models.vocabulary import Word, VocabularyData
 
+# Inputs one character past the Word length limits
+_LONG_WORD = "a" * 101
+_LONG_MEANING = "測" * 201
+
+# Expected repr of the example word, filled in with its generated ID
+_REPR_TEMPLATE = "Word(id='{id}', word='example', chinese_meaning='例子')"
+
+# Read-only stored entries for the from_dict tests
+_WORD_DICT_FIXTURE = MappingProxyType({
+    "id": "test_id_001",
+    "word": "example",
+    "chinese_meaning": "例子",
+    "english_meaning": "a thing characteristic of its kind",
+    "phonetic": "/ɪɡˈzæmpəl/",
+    "example_sentence": "This is an example sentence.",
+    "synonyms": ("instance", "case", "illustration"),
+    "antonyms": ("exception",),
+    "created_date": "2025-01-15T10:30:00",
+    "updated_date": "2025-01-15T10:30:00"
+})
+
+_VOCAB_DICT_FIXTURE = MappingProxyType({
+    "vocabulary": (
+        MappingProxyType({
+            "id": "test_id",
+            "word": "example",
+            "chinese_meaning": "例子",
+            "english_meaning": "",
+            "phonetic": "",
+            "example_sentence": "",
+            "synonyms": (),
+            "antonyms": (),
+            "created_date": "2025-01-15T10:30:00",
+            "updated_date": "2025-01-15T10:30:00"
+        }),
+    ),
+    "metadata": MappingProxyType({
+        "total_words": 1,
+        "last_updated": "2025-01-15T10:30:00"
+    })
+})
+
 
 class TestWordModel(unittest.TestCase):
     """Test cases for the Word model."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.valid_word_data = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only test fixtures shared by every test."""
+        cls.valid_word_data = MappingProxyType({
             "word": "example",
             "chinese_meaning": "例子",
             "english_meaning": "a thing characteristic of its kind",
             "phonetic": "/ɪɡˈzæmpəl/",
             "example_sentence": "This is an example sentence.",
-            "synonyms": ["instance", "case", "illustration"],
-            "antonyms": ["exception"]
-        }
+            "synonyms": ("instance", "case", "illustration"),
+            "antonyms": ("exception",)
+        })
+        # Built once for the tests that only read it
+        cls.canonical_word = cls._make_valid_word()
+
+    @classmethod
+    def _make_valid_word(cls):
+        """Build a fresh Word from the shared data, with its own lists."""
+        data = cls.valid_word_data
+        return Word(**{**data, "synonyms": list(data["synonyms"]), "antonyms": list(data["antonyms"])})
 
     def test_word_creation_with_required_fields(self):
         """Test creating a word with only required fields."""
@@ -42,15 +96,22 @@ class TestWordModel(unittest.TestCase):
 
     def test_word_creation_with_all_fields(self):
         """Test creating a word with all fields."""
-        word = Word(**self.valid_word_data)
+        word = self.canonical_word
 
         self.assertEqual(word.word, "example")
         self.assertEqual(word.chinese_meaning, "例子")
         self.assertEqual(word.english_meaning, "a thing characteristic of its kind")
         self.assertEqual(word.phonetic, "/ɪɡˈzæmpəl/")
         self.assertEqual(word.example_sentence, "This is an example sentence.")
-        self.assertEqual(word.synonyms, ["instance", "case", "illustration"])
-        self.assertEqual(word.antonyms, ["exception"])
+        self.assertListEqual(word.synonyms, ["instance", "case", "illustration"])
+        self.assertListEqual(word.antonyms, ["exception"])
+
+    def test_generated_ids_are_time_ordered(self):
+        """Test that generated IDs are version 7 UUIDs."""
+        word = Word(word="test", chinese_meaning="測試")
+
+        self.assertEqual(uuid.UUID(word.id).version, 7)
+        self.assertEqual(len(set(Word.bulk_new_ids(50))), 50)
 
     def test_word_creation_with_custom_id(self):
         """Test creating a word with custom ID."""
@@ -63,99 +124,77 @@ class TestWordModel(unittest.TestCase):
 
         self.assertEqual(word.id, custom_id)
 
-    def test_word_validation_success(self):
-        """Test successful word validation."""
-        word = Word(**self.valid_word_data)
-        errors = word.validate()
-
-        self.assertEqual(len(errors), 0)
-
-    def test_word_validation_empty_word(self):
-        """Test validation with empty word."""
-        word = Word(
-            word="",
-            chinese_meaning="測試"
+    def test_word_validation_cases(self):
+        """Test validation of valid, empty, overlong and doubly invalid fields."""
+        cases = (
+            (self.valid_word_data["word"], self.valid_word_data["chinese_meaning"], []),
+            ("", "測試", ["英文單字不能為空"]),
+            ("test", "", ["中文解釋不能為空"]),
+            (_LONG_WORD, "測試", ["英文單字長度不能超過100個字符"]),
+            ("test", _LONG_MEANING, ["中文解釋長度不能超過200個字符"]),
+            ("", "", ["英文單字不能為空", "中文解釋不能為空"]),
         )
-        errors = word.validate()
+        self.assertEqual(self.canonical_word.validate(), [])
+        for word_text, chinese_meaning, expected_errors in cases:
+            with self.subTest(word=word_text[:10], chinese_meaning=chinese_meaning[:10]):
+                word = Word(word=word_text, chinese_meaning=chinese_meaning)
+                self.assertEqual(word.validate(), expected_errors)
 
-        self.assertIn("英文單字不能為空", errors)
+    def test_word_to_dict(self):
+        """Test converting word to dictionary."""
+        word_dict = self.canonical_word.to_dict()
+        data = self.valid_word_data
+        expected = {**data, "synonyms": list(data["synonyms"]), "antonyms": list(data["antonyms"])}
+
+        word = self.canonical_word
+        self.assertEqual(word_dict.pop("id"), word.id)
+        self.assertEqual(word_dict.pop("created_date"), word.created_date.isoformat())
+        self.assertEqual(word_dict.pop("updated_date"), word.updated_date.isoformat())
+        self.assertDictEqual(word_dict, expected)
+
+    def test_word_to_dict_returns_independent_copy(self):
+        """Test that changing a to_dict result does not change the word."""
+        word = self._make_valid_word()
+        word_dict = word.to_dict()
+        word_dict["chinese_meaning"] = "changed"
+        word_dict["display"] = True
 
-    def test_word_validation_empty_chinese_meaning(self):
-        """Test validation with empty Chinese meaning."""
-        word = Word(
-            word="test",
-            chinese_meaning=""
-        )
-        errors = word.validate()
+        self.assertEqual(word.to_dict()["chinese_meaning"], "例子")
+        self.assertNotIn("display", word.to_dict())
+        self.assertNotIn(b"changed", word.to_json_bytes())
 
-        self.assertIn("中文解釋不能為空", errors)
+    def test_word_to_dict_reflects_updates(self):
+        """Test that to_dict output is refreshed after update_fields."""
+        word = self._make_valid_word()
+        word.to_dict()
 
-    def test_word_validation_word_too_long(self):
-        """Test validation with word too long."""
-        long_word = "a" * 101
-        word = Word(
-            word=long_word,
-            chinese_meaning="測試"
-        )
-        errors = word.validate()
+        word.update_fields(chinese_meaning="範例")
 
-        self.assertIn("英文單字長度不能超過100個字符", errors)
+        self.assertEqual(word.to_dict()["chinese_meaning"], "範例")
 
-    def test_word_validation_chinese_meaning_too_long(self):
-        """Test validation with Chinese meaning too long."""
-        long_meaning = "測" * 201
-        word = Word(
-            word="test",
-            chinese_meaning=long_meaning
-        )
-        errors = word.validate()
+    def test_word_to_json_bytes_reflects_updates(self):
+        """Test that cached JSON bytes are refreshed after update_fields."""
+        word = self._make_valid_word()
+        self.assertIs(word.to_json_bytes(), word.to_json_bytes())
 
-        self.assertIn("中文解釋長度不能超過200個字符", errors)
+        word.update_fields(phonetic="/new/")
 
-    def test_word_validation_multiple_errors(self):
-        """Test validation with multiple errors."""
-        word = Word(
-            word="",
-            chinese_meaning=""
-        )
-        errors = word.validate()
+        self.assertIn(b'"phonetic":"/new/"', word.to_json_bytes())
 
-        self.assertEqual(len(errors), 2)
-        self.assertIn("英文單字不能為空", errors)
-        self.assertIn("中文解釋不能為空", errors)
+    def test_word_search_text(self):
+        """Test that search text covers the searchable fields and follows updates."""
+        word = Word(word="Example", chinese_meaning="例子", english_meaning="A Sample")
+        self.assertIn("example", word.search_text())
+        self.assertIn("a sample", word.search_text())
+        self.assertNotIn("example例", word.search_text())
 
-    def test_word_to_dict(self):
-        """Test converting word to dictionary."""
-        word = Word(**self.valid_word_data)
-        word_dict = word.to_dict()
+        word.update_fields(chinese_meaning="範例")
 
-        self.assertEqual(word_dict["word"], "example")
-        self.assertEqual(word_dict["chinese_meaning"], "例子")
-        self.assertEqual(word_dict["english_meaning"], "a thing characteristic of its kind")
-        self.assertEqual(word_dict["phonetic"], "/ɪɡˈzæmpəl/")
-        self.assertEqual(word_dict["example_sentence"], "This is an example sentence.")
-        self.assertEqual(word_dict["synonyms"], ["instance", "case", "illustration"])
-        self.assertEqual(word_dict["antonyms"], ["exception"])
-        self.assertIn("id", word_dict)
-        self.assertIn("created_date", word_dict)
-        self.assertIn("updated_date", word_dict)
+        self.assertIn("範例", word.search_text())
 
     def test_word_from_dict(self):
         """Test creating word from dictionary."""
-        word_dict = {
-            "id": "test_id_001",
-            "word": "example",
-            "chinese_meaning": "例子",
-            "english_meaning": "a thing characteristic of its kind",
-            "phonetic": "/ɪɡˈzæmpəl/",
-            "example_sentence": "This is an example sentence.",
-            "synonyms": ["instance", "case", "illustration"],
-            "antonyms": ["exception"],
-            "created_date": "2025-01-15T10:30:00",
-            "updated_date": "2025-01-15T10:30:00"
-        }
-
-        word = Word.from_dict(word_dict)
+        word = Word.from_dict(_WORD_DICT_FIXTURE)
 
         self.assertEqual(word.id, "test_id_001")
         self.assertEqual(word.word, "example")
@@ -166,6 +205,13 @@ class TestWordModel(unittest.TestCase):
         self.assertEqual(word.synonyms, ["instance", "case", "illustration"])
         self.assertEqual(word.antonyms, ["exception"])
 
+    def test_word_from_dict_shares_repeated_synonyms(self):
+        """Test that equal synonyms loaded for different words are one object."""
+        first = Word.from_dict({"word": "easy", "chinese_meaning": "容易的", "synonyms": ["".join(["sim", "ple"])]})
+        second = Word.from_dict({"word": "plain", "chinese_meaning": "簡單的", "synonyms": ["".join(["simp", "le"])]})
+
+        self.assertIs(first.synonyms[0], second.synonyms[0])
+
     def test_word_from_dict_with_invalid_dates(self):
         """Test creating word from dictionary with invalid dates."""
         word_dict = {
@@ -183,21 +229,22 @@ class TestWordModel(unittest.TestCase):
 
     def test_word_update_fields(self):
         """Test updating word fields."""
-        word = Word(word="test", chinese_meaning="測試")
-        original_updated_date = word.updated_date
-
-        # Wait a moment to ensure different timestamp
-        import time
-        time.sleep(0.01)
-
-        word.update_fields(
-            english_meaning="new meaning",
-            phonetic="/test/"
-        )
+        created = datetime(2025, 1, 15, 10, 30)
+        updated = created + timedelta(seconds=1)
+
+        # Advance the model's clock instead of sleeping between the calls
+        with patch('models.vocabulary.datetime') as mock_datetime:
+            mock_datetime.now.side_effect = [created, updated]
+            word = Word(word="test", chinese_meaning="測試")
+            word.update_fields(
+                english_meaning="new meaning",
+                phonetic="/test/"
+            )
 
         self.assertEqual(word.english_meaning, "new meaning")
         self.assertEqual(word.phonetic, "/test/")
-        self.assertGreater(word.updated_date, original_updated_date)
+        self.assertEqual(word.created_date, created)
+        self.assertEqual(word.updated_date, updated)
 
     def test_word_str_representation(self):
         """Test string representation of word."""
@@ -209,8 +256,7 @@ class TestWordModel(unittest.TestCase):
         """Test repr representation of word."""
         word = Word(word="example", chinese_meaning="例子")
 
-        expected = f"Word(id='{word.id}', word='example', chinese_meaning='例子')"
-        self.assertEqual(repr(word), expected)
+        self.assertEqual(repr(word), _REPR_TEMPLATE.format(id=word.id))
 
     def test_word_strips_whitespace(self):
         """Test that word strips whitespace from string fields."""
@@ -253,6 +299,20 @@ class TestVocabularyData(unittest.TestCase):
         self.assertEqual(self.vocab_data.metadata["total_words"], 1)
         self.assertEqual(self.vocab_data.vocabulary[0], self.test_word)
 
+    def test_bulk_add(self):
+        """Test adding several words with a single metadata update."""
+        other_word = Word(word="Other", chinese_meaning="其他")
+
+        with patch.object(VocabularyData, 'update_metadata', autospec=True,
+                          side_effect=VocabularyData.update_metadata) as mock_update:
+            self.vocab_data.bulk_add([self.test_word, other_word])
+
+        self.assertEqual(mock_update.call_count, 1)
+        self.assertEqual(self.vocab_data.vocabulary, [self.test_word, other_word])
+        self.assertEqual(self.vocab_data.metadata["total_words"], 2)
+        self.assertEqual(self.vocab_data.find_word_by_id(other_word.id), other_word)
+        self.assertTrue(self.vocab_data.has_word("other"))
+
     def test_remove_word_success(self):
         """Test successfully removing a word."""
         self.vocab_data.add_word(self.test_word)
@@ -282,17 +342,73 @@ class TestVocabularyData(unittest.TestCase):
 
         self.assertIsNone(found_word)
 
+    def test_indexes_follow_replaced_list(self):
+        """Test that assigning a new list of the same length refreshes the indexes."""
+        self.vocab_data.add_word(self.test_word)
+        self.assertTrue(self.vocab_data.has_word("test"))
+        other_word = Word(word="other", chinese_meaning="其他")
+
+        self.vocab_data.vocabulary = [other_word]
+
+        self.assertIsNone(self.vocab_data.find_word_by_id(self.test_word.id))
+        self.assertEqual(self.vocab_data.find_word_by_id(other_word.id), other_word)
+        self.assertFalse(self.vocab_data.has_word("test"))
+        self.assertTrue(self.vocab_data.remove_word(other_word.id))
+        self.assertIsNone(self.vocab_data.find_word_by_id(other_word.id))
+
+    def test_duplicate_ids_resolve_to_first_entry(self):
+        """Test lookups and removals when two entries share an ID."""
+        first = Word(word="first", chinese_meaning="一", word_id="dup")
+        second = Word(word="second", chinese_meaning="二", word_id="dup")
+        self.vocab_data.bulk_add([first, second])
+
+        self.assertIs(self.vocab_data.find_word_by_id("dup"), first)
+        self.assertTrue(self.vocab_data.remove_word("dup"))
+        self.assertIs(self.vocab_data.find_word_by_id("dup"), second)
+        self.assertFalse(self.vocab_data.has_word("first"))
+        self.assertTrue(self.vocab_data.has_word("second"))
+
+    def test_reindex_after_id_change(self):
+        """Test that an ID changed through update_fields is picked up by reindex_word."""
+        self.vocab_data.add_word(self.test_word)
+        old_id = self.test_word.id
+
+        self.test_word.update_fields(id="renamed_id")
+        self.vocab_data.reindex_word(self.test_word)
+
+        self.assertIsNone(self.vocab_data.find_word_by_id(old_id))
+        self.assertIs(self.vocab_data.find_word_by_id("renamed_id"), self.test_word)
+        self.assertTrue(self.vocab_data.has_word("test"))
+
+    def test_has_word(self):
+        """Test case-insensitive word lookups through adds, renames and removals."""
+        self.vocab_data.add_word(self.test_word)
+        other_word = Word(word="Other", chinese_meaning="其他")
+        self.vocab_data.add_word(other_word)
+
+        self.assertTrue(self.vocab_data.has_word(self.test_word.word.upper()))
+        self.assertTrue(self.vocab_data.has_word("other"))
+
+        other_word.update_fields(word="another")
+        self.vocab_data.reindex_word(other_word)
+        self.assertFalse(self.vocab_data.has_word("other"))
+        self.assertTrue(self.vocab_data.has_word("Another"))
+
+        self.vocab_data.remove_word(other_word.id)
+        self.assertFalse(self.vocab_data.has_word("another"))
+
     def test_update_metadata(self):
         """Test updating metadata."""
         original_updated = self.vocab_data.metadata["last_updated"]
+        later = datetime.fromisoformat(original_updated) + timedelta(seconds=1)
 
-        # Wait a moment to ensure different timestamp
-        import time
-        time.sleep(0.01)
-
-        self.vocab_data.add_word(self.test_word)
+        # Advance the model's clock instead of sleeping before the update
+        with patch('models.vocabulary.datetime') as mock_datetime:
+            mock_datetime.now.return_value = later
+            self.vocab_data.add_word(self.test_word)
 
         self.assertEqual(self.vocab_data.metadata["total_words"], 1)
+        self.assertEqual(self.vocab_data.metadata["last_updated"], later.isoformat())
         self.assertGreater(self.vocab_data.metadata["last_updated"], original_updated)
 
     def test_to_dict(self):
@@ -307,34 +423,18 @@ class TestVocabularyData(unittest.TestCase):
 
     def test_from_dict(self):
         """Test creating vocabulary data from dictionary."""
-        vocab_dict = {
-            "vocabulary": [
-                {
-                    "id": "test_id",
-                    "word": "example",
-                    "chinese_meaning": "例子",
-                    "english_meaning": "",
-                    "phonetic": "",
-                    "example_sentence": "",
-                    "synonyms": [],
-                    "antonyms": [],
-                    "created_date": "2025-01-15T10:30:00",
-                    "updated_date": "2025-01-15T10:30:00"
-                }
-            ],
-            "metadata": {
-                "total_words": 1,
-                "last_updated": "2025-01-15T10:30:00"
-            }
-        }
-
-        vocab_data = VocabularyData.from_dict(vocab_dict)
+        vocab_data = VocabularyData.from_dict(_VOCAB_DICT_FIXTURE)
 
         self.assertEqual(len(vocab_data.vocabulary), 1)
         self.assertEqual(vocab_data.vocabulary[0].word, "example")
         self.assertEqual(vocab_data.vocabulary[0].chinese_meaning, "例子")
         self.assertEqual(vocab_data.metadata["total_words"], 1)
 
+        # Metadata is copied into a plain dict that later updates can write to
+        self.assertIs(type(vocab_data.metadata), dict)
+        vocab_data.update_metadata()
+        self.assertEqual(_VOCAB_DICT_FIXTURE["metadata"]["last_updated"], "2025-01-15T10:30:00")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+Unit tests for VocabularyService data loading and caching.
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+from unittest.mock import patch
+
+from models.vocabulary import Word
+from services.vocabulary_service import VocabularyService
+
+
+class TestVocabularyCache(unittest.TestCase):
+    """Test cases for the in-memory vocabulary cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, "vocabulary.json")
+        self.service = VocabularyService(self.data_file)
+        self.service.add_word(Word(word="apple", chinese_meaning="蘋果"))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_reads_do_not_reparse_file(self):
+        """Test that unchanged files are served from memory."""
+        with patch.object(self.service, '_load_snapshot', wraps=self.service._load_snapshot) as mock_load:
+            self.service.get_all_words()
+            self.service.word_exists("apple")
+            self.service.search_words("app")
+
+        mock_load.assert_not_called()
+
+    def test_returned_word_list_does_not_alias_cache(self):
+        """Test that changing the list from get_all_words leaves the cache intact."""
+        words = self.service.get_all_words()
+        words.append(Word(word="banana", chinese_meaning="香蕉"))
+        words.clear()
+
+        self.assertEqual([w.word for w in self.service.get_all_words()], ["apple"])
+
+    def test_external_change_is_picked_up(self):
+        """Test that a write by another service instance invalidates the cache."""
+        other = VocabularyService(self.data_file)
+        other.add_word(Word(word="banana", chinese_meaning="香蕉"))
+
+        self.assertTrue(self.service.word_exists("banana"))
+        self.assertEqual(self.service.get_total_word_count(), 2)
+
+    def test_failed_update_does_not_leak_into_cache(self):
+        """Test that an update rejected by validation leaves the data unchanged."""
+        word_id = self.service.get_all_words()[0].id
+
+        with self.assertRaises(ValueError):
+            self.service.update_word(word_id, chinese_meaning="")
+
+        self.assertEqual(self.service.get_word_by_id(word_id).chinese_meaning, "蘋果")
+
+    def test_compact_keeps_cache_valid(self):
+        """Test that compaction does not force a reload of its own writes."""
+        self.service.compact()
+
+        with patch.object(self.service, '_load_snapshot', wraps=self.service._load_snapshot) as mock_load:
+            self.assertEqual(self.service.get_total_word_count(), 1)
+
+        mock_load.assert_not_called()
+
+    def test_date_index_follows_changes(self):
+        """Test that time filtered results reflect later additions and deletions."""
+        self.assertEqual(len(self.service.get_words_by_time_filter('recent_week')), 1)
+
+        word = self.service.add_word(Word(word="banana", chinese_meaning="香蕉"))
+        words = self.service.get_words_by_time_filter('recent_week')
+        self.assertEqual([w.word for w in words], ["banana", "apple"])
+        self.assertEqual(self.service.get_time_filter_stats()['recent_week'], 2)
+
+        self.service.delete_word(word.id)
+        self.assertEqual(len(self.service.get_words_by_time_filter('all')), 1)
+
+    def test_failed_save_keeps_previous_snapshot(self):
+        """Test that a failed snapshot write leaves the old file and no temporary file."""
+        self.service.compact()
+        with open(self.data_file, 'rb') as f:
+            before = f.read()
+
+        with patch('services.vocabulary_service.VocabularyJSONSerializer.dump_vocabulary_data',
+                   side_effect=IOError("disk full")):
+            with self.assertRaises(IOError):
+                self.service.compact()
+
+        with open(self.data_file, 'rb') as f:
+            self.assertEqual(f.read(), before)
+        self.assertFalse(os.path.exists(self.data_file + '.tmp'))
+
+    def test_invalid_snapshot_raises_value_error(self):
+        """Test that a corrupt snapshot is reported as ValueError."""
+        with open(self.data_file, 'wb') as f:
+            f.write(b'{"vocabulary": [')
+
+        with self.assertRaises(ValueError):
+            VocabularyService(self.data_file).get_all_words()
+
+
+
+class TestAddWordsBatch(unittest.TestCase):
+    """Test cases for VocabularyService.add_words_batch."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.service = VocabularyService(os.path.join(self.temp_dir, "vocabulary.json"))
+        self.service.add_word(Word(word="apple", chinese_meaning="蘋果"))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_duplicates_within_and_across_batches(self):
+        """Test that stored words and repeats inside the batch are reported as duplicates."""
+        result = self.service.add_words_batch([
+            Word(word="Apple", chinese_meaning="蘋果"),
+            Word(word="banana", chinese_meaning="香蕉"),
+            Word(word="BANANA", chinese_meaning="香蕉"),
+            Word(word="", chinese_meaning="空"),
+            Word(word="cherry", chinese_meaning="櫻桃")
+        ])
+
+        self.assertEqual(result['success_count'], 2)
+        self.assertEqual(result['error_count'], 1)
+        self.assertEqual(result['duplicate_words'], ["Apple", "BANANA"])
+        self.assertEqual(self.service.get_total_word_count(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()